@@ -0,0 +1,73 @@
+""" Benchmark of connection pool
+Measure latency per request of urlopen and pooled keep-alive connection
+against local server.
+usage: python benchmarks/connection_pool.py [number of requests]
+"""
+
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import perf_counter
+from urllib.request import Request, urlopen
+
+from TenhouAPI.util.download import ConnectionPool
+
+
+BODY = b"<mjloggm ver=\"2.3\">" + b"<T0/>" * 2000 + b"</mjloggm>"
+
+
+class Handler(BaseHTTPRequestHandler):
+    """ Return fixed body over keep-alive connection """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+        return
+
+    def log_message(self, *args):
+        return
+
+
+def urlopen_get(url: str) -> bytes:
+    """ Download by new connection per request """
+    with urlopen(Request(url, headers={"User-Agent": "Mozilla/5.0"})) as response:
+        return response.read()
+
+
+if __name__ == "__main__":
+
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/0/log/?2025100400gm-00a9-0000-00000000"
+
+    pool = ConnectionPool()
+    cases = (
+        ("urlopen", urlopen_get),
+        ("ConnectionPool", lambda url_: pool.get(url_, {"User-Agent": "Mozilla/5.0"})),
+    )
+
+    results = {}
+    for label, get in cases:
+        start = perf_counter()
+        for _ in range(requests):
+            get(url)
+            continue
+        results[label] = (perf_counter() - start) / requests
+        print(f"{label:15s}: {results[label] * 1e3:.3f} ms/request")
+        continue
+
+    print(f"saved          : {(results['urlopen'] - results['ConnectionPool']) * 1e3:.3f} ms/request")
+    print(pool)
+
+    pool.close()
+    server.shutdown()
+
+    ...
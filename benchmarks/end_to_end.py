@@ -0,0 +1,77 @@
+""" Benchmark of end-to-end downloads
+Download hour files and game logs from local tenhou stand-in through
+GameIdDirectory.download_range and GameLogDirectory.download_and_install_many,
+and measure game ids per second and game logs per second.
+usage: python benchmarks/end_to_end.py [hours] [logs] [latency] [error rate] [throttle rate] [workers]
+"""
+
+
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+
+from TenhouAPI.game_id.manager import GameIdDirectory
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.testing import TenhouStandIn
+from TenhouAPI.util.retry import RetryPolicy
+
+
+START = datetime(2025, 10, 4, 0)
+
+
+if __name__ == "__main__":
+
+    hours = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    logs = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    latency = float(sys.argv[3]) if len(sys.argv) > 3 else 0.02
+    error_rate = float(sys.argv[4]) if len(sys.argv) > 4 else 0.01
+    throttle_rate = float(sys.argv[5]) if len(sys.argv) > 5 else 0.01
+    workers = int(sys.argv[6]) if len(sys.argv) > 6 else 8
+
+    save_dir = tempfile.mkdtemp()
+    retry = RetryPolicy(attempts=8, base_delay=0.01, max_delay=0.1, seed=0)
+    try:
+        with TenhouStandIn(latency, error_rate, throttle_rate) as stand_in, \
+                open(os.devnull, "w") as devnull:
+            url_config = stand_in.url_config()
+
+            # game ids
+            id_directory = GameIdDirectory(os.path.join(save_dir, "game_ids"), url_config)
+            start = perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                id_report = id_directory.download_range(
+                    START, START + timedelta(hours=hours),
+                    workers=workers, rate=1e6, burst=workers, retry=retry,
+                )
+                game_ids = [
+                    game_id
+                    for file_name in sorted(id_report.installed)
+                    for game_id in id_directory.extract_game_ids_from_file(file_name)
+                ]
+            id_elapsed = perf_counter() - start
+
+            # game logs
+            log_directory = GameLogDirectory(os.path.join(save_dir, "game_logs"), url_config)
+            start = perf_counter()
+            with contextlib.redirect_stdout(devnull):
+                report = log_directory.download_and_install_many(
+                    game_ids[:logs], workers=workers, rate=1e6, burst=workers, retry=retry,
+                )
+            log_elapsed = perf_counter() - start
+
+            counts = stand_in.counts
+    finally:
+        shutil.rmtree(save_dir)
+
+    print(f"server: latency {latency * 1000:.0f} ms, error rate {error_rate}, throttle rate {throttle_rate}")
+    print(f"requests: {counts}")
+    print(f"game ids : {id_report.downloaded} hours, {len(game_ids)} ids in {id_elapsed:.3f} s "
+          f"({len(game_ids) / id_elapsed:.0f} ids/s)")
+    print(f"game logs: {report.downloaded} logs, {len(report.failed)} failed in {log_elapsed:.3f} s "
+          f"({report.downloaded / log_elapsed:.1f} logs/s, {report.bytes_per_second / 1e6:.2f} MB/s)")
+
+    ...
@@ -0,0 +1,44 @@
+""" Benchmark of memory of parsed game logs
+Compare GameLogParser memory with TagParser and compact GameEvent.
+usage: python benchmarks/event_memory.py [game log directory]
+"""
+
+
+import os
+import sys
+import tracemalloc
+
+from TenhouAPI.game_log.parse import (
+    GameLogParser, FileParser, CompiledFileParser, CompactFileParser
+)
+
+
+DIST = "../tenhou_data/game_logs"
+
+
+def measure(directory: str, file_parser: type[FileParser]) -> int:
+    """ Return bytes kept by parsing all game logs in directory """
+    file_paths = [
+        os.path.join(directory, file_name)
+        for file_name in sorted(os.listdir(directory))
+    ]
+    tracemalloc.start()
+    games = [GameLogParser(file_path, file_parser) for file_path in file_paths]
+    kept, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del games
+    return kept
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+
+    tag_parser = measure(directory, CompiledFileParser)
+    compact = measure(directory, CompactFileParser)
+
+    print(f"TagParser : {tag_parser / 1e6:.1f} MB")
+    print(f"GameEvent : {compact / 1e6:.1f} MB")
+    print(f"ratio: {compact / tag_parser:.2f}")
+
+    ...
@@ -0,0 +1,53 @@
+""" Benchmark of game id extraction
+Measure extract_game_ids_from_file and structured record extraction on hour files.
+usage: python benchmarks/extract.py [game id directory]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+from TenhouAPI.game_id.extract import (
+    extract_game_ids_from_file, extract_game_ids_from_bytes, iter_game_id_records_from_file
+)
+
+
+def read(file_path: str) -> bytes:
+    """ Return bytes of file """
+    with open(file_path, "rb") as f:
+        return f.read()
+
+
+DIST = "../tenhou_data/game_ids"
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+    file_names = sorted(os.listdir(directory))
+    html_paths = [
+        os.path.join(directory, file_name)
+        for file_name in file_names if file_name.endswith(".html")
+    ]
+    gz_paths = [
+        os.path.join(directory, file_name)
+        for file_name in file_names if file_name.endswith(".html.gz")
+    ]
+
+    cases = (
+        ("findall + slice", html_paths, lambda path: extract_game_ids_from_file(path)),
+        ("bytes filter", html_paths, lambda path: extract_game_ids_from_bytes(read(path))),
+        ("records", html_paths, lambda path: list(iter_game_id_records_from_file(path))),
+        ("records from gz", gz_paths, lambda path: list(iter_game_id_records_from_file(path))),
+    )
+
+    for label, file_paths, extract in cases:
+        if not file_paths: continue
+        start = perf_counter()
+        count = sum(len(extract(file_path)) for file_path in file_paths)
+        elapsed = perf_counter() - start
+        print(f"{label:16s}: {count} ids in {elapsed:.3f} s ({count / elapsed:.0f} ids/s)")
+        continue
+
+    ...
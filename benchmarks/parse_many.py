@@ -0,0 +1,50 @@
+""" Benchmark of bulk parsing over process pool
+Measure GameLogDirectory.parse_many scaling across worker counts.
+usage: python benchmarks/parse_many.py [game log directory] [max workers]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.game_log.parse import CompactFileParser
+
+
+DIST = "../tenhou_data/game_logs"
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    game_log_directory = GameLogDirectory(directory)
+    file_names = game_log_directory.listdir()
+
+    # serial baseline
+    start = perf_counter()
+    for file_name in file_names:
+        game_log_directory.parse(file_name, CompactFileParser)
+        continue
+    serial = perf_counter() - start
+    print(f"serial   : {serial:.3f} s ({len(file_names) / serial:.0f} logs/s)")
+
+    workers = 1
+    while workers <= max_workers:
+        start = perf_counter()
+        events = sum(
+            sum(map(len, parser))
+            for parser in game_log_directory.parse_many(file_names, workers)
+        )
+        elapsed = perf_counter() - start
+        print(
+            f"workers {workers:2d}: {elapsed:.3f} s "
+            f"({len(file_names) / elapsed:.0f} logs/s, "
+            f"{events / elapsed:.0f} events/s, x{serial / elapsed:.2f})"
+        )
+        workers *= 2
+        continue
+
+    ...
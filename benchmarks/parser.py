@@ -0,0 +1,64 @@
+""" Benchmark of game log file parsers
+Compare FileParser and CompiledFileParser on real mjlog files.
+usage: python benchmarks/parser.py [game log directory] [repeat]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+from TenhouAPI.game_log.parse import FileParser, CompiledFileParser
+
+
+DIST = "../tenhou_data/game_logs"
+
+
+def read_game_logs(directory: str) -> list:
+    """ Read all game log texts in directory """
+    texts = []
+    for file_name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, file_name), "r", encoding="utf-8") as f:
+            texts.append(f.read())
+            ...
+        continue
+    return texts
+
+
+def bench(file_parser: type[FileParser], texts: list, repeat: int) -> float:
+    """ Return best seconds of parsing all texts """
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        for text in texts:
+            file_parser.parse(text)
+            continue
+        best = min(best, perf_counter() - start)
+        continue
+    return best
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    texts = read_game_logs(directory)
+    size_mb = sum(map(len, texts)) / 1e6
+
+    # check same results
+    for text in texts:
+        expected = [tag.info for tag in FileParser.parse(text)]
+        actual = [tag.info for tag in CompiledFileParser.parse(text)]
+        assert expected == actual
+        continue
+
+    base = bench(FileParser, texts, repeat)
+    compiled = bench(CompiledFileParser, texts, repeat)
+
+    print(f"files: {len(texts)}, size: {size_mb:.1f} MB")
+    print(f"FileParser        : {base:.3f} s ({size_mb / base:.1f} MB/s)")
+    print(f"CompiledFileParser: {compiled:.3f} s ({size_mb / compiled:.1f} MB/s)")
+    print(f"speedup: {base / compiled:.2f}x")
+
+    ...
@@ -0,0 +1,46 @@
+""" Benchmark of replay engine
+Measure ReplayEngine throughput in events per second.
+usage: python benchmarks/replay.py [game log directory]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+from TenhouAPI.game_log.parse import GameLogParser, FileParser, CompactFileParser
+from TenhouAPI.game_log.replay import ReplayEngine
+
+
+DIST = "../tenhou_data/game_logs"
+
+
+def bench(games: list) -> float:
+    """ Return seconds of replaying all games """
+    engine = ReplayEngine()
+    start = perf_counter()
+    for game in games:
+        engine.run(game)
+        continue
+    return perf_counter() - start
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+    file_paths = [
+        os.path.join(directory, file_name)
+        for file_name in sorted(os.listdir(directory))
+    ]
+
+    for file_parser in (FileParser, CompactFileParser):
+        games = [GameLogParser(file_path, file_parser) for file_path in file_paths]
+        events = sum(sum(map(len, game)) for game in games)
+        elapsed = bench(games)
+        print(
+            f"{file_parser.__name__:18s}: {events} events in {elapsed:.3f} s "
+            f"({events / elapsed:.0f} events/s)"
+        )
+        continue
+
+    ...
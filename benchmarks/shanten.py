@@ -0,0 +1,59 @@
+""" Benchmark of shanten calculator
+Measure shanten and ukeire throughput on hands of every discard in replayed game logs.
+usage: python benchmarks/shanten.py [game log directory]
+"""
+
+
+import os
+import sys
+from time import perf_counter
+
+from TenhouAPI.config import GameLogEventKind
+from TenhouAPI.game_log.parse import GameLogParser, CompactFileParser
+from TenhouAPI.game_log.replay import ReplayEngine
+from TenhouAPI.game_log.shanten import shanten_batch, ukeire_batch
+
+
+DIST = "../tenhou_data/game_logs"
+
+DISCARD_KINDS = range(GameLogEventKind.P0_DISCARD, GameLogEventKind.P3_DISCARD + 1)
+
+
+def collect_hands(file_paths: list) -> list:
+    """ Return hands of discarders after each discard """
+    hands = []
+    engine = ReplayEngine()
+    for file_path in file_paths:
+        for event, state in engine.replay(GameLogParser(file_path, CompactFileParser)):
+            if event.kind not in DISCARD_KINDS: continue
+            hand = state.players[event.actor].hand
+            if min(hand) < 0 or max(hand) > 4 or sum(hand) % 3 != 1: continue
+            hands.append(hand.copy())
+            continue
+        continue
+    return hands
+
+
+if __name__ == "__main__":
+
+    directory = sys.argv[1] if len(sys.argv) > 1 else DIST
+    file_paths = [
+        os.path.join(directory, file_name)
+        for file_name in sorted(os.listdir(directory))
+    ]
+
+    hands = collect_hands(file_paths)
+
+    cases = (
+        ("shanten (cold)", shanten_batch),
+        ("shanten (warm)", shanten_batch),
+        ("ukeire", ukeire_batch),
+    )
+    for label, func in cases:
+        start = perf_counter()
+        func(hands)
+        elapsed = perf_counter() - start
+        print(f"{label:15s}: {len(hands)} hands in {elapsed:.3f} s ({len(hands) / elapsed:.0f} hands/s)")
+        continue
+
+    ...
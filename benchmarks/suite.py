@@ -0,0 +1,183 @@
+""" Benchmark suite of parsers
+Measure TagParser.parse, FileParser.parse, GameLogParser construction and
+extract_game_ids_from_file on seeded synthetic corpus, and record results as JSON.
+Results compared with baseline JSON are reported as ratio of throughput,
+and exit status is 1 if any case is slower than threshold.
+usage: python benchmarks/suite.py [--games N] [--hours N] [--repeat N]
+                                  [--output results.json] [--compare baseline.json]
+"""
+
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+from datetime import datetime
+from importlib import metadata
+from time import perf_counter
+
+from TenhouAPI.game_id.extract import extract_game_ids_from_file, iter_game_id_records_from_file
+from TenhouAPI.game_log.parse import (
+    TagParser, FileParser, CompiledFileParser, CompactFileParser, GameLogParser
+)
+from TenhouAPI.testing import write_game_logs, write_hour_files
+
+
+START = datetime(2025, 10, 4, 0)
+
+
+def read_texts(file_paths: list) -> list:
+    """ Return texts of files """
+    texts = []
+    for file_path in file_paths:
+        with open(file_path, "r", encoding="utf-8") as f:
+            texts.append(f.read())
+            ...
+        continue
+    return texts
+
+
+def measure(func, repeat: int) -> list:
+    """ Return seconds of each run of func """
+    seconds = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        seconds.append(perf_counter() - start)
+        continue
+    return seconds
+
+
+def run_cases(corpus_dir: str, args: argparse.Namespace) -> dict:
+    """ Generate corpus, and return result of each case """
+    game_log_paths = write_game_logs(
+        os.path.join(corpus_dir, "game_logs"), START, args.games, args.rounds, args.seed
+    )
+    hour_file_paths = write_hour_files(
+        os.path.join(corpus_dir, "game_ids"), START, args.hours, args.games_per_hour, args.seed
+    )
+    texts = read_texts(game_log_paths)
+    tag_texts = [tag_text for text in texts for tag_text in text[1:-1].split("><")]
+    game_log_bytes = sum(map(os.path.getsize, game_log_paths))
+    hour_file_bytes = sum(map(os.path.getsize, hour_file_paths))
+
+    def extract_ids() -> int:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            return sum(len(extract_game_ids_from_file(path)) for path in hour_file_paths)
+
+    game_id_count = extract_ids()
+
+    # name, items, unit, bytes, function
+    cases = (
+        ("TagParser.parse", len(tag_texts), "tags", sum(map(len, tag_texts)),
+         lambda: [TagParser.parse(tag_text) for tag_text in tag_texts]),
+        ("FileParser.parse", len(texts), "games", game_log_bytes,
+         lambda: [FileParser.parse(text) for text in texts]),
+        ("CompiledFileParser.parse", len(texts), "games", game_log_bytes,
+         lambda: [CompiledFileParser.parse(text) for text in texts]),
+        ("CompactFileParser.parse", len(texts), "games", game_log_bytes,
+         lambda: [CompactFileParser.parse(text) for text in texts]),
+        ("GameLogParser(FileParser)", len(game_log_paths), "games", game_log_bytes,
+         lambda: [GameLogParser(path, FileParser) for path in game_log_paths]),
+        ("GameLogParser(CompiledFileParser)", len(game_log_paths), "games", game_log_bytes,
+         lambda: [GameLogParser(path, CompiledFileParser) for path in game_log_paths]),
+        ("extract_game_ids_from_file", game_id_count, "ids", hour_file_bytes, extract_ids),
+        ("iter_game_id_records_from_file", args.hours * args.games_per_hour, "records",
+         hour_file_bytes,
+         lambda: [list(iter_game_id_records_from_file(path, None)) for path in hour_file_paths]),
+    )
+
+    results = {}
+    for name, items, unit, size, func in cases:
+        if args.case and not any(pattern in name for pattern in args.case): continue
+        seconds = measure(func, args.repeat)
+        best = min(seconds)
+        results[name] = {
+            "items": items,
+            "unit": unit,
+            "bytes": size,
+            "best_seconds": best,
+            "median_seconds": statistics.median(seconds),
+            "per_second": items / best,
+            "mb_per_second": size / best / 1e6,
+        }
+        print(f"{name:34s}: {items / best:12.0f} {unit}/s {size / best / 1e6:8.1f} MB/s")
+        continue
+
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> bool:
+    """ Print throughput ratio to baseline, and return True if no case regressed """
+    passed = True
+    for name, result in results.items():
+        if name not in baseline["results"]: continue
+        ratio = result["per_second"] / baseline["results"][name]["per_second"]
+        regressed = ratio < 1 - threshold
+        passed = passed and not regressed
+        print(f"{name:34s}: {ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+        continue
+    return passed
+
+
+def package_version() -> str:
+    """ Return installed version of package """
+    try:
+        return metadata.version("TenhouAPI")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark suite of parsers")
+    parser.add_argument("--games", type=int, default=200, help="number of game logs")
+    parser.add_argument("--rounds", type=int, default=8, help="rounds of each game log")
+    parser.add_argument("--hours", type=int, default=24, help="number of hour files")
+    parser.add_argument("--games-per-hour", type=int, default=100, help="games of each hour file")
+    parser.add_argument("--seed", type=int, default=0, help="seed of corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each case")
+    parser.add_argument("--case", action="append", help="run cases whose name contains this")
+    parser.add_argument("--corpus", help="directory to keep corpus. temporary if omitted")
+    parser.add_argument("--output", help="JSON file to write results")
+    parser.add_argument("--compare", help="JSON file of baseline results")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown to baseline")
+    args = parser.parse_args()
+
+    corpus_dir = args.corpus or tempfile.mkdtemp()
+    try:
+        results = run_cases(corpus_dir, args)
+    finally:
+        if args.corpus is None: shutil.rmtree(corpus_dir)
+
+    report = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "corpus": {
+            "games": args.games, "rounds": args.rounds, "hours": args.hours,
+            "games_per_hour": args.games_per_hour, "seed": args.seed,
+        },
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            ...
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+            ...
+        print(f"compared with {baseline['version']} ({baseline['created']})")
+        if not compare(results, baseline, args.threshold): sys.exit(1)
+
+    ...
@@ -8,4 +8,4 @@
 
 from .tenhou_url import TenhouUrlConfig
 from .game_id import GameIdConfig
-from .game_log_tag import DisplayGameLogTag
\ No newline at end of file
+from .game_log_tag import DisplayGameLogTag, GameLogEventKind, MeldType
@@ -8,7 +8,9 @@
 # libs
 
 
-from ..util.config import ConfigBase
+import re
+
+from ..util.config import ConfigBase, derived
 
 
 """ Game id configs
@@ -18,8 +20,26 @@ from ..util.config import ConfigBase
 class GameIdConfig(ConfigBase):
     """Configs of game id. """
 
+    __slots__ = ()
+
     """ game id format """
 
     game_id_format = r"log=\d{10}gm-.{4}-.{4}-.{8}"
 
+    @derived
+    def game_id_pattern(self) -> re.Pattern:
+        """
+        Return compiled pattern of game id format.
+        :return: Pattern of str.
+        """
+        return re.compile(self.game_id_format)
+
+    @derived
+    def game_id_bytes_pattern(self) -> re.Pattern:
+        """
+        Return compiled pattern of game id format for bytes.
+        :return: Pattern of bytes.
+        """
+        return re.compile(self.game_id_format.encode("ascii"))
+
     ...
\ No newline at end of file
@@ -20,6 +20,8 @@ class DisplayGameLogTag(ConfigBase):
     Tag for displaying game log
     """
 
+    __slots__ = ()
+
     GO = "GO"
     INIT = "INIT"
     OPEN_DORA = "OPEN_D"
@@ -37,3 +39,53 @@ class DisplayGameLogTag(ConfigBase):
     RYUUKYOKU = "END"
 
     ...
+
+
+
+""" Event kind constants """
+
+
+class GameLogEventKind(ConfigBase):
+    """
+    Small integer kind of game log event.
+    Each kind corresponds to the same name of DisplayGameLogTag.
+    """
+
+    __slots__ = ()
+
+    GO = 0
+    INIT = 1
+    OPEN_DORA = 2
+    P0_DRAW = 3
+    P1_DRAW = 4
+    P2_DRAW = 5
+    P3_DRAW = 6
+    P0_DISCARD = 7
+    P1_DISCARD = 8
+    P2_DISCARD = 9
+    P3_DISCARD = 10
+    NAKI = 11
+    REACH = 12
+    AGARI = 13
+    RYUUKYOKU = 14
+
+    ...
+
+
+""" Meld type constants """
+
+
+class MeldType(ConfigBase):
+    """
+    Small integer type of meld called by N tag.
+    """
+
+    __slots__ = ()
+
+    CHI = 0
+    PON = 1
+    KAN = 2
+    KAKAN = 3
+    NUKI = 4
+
+    ...
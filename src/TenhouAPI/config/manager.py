@@ -21,6 +21,8 @@ class WhiteKeyConfig(ConfigBase):
     White keys of directory manager.
     """
 
+    __slots__ = ()
+
     player_num_4 = ("00a9", "00e9")
     player_num_3 = ("00b9", )
 
@@ -10,7 +10,7 @@
 
 import re
 
-from ..util.config import ConfigBase
+from ..util.config import ConfigBase, derived
 from ..util.zip import ZipBase, Gzip
 
 
@@ -24,6 +24,8 @@ from ..util.zip import ZipBase, Gzip
 class TenhouUrlConfig(ConfigBase):
     """ Url configs of tenhou """
 
+    __slots__ = ()
+
     """ Settings """
 
     table_key: str = "scc"
@@ -54,7 +56,7 @@ class TenhouUrlConfig(ConfigBase):
 
     id_file_name_format: str = "{key}{year:04d}{month:02d}{day:02d}{hour:02d}.html"
 
-    @property
+    @derived
     def file_name_length(self) -> int:
         """
         Return file name length.
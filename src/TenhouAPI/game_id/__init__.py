@@ -8,9 +8,20 @@
 
 from .download import (
     download_game_id_list,
+    download_and_unzip_game_id_list,
     save_file_from_zipped_bytes,
 )
 
-from .extract import extract_game_ids_from_file
+from .extract import (
+    extract_game_ids_from_file,
+    extract_game_ids_from_bytes,
+    iter_game_id_records,
+    iter_game_id_records_from_file,
+    GameIdRecord,
+)
+
+from .archive import extract_game_ids_from_archive, iter_game_ids_from_archive
+
+from .index import GameIdIndex
 
 from .manager import GameIdDirectory
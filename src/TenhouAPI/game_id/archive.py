@@ -0,0 +1,158 @@
+""" Tools that extract game ids from yearly archive of Tenhou.
+"""
+
+
+# typing
+
+
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
+
+
+# libs
+
+
+import os.path
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from ..config.tenhou_url import TenhouUrlConfig
+from ..config.game_id import GameIdConfig
+from ..util.metrics import logger
+from ..util.zip import ZipBase
+
+from .extract import extract_game_ids_from_chunks
+
+
+""" Archive processes
+"""
+
+
+""" Members """
+
+
+def list_archive_members(
+        archive_path: str,
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+) -> List[str]:
+    """
+    List member names of zipped game id files in archive.
+    :param archive_path: Path of yearly zip archive.
+    :param url_config: URL config.
+    :return: Sorted member names.
+    """
+    extension = url_config.zip_tool.EXTENSION
+    with zipfile.ZipFile(archive_path) as archive:
+        return sorted(
+            name for name in archive.namelist()
+            if name.endswith(extension)
+            and os.path.basename(name).startswith(url_config.table_key)
+        )
+
+
+def extract_game_ids_from_members(
+        archive_path: str,
+        member_names: List[str],
+        zip_tool: type[ZipBase],
+        game_id_config: GameIdConfig,
+        white_key: Tuple[str, ...],
+) -> List[Tuple[str, List[str]]]:
+    """
+    Extract game ids from members of archive in worker process.
+    Each member is decompressed in chunks, and game ids are extracted while they are
+    decompressed, so neither member nor file is held whole.
+    :param archive_path: Path of yearly zip archive.
+    :param member_names: Member names to extract.
+    :param zip_tool: Zip tool of members.
+    :param game_id_config: Config of game id.
+    :param white_key: White key.
+    :return: Html file name and game ids of each member.
+    """
+    results = []
+    with zipfile.ZipFile(archive_path) as archive:
+        for member_name in member_names:
+            with archive.open(member_name) as f_member:
+                game_ids = extract_game_ids_from_chunks(
+                    zip_tool.iter_unzip(iter(lambda: f_member.read(zip_tool.CHUNK_SIZE), b"")),
+                    game_id_config,
+                    white_key,
+                )
+                ...
+            results.append((
+                zip_tool.remove_extension(os.path.basename(member_name)),
+                game_ids,
+            ))
+            continue
+        ...
+    return results
+
+
+""" Extract """
+
+
+def iter_game_ids_from_archive(
+        archive_path: str,
+        white_key: Tuple[str, ...] = ("00a9", "00e9"),
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+        game_id_config: GameIdConfig = GameIdConfig(),
+        workers: int = None,
+        chunk_size: int = 24,
+) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Extract game ids from members of archive over process pool.
+    :param archive_path: Path of yearly zip archive.
+    :param white_key: White key.
+    :param url_config: URL config.
+    :param game_id_config: Config of game id.
+    :param workers: Number of worker processes. CPU count if None.
+    :param chunk_size: Number of members extracted per task.
+    :return: Iterator of html file name and game ids in order of member names.
+    """
+    logger.debug("Extracting game id from %s archive.", archive_path)
+
+    member_names = list_archive_members(archive_path, url_config)
+    chunks = [
+        member_names[start:start + chunk_size]
+        for start in range(0, len(member_names), chunk_size)
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for results in executor.map(
+                extract_game_ids_from_members,
+                [archive_path] * len(chunks),
+                chunks,
+                [url_config.zip_tool] * len(chunks),
+                [game_id_config] * len(chunks),
+                [tuple(white_key)] * len(chunks),
+        ):
+            yield from results
+            continue
+
+    return
+
+
+def extract_game_ids_from_archive(
+        archive_path: str,
+        white_key: Tuple[str, ...] = ("00a9", "00e9"),
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+        game_id_config: GameIdConfig = GameIdConfig(),
+        workers: int = None,
+        chunk_size: int = 24,
+) -> Dict[str, List[str]]:
+    """
+    Extract game ids from all members of archive.
+    :param archive_path: Path of yearly zip archive.
+    :param white_key: White key.
+    :param url_config: URL config.
+    :param game_id_config: Config of game id.
+    :param workers: Number of worker processes. CPU count if None.
+    :param chunk_size: Number of members extracted per task.
+    :return: Game ids of each html file name.
+    """
+    return dict(iter_game_ids_from_archive(
+        archive_path, white_key, url_config, game_id_config, workers, chunk_size
+    ))
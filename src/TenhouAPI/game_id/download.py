@@ -18,7 +18,9 @@ int_or_str = Union[int, str]
 import os.path
 from time import sleep
 
-from ..util.download import download
+from ..util.download import download, download_stream, ConnectionPool
+from ..util import metrics
+from ..util.metrics import logger
 
 from ..config.tenhou_url import TenhouUrlConfig
 
@@ -31,23 +33,21 @@ from ..config.tenhou_url import TenhouUrlConfig
 """ Download functions """
 
 
-def download_game_id_list(
+def generate_game_id_list_url(
         year: int_or_str,
         month: int_or_str,
         day: int_or_str,
         hour: int_or_str,
-        sleep_time: sleep = 5,
-        url_config: TenhouUrlConfig = TenhouUrlConfig()
-) -> Union[bytes, None]:
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+) -> str:
     """
-    Download game id list from Tenhou.
+    Generate url of game id list.
     :param year: Year to download.
     :param month: Month to download.
     :param day: Day to download.
     :param hour: Hour to download.
-    :param sleep_time: Sleep time.
     :param url_config: URL config.
-    :return: Downloaded game list bytes.
+    :return: Url of game id list.
     """
 
     """ generate file name"""
@@ -62,20 +62,91 @@ def download_game_id_list(
             "Invalid format of arguments. Not match length of file_name."
         )
 
+    return url_config.generate_id_list_url(file_name)
+
+
+def download_game_id_list(
+        year: int_or_str,
+        month: int_or_str,
+        day: int_or_str,
+        hour: int_or_str,
+        sleep_time: sleep = 5,
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+        pool: ConnectionPool = None,
+) -> Union[bytes, None]:
+    """
+    Download game id list from Tenhou.
+    :param year: Year to download.
+    :param month: Month to download.
+    :param day: Day to download.
+    :param hour: Hour to download.
+    :param sleep_time: Sleep time.
+    :param url_config: URL config.
+    :param pool: Keep-alive connection pool. Requested by urllib if None.
+    :return: Downloaded game list bytes.
+    """
+
     """ Download file """
 
-    file_url = url_config.generate_id_list_url(url_config, file_name)
-    print("Downloading: {url}".format(url=file_url))
+    file_url = generate_game_id_list_url(year, month, day, hour, url_config)
+    logger.debug("Downloading: %s", file_url)
 
     headers = {"User-Agent": "Mozilla/5.0"}
 
-    result = download(file_url, headers=headers)
+    result = download(file_url, headers=headers, pool=pool)
 
-    sleep(sleep_time)
+    with metrics.timer(metrics.SLEEP_TIME):
+        sleep(sleep_time)
+        ...
 
     return result
 
 
+def download_and_unzip_game_id_list(
+        year: int_or_str,
+        month: int_or_str,
+        day: int_or_str,
+        hour: int_or_str,
+        save_file_path: str,
+        sleep_time: sleep = 5,
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+        pool: ConnectionPool = None,
+) -> str:
+    """
+    Download game id list from Tenhou, and decompress response
+    into file while it is received.
+    :param year: Year to download.
+    :param month: Month to download.
+    :param day: Day to download.
+    :param hour: Hour to download.
+    :param save_file_path: File path to save.
+    :param sleep_time: Sleep time.
+    :param url_config: URL config.
+    :param pool: Keep-alive connection pool. Requested by urllib if None.
+    :return: Saved html file path.
+    """
+
+    """ Download and unzip """
+
+    file_url = generate_game_id_list_url(year, month, day, hour, url_config)
+    logger.debug("Downloading: %s", file_url)
+
+    headers = {"User-Agent": "Mozilla/5.0"}
+
+    download_stream(
+        file_url,
+        lambda chunks: url_config.zip_tool.unzip_stream(chunks, save_file_path),
+        headers=headers,
+        pool=pool,
+    )
+
+    with metrics.timer(metrics.SLEEP_TIME):
+        sleep(sleep_time)
+        ...
+
+    return save_file_path
+
+
 """ Unzip bytes and save file """
 
 
@@ -91,20 +162,14 @@ def save_file_from_zipped_bytes(
     :param url_config: URL config.
     :return: Saved html file path.
     """
-    # generate zip file path
-    zip_file_path = url_config.zip_tool.add_extension(save_file_path)
-
-    print("Building game ids html file: {path}".format(path=save_file_path))
-
-    # save gz
-    with open(zip_file_path, "wb") as f_gz:
-        f_gz.write(zipped_bytes)
-        ...
+    logger.debug("Building game ids html file: %s", save_file_path)
 
-    # unzip and save
-    url_config.zip_tool.unzip(zip_file_path, save_file_path)
+    # check exists
+    if os.path.exists(save_file_path):
+        logger.info("Unzipping is already done: %s", save_file_path)
+        return save_file_path
 
-    # rm gz
-    os.remove(zip_file_path)
+    # unzip in chunks and save
+    url_config.zip_tool.unzip_bytes(zipped_bytes, save_file_path)
 
     return save_file_path
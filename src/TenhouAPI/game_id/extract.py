@@ -5,14 +5,19 @@
 # typing
 
 
-from typing import List, Tuple
+from typing import List, Tuple, Iterable, Iterator, Union
 
 # libs
 
 
 import re
+from datetime import datetime
+from functools import lru_cache
 
 from ..config.game_id import GameIdConfig
+from ..util import metrics
+from ..util.metrics import logger
+from ..util.zip import ZipBase, Gzip
 
 
 """ Extract game ids processes
@@ -35,21 +40,256 @@ def extract_game_ids_from_file(
     :return: Extracted game id.
     """
 
-    print("Extracting game id from {html} file.".format(html=file_path))
+    logger.debug("Extracting game id from %s file.", file_path)
 
     # get file contains
     with open(file_path, "r", encoding="utf-8") as f_html:
         content = f_html.read()
         ...
 
-    # extract game ids
-    results = re.findall(game_id_config.game_id_format, content)
+    with metrics.timer(metrics.EXTRACT_TIME):
+
+        # extract game ids
+        results = game_id_config.game_id_pattern.findall(content)
+
+        # choice white result
+        results = [
+            result
+            for result in results
+            if result[17:21] in white_key
+        ]
+        ...
+
+    return results
+
+
+@lru_cache(maxsize=None)
+def compile_game_id_filter(game_id_format: str, white_key: Tuple[str, ...]) -> Union[re.Pattern, None]:
+    """
+    Compile bytes pattern of game id that matches only white keys.
+    Type code part "gm-.{4}" of game id format is replaced by white keys.
+    :param game_id_format: Game id format of GameIdConfig.
+    :param white_key: White key.
+    :return: Compiled pattern. None if format has no type code part.
+    """
+    if "gm-.{4}" not in game_id_format: return None
+    keys = "|".join(re.escape(key) for key in white_key)
+    return re.compile(
+        game_id_format.replace("gm-.{4}", f"gm-(?:{keys})", 1).encode("ascii")
+    )
+
+
+def extract_game_ids_from_bytes(
+        content: bytes,
+        game_id_config: GameIdConfig = GameIdConfig(),
+        white_key: Tuple[str, ...] = ("00a9", "00e9"),
+) -> List[str]:
+    """
+    Extract game id from bytes of html without decoding it.
+    White keys are filtered by pattern.
+    :param content: Bytes of html.
+    :param game_id_config: Config of game id.
+    :param white_key: White key.
+    :return: Extracted game id.
+    """
+    pattern = compile_game_id_filter(game_id_config.game_id_format, tuple(white_key))
+
+    # filtered by pattern
+    if pattern is not None:
+        return [result.decode("ascii") for result in pattern.findall(content)]
 
     # choice white result
-    results = [
-        result
+    results = game_id_config.game_id_bytes_pattern.findall(content)
+    white_key_bytes = tuple(key.encode("ascii") for key in white_key)
+    return [
+        result.decode("ascii")
         for result in results
-        if result[17:21] in white_key
+        if result[17:21] in white_key_bytes
+    ]
+
+
+""" Structured records """
+
+
+class GameIdRecord:
+    """
+    Game id and metadata of one line of hour file.
+    game_id is same format as extract_game_ids_from_file ("log=..."),
+    lobby_type is type code of game id such as "00a9", timestamp is start time,
+    duration is minutes, and rule is rule name of lobby.
+    Other than game_id and lobby_type are decoded from matched bytes on first access.
+    """
+
+    __slots__ = ("game_id", "lobby_type", "__groups", "__players")
+
+    def __init__(self, groups: Tuple[bytes, ...]) -> None:
+        """
+        Assign matched groups of line pattern.
+        :param groups: Groups of compile_game_id_pattern.
+        """
+        self.game_id: str = groups[4].decode("ascii")
+        self.lobby_type: str = groups[8].decode("ascii")
+        self.__groups = groups
+        self.__players = None
+        return
+
+    @property
+    def timestamp(self) -> datetime:
+        hour, minute, _, _, _, year, month, day = self.__groups[:8]
+        return datetime(int(year), int(month), int(day), int(hour), int(minute))
+
+    @property
+    def duration(self) -> int: return int(self.__groups[2])
+
+    @property
+    def rule(self) -> str: return self.__groups[3].decode("utf-8")
+
+    @property
+    def players(self) -> Tuple[str, ...]: return self.__decode_players()[0]
+
+    @property
+    def scores(self) -> Tuple[float, ...]: return self.__decode_players()[1]
+
+    def __decode_players(self) -> Tuple[Tuple[str, ...], Tuple[float, ...]]:
+        if self.__players is None:
+            players = PLAYER_PATTERN.findall(self.__groups[9].decode("utf-8").strip())
+            self.__players = (
+                tuple(player for player, _ in players),
+                tuple(float(score) for _, score in players),
+            )
+            ...
+        return self.__players
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameIdRecord): return NotImplemented
+        return self.__groups == other.__groups
+
+    def __hash__(self) -> int: return hash(self.game_id)
+
+    def __repr__(self):
+        return "{class_name}('{game_id}', timestamp={timestamp}, players={players}, scores={scores})".format(
+            class_name=self.__class__.__name__,
+            game_id=self.game_id,
+            timestamp=self.timestamp.isoformat(),
+            players=self.players,
+            scores=self.scores,
+        )
+
+    ...
+
+
+# player and score such as "name(+50.0)" or "name(+50.0,+3枚)"
+PLAYER_PATTERN: re.Pattern = re.compile(r"(.+?)\(([+-]?\d+(?:\.\d+)?)[^)]*\)(?:\s+|$)")
+
+
+@lru_cache(maxsize=None)
+def compile_game_id_pattern(white_key: Union[Tuple[str, ...], None]) -> re.Pattern:
+    """
+    Compile bytes pattern of line of hour file that matches only white keys.
+    Line starts after line break, which lets pattern scan fast.
+    :param white_key: White key. All type codes if None.
+    :return: Compiled pattern.
+    """
+    if white_key is None:
+        keys = rb"\w{4}"
+    else:
+        keys = b"|".join(re.escape(key.encode("ascii")) for key in white_key)
+    return re.compile(
+        rb"\n(\d\d):(\d\d) \| (\d+) \| ([^|\n]*) \| "
+        rb"<a href=\"[^\"?]*\?(log=(\d{4})(\d\d)(\d\d)\d\dgm-(" + keys + rb")-.{4}-.{8})\">"
+        rb"[^<\n]*</a> \| ([^<\n]*)"
+    )
+
+
+def iter_game_id_records(
+        content: bytes,
+        white_key: Union[Tuple[str, ...], None] = ("00a9", "00e9"),
+) -> Iterator[GameIdRecord]:
+    """
+    Extract records of game ids from bytes of hour file.
+    :param content: Bytes of html.
+    :param white_key: White key. All type codes if None.
+    :return: Iterator of records.
+    """
+    pattern = compile_game_id_pattern(None if white_key is None else tuple(white_key))
+    return map(GameIdRecord, pattern.findall(b"\n" + content))
+
+
+def iter_line_blocks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Join chunks into blocks of whole lines. Chunks are split at last line break.
+    Chunks without line break are kept as pieces, and joined once.
+    :param chunks: Chunks of html bytes.
+    :return: Iterator of blocks.
+    """
+    pieces: List[bytes] = []
+    for chunk in chunks:
+        end = chunk.rfind(b"\n") + 1
+        if end == 0:
+            pieces.append(chunk)
+            continue
+        pieces.append(chunk[:end])
+        yield b"".join(pieces)
+        pieces = [chunk[end:]]
+        continue
+    rest = b"".join(pieces)
+    if rest: yield rest
+    return
+
+
+def iter_game_id_records_from_chunks(
+        chunks: Iterable[bytes],
+        white_key: Union[Tuple[str, ...], None] = ("00a9", "00e9"),
+) -> Iterator[GameIdRecord]:
+    """
+    Extract records from chunks of hour file while they are read.
+    Chunks are split at last line break, so line is not split.
+    :param chunks: Chunks of html bytes.
+    :param white_key: White key. All type codes if None.
+    :return: Iterator of records.
+    """
+    for block in iter_line_blocks(chunks):
+        yield from iter_game_id_records(block, white_key)
+        continue
+    return
+
+
+def extract_game_ids_from_chunks(
+        chunks: Iterable[bytes],
+        game_id_config: GameIdConfig = GameIdConfig(),
+        white_key: Tuple[str, ...] = ("00a9", "00e9"),
+) -> List[str]:
+    """
+    Extract game ids from chunks of hour file while they are read.
+    Game ids are matched by game id pattern same as extract_game_ids_from_file,
+    so lines of other layout than records are not dropped.
+    :param chunks: Chunks of html bytes.
+    :param game_id_config: Config of game id.
+    :param white_key: White key.
+    :return: Extracted game id.
+    """
+    return [
+        game_id
+        for block in iter_line_blocks(chunks)
+        for game_id in extract_game_ids_from_bytes(block, game_id_config, white_key)
     ]
 
-    return results
\ No newline at end of file
+
+def iter_game_id_records_from_file(
+        file_path: str,
+        white_key: Union[Tuple[str, ...], None] = ("00a9", "00e9"),
+        zip_tool: Union[type[ZipBase], None] = Gzip,
+) -> Iterator[GameIdRecord]:
+    """
+    Extract records from html file, or zipped html file decompressed in chunks.
+    :param file_path: Path of html or zipped html file.
+    :param white_key: White key. All type codes if None.
+    :param zip_tool: Zip tool. Zipped file is detected by its extension.
+    :return: Iterator of records.
+    """
+    if zip_tool is not None and file_path.endswith(zip_tool.EXTENSION):
+        chunks = zip_tool.iter_unzip(zip_tool.read_chunks(file_path))
+    else:
+        chunks = ZipBase.read_chunks(file_path)
+        ...
+    return iter_game_id_records_from_chunks(chunks, white_key)
@@ -0,0 +1,290 @@
+""" Tools that index game ids across hour files.
+"""
+
+
+# typing
+
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
+
+
+# libs
+
+
+import os.path
+import sqlite3
+from datetime import datetime
+from threading import Lock
+
+from ..util.cache import file_stamp
+from ..util.zip import ZipBase, Gzip
+
+from .extract import GameIdRecord, iter_game_id_records_from_file
+
+
+""" Game id index
+"""
+
+
+class GameIdIndex:
+    """
+    Persistent index of game ids and metadata in SQLite.
+    Each game id is stored once, and hour files are indexed again
+    only when their modified time or size changes.
+    """
+
+    SCHEMA: Tuple[str, ...] = (
+        "CREATE TABLE IF NOT EXISTS games ("
+        "game_id TEXT PRIMARY KEY, "
+        "lobby_type TEXT NOT NULL, "
+        "timestamp TEXT NOT NULL, "
+        "duration INTEGER NOT NULL, "
+        "rule TEXT NOT NULL, "
+        "source TEXT NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS games_timestamp ON games (timestamp)",
+        "CREATE INDEX IF NOT EXISTS games_lobby_type ON games (lobby_type, timestamp)",
+        "CREATE TABLE IF NOT EXISTS players ("
+        "game_id TEXT NOT NULL, "
+        "rank INTEGER NOT NULL, "
+        "name TEXT NOT NULL, "
+        "score REAL NOT NULL, "
+        "PRIMARY KEY (game_id, rank))",
+        "CREATE INDEX IF NOT EXISTS players_name ON players (name)",
+        "CREATE TABLE IF NOT EXISTS files ("
+        "file_name TEXT PRIMARY KEY, "
+        "mtime_ns INTEGER NOT NULL, "
+        "size INTEGER NOT NULL, "
+        "games INTEGER NOT NULL)",
+    )
+
+    """ Initialize """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open index database.
+        :param path: Database file path.
+        """
+        self.__path = path
+        self.__lock = Lock()
+
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            for sql in self.SCHEMA:
+                connection.execute(sql)
+                continue
+            ...
+        return
+
+    @property
+    def path(self) -> str: return self.__path
+
+    def __len__(self) -> int:
+        return self.__read("SELECT COUNT(*) FROM games")[0][0]
+
+    def __contains__(self, game_id: str) -> bool:
+        return bool(self.__read("SELECT 1 FROM games WHERE game_id = ?", (game_id,)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.__path}', games={len(self)})"
+
+    def __enter__(self) -> "GameIdIndex": return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        return
+
+    def close(self) -> None:
+        """
+        Close index database.
+        :return: None
+        """
+        with self.__lock:
+            self.__connection.close()
+            ...
+        return
+
+    """ Update """
+
+    def add_records(self, records: Iterable[GameIdRecord], source: str = "") -> int:
+        """
+        Add records. Game ids already indexed are ignored.
+        :param records: Records of game ids.
+        :param source: File name of records.
+        :return: Number of added game ids.
+        """
+        games, players = [], []
+        seen = set()
+        for record in records:
+            if record.game_id in seen: continue
+            seen.add(record.game_id)
+            games.append((
+                record.game_id, record.lobby_type, record.timestamp.isoformat(),
+                record.duration, record.rule, source,
+            ))
+            players.extend(
+                (record.game_id, rank, name, score)
+                for rank, (name, score) in enumerate(zip(record.players, record.scores))
+            )
+            continue
+
+        with self.__lock, self.__connection as connection:
+            before = connection.total_changes
+            connection.executemany(
+                "INSERT OR IGNORE INTO games VALUES (?, ?, ?, ?, ?, ?)", games
+            )
+            added = connection.total_changes - before
+            connection.executemany(
+                "INSERT OR IGNORE INTO players VALUES (?, ?, ?, ?)", players
+            )
+            ...
+
+        return added
+
+    def update_file(
+            self,
+            file_path: str,
+            zip_tool: Union[type[ZipBase], None] = Gzip,
+    ) -> int:
+        """
+        Index hour file if it is new or changed.
+        :param file_path: Path of html or zipped html file.
+        :param zip_tool: Zip tool of zipped file.
+        :return: Number of added game ids.
+        """
+        file_name = os.path.basename(file_path)
+        mtime_ns, size = file_stamp(file_path)
+
+        row = self.__read("SELECT mtime_ns, size FROM files WHERE file_name = ?", (file_name,))
+        if row and row[0] == (mtime_ns, size): return 0
+
+        records = list(iter_game_id_records_from_file(file_path, None, zip_tool))
+        added = self.add_records(records, file_name)
+
+        with self.__lock, self.__connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                (file_name, mtime_ns, size, len(records)),
+            )
+            ...
+
+        return added
+
+    def update(
+            self,
+            file_paths: Iterable[str],
+            zip_tool: Union[type[ZipBase], None] = Gzip,
+    ) -> int:
+        """
+        Index hour files that are new or changed.
+        :param file_paths: Paths of html or zipped html files.
+        :param zip_tool: Zip tool of zipped files.
+        :return: Number of added game ids.
+        """
+        return sum(self.update_file(file_path, zip_tool) for file_path in file_paths)
+
+    """ Query """
+
+    def query(
+            self,
+            start: datetime = None,
+            end: datetime = None,
+            white_key: Tuple[str, ...] = None,
+            player: str = None,
+            limit: int = None,
+    ) -> List[str]:
+        """
+        Return game ids in order of start time.
+        :param start: First start time. Not bounded if None.
+        :param end: End start time, excluded. Not bounded if None.
+        :param white_key: Type codes such as WhiteKeyConfig values. All if None.
+        :param player: Player name. All if None.
+        :param limit: Max number of game ids. All if None.
+        :return: Game ids.
+        """
+        sql, parameters = self.__query_sql("games.game_id", start, end, white_key, player)
+        sql += " ORDER BY games.timestamp, games.game_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return [row[0] for row in self.__read(sql, parameters)]
+
+    def count(
+            self,
+            start: datetime = None,
+            end: datetime = None,
+            white_key: Tuple[str, ...] = None,
+            player: str = None,
+    ) -> int:
+        """
+        Return number of game ids of query.
+        :param start: First start time. Not bounded if None.
+        :param end: End start time, excluded. Not bounded if None.
+        :param white_key: Type codes such as WhiteKeyConfig values. All if None.
+        :param player: Player name. All if None.
+        :return: Number of game ids.
+        """
+        sql, parameters = self.__query_sql("COUNT(*)", start, end, white_key, player)
+        return self.__read(sql, parameters)[0][0]
+
+    def players(self, game_id: str) -> List[Tuple[str, float]]:
+        """
+        Return players and scores of game in order of rank.
+        :param game_id: Game id.
+        :return: Player names and scores.
+        """
+        return self.__read(
+            "SELECT name, score FROM players WHERE game_id = ? ORDER BY rank", (game_id,)
+        )
+
+    def files(self) -> Dict[str, int]:
+        """
+        Return indexed file names and their number of game ids.
+        :return: Number of game ids of each file name.
+        """
+        return dict(self.__read("SELECT file_name, games FROM files"))
+
+    """ Internal """
+
+    @staticmethod
+    def __query_sql(
+            columns: str,
+            start: Union[datetime, None],
+            end: Union[datetime, None],
+            white_key: Union[Tuple[str, ...], None],
+            player: Union[str, None],
+    ) -> Tuple[str, list]:
+        sql = f"SELECT {columns} FROM games"
+        conditions, parameters = [], []
+
+        if player is not None:
+            sql += " JOIN players ON players.game_id = games.game_id"
+            conditions.append("players.name = ?")
+            parameters.append(player)
+        if start is not None:
+            conditions.append("games.timestamp >= ?")
+            parameters.append(start.isoformat())
+        if end is not None:
+            conditions.append("games.timestamp < ?")
+            parameters.append(end.isoformat())
+        if white_key is not None:
+            conditions.append(
+                "games.lobby_type IN ({marks})".format(marks=", ".join("?" * len(white_key)))
+            )
+            parameters.extend(white_key)
+
+        if conditions: sql += " WHERE " + " AND ".join(conditions)
+        return sql, parameters
+
+    def __read(self, sql: str, parameters=()) -> list:
+        with self.__lock:
+            return self.__connection.execute(sql, parameters).fetchall()
+
+    ...
@@ -8,7 +8,9 @@
 from typing import (
     Union,
     List,
-    Tuple
+    Tuple,
+    Dict,
+    Iterator,
 )
 
 int_or_str = Union[int, str]
@@ -19,24 +21,35 @@ int_or_str = Union[int, str]
 
 import os.path
 import re
+from datetime import date, datetime, timedelta
 
 from ..config.tenhou_url import TenhouUrlConfig
 from ..config.game_id import GameIdConfig
 from ..config.manager import WhiteKeyConfig
 
 from ..util.directory_manager import DirectoryManager
+from ..util.download import ConnectionPool, download_many, DownloadReport
+from ..util.metrics import logger
+from ..util.rate_limit import TokenBucket
+from ..util.retry import RetryPolicy
 
 from .download import (
-    download_game_id_list,
+    download_and_unzip_game_id_list,
     save_file_from_zipped_bytes,
 )
-from .extract import extract_game_ids_from_file
+from .extract import extract_game_ids_from_file, iter_game_id_records_from_file, GameIdRecord
+from .archive import extract_game_ids_from_archive
+from .index import GameIdIndex
 
 
 """ Game ids directory manager
 """
 
 
+# hidden file name of game id index in save directory
+INDEX_FILE_NAME: str = ".game_id_index.sqlite3"
+
+
 class GameIdDirectory(DirectoryManager):
     """ Manage directory of game ids """
 
@@ -90,6 +103,7 @@ class GameIdDirectory(DirectoryManager):
             self.generate_save_file_path(save_file_name),
             self.__url_config
         )
+        self.add_file(save_file_name)
 
         return os.path.basename(save_file_path)
 
@@ -111,19 +125,11 @@ class GameIdDirectory(DirectoryManager):
             )
             ...
 
-        # read zipped file
+        # unzip in chunks and save
 
-        with open(zipped_file_path, "rb") as f_zipped:
-            zipped_bytes = f_zipped.read()
-            ...
-
-        # save file
-
-        save_file_path = save_file_from_zipped_bytes(
-            zipped_bytes,
-            self.generate_save_file_path(save_file_name),
-            self.__url_config
-        )
+        save_file_path = self.generate_save_file_path(save_file_name)
+        self.__url_config.zip_tool.unzip(zipped_file_path, save_file_path)
+        self.add_file(save_file_name)
 
         return os.path.basename(save_file_path)
 
@@ -144,6 +150,51 @@ class GameIdDirectory(DirectoryManager):
             if zipped_file_name[:len(self.__url_config.table_key)] == self.__url_config.table_key
         )
 
+    """ File names """
+
+    def generate_file_name(
+            self,
+            year: int_or_str,
+            month: int_or_str,
+            day: int_or_str,
+            hour: int_or_str,
+    ) -> str:
+        """
+        Generate file name of hourly game ids.
+        :param year: Target year.
+        :param month: Target month.
+        :param day: Target day.
+        :param hour: Target hour.
+        :return: File name.
+        """
+        return self.__url_config.id_file_name_format.format(
+            key=self.__url_config.table_key,
+            year=year, month=month, day=day, hour=hour,
+        )
+
+    @staticmethod
+    def iter_hours(
+            start: Union[date, datetime],
+            end: Union[date, datetime],
+    ) -> Iterator[datetime]:
+        """
+        Yield hours from start to end. End is excluded.
+        date is treated as 0 o'clock of the day.
+        :param start: First hour.
+        :param end: End hour.
+        :return: Iterator of hours.
+        """
+        if not isinstance(start, datetime): start = datetime(start.year, start.month, start.day)
+        if not isinstance(end, datetime): end = datetime(end.year, end.month, end.day)
+
+        hour = start.replace(minute=0, second=0, microsecond=0)
+        while hour < end:
+            yield hour
+            hour += timedelta(hours=1)
+            continue
+
+        return
+
     """ Download and install """
 
     def download_and_install(
@@ -166,27 +217,88 @@ class GameIdDirectory(DirectoryManager):
         :return: Saved file name.
         """
 
-        """ Download """
+        """ Download and install """
+
+        if save_file_name is None:
+            save_file_name = self.generate_file_name(year, month, day, hour)
+
+        save_file_path = self.generate_save_file_path(save_file_name)
 
-        zipped_bytes = download_game_id_list(
+        download_and_unzip_game_id_list(
             year, month, day, hour,
+            save_file_path,
             sleep_time=sleep_time,
             url_config=self.__url_config,
         )
+        self.add_file(save_file_name)
 
-        """ Install """
+        return os.path.basename(save_file_path)
 
-        if save_file_name is None:
-            save_file_name = self.__url_config.id_file_name_format.format(
-                key=self.__url_config.table_key,
-                year=year, month=month, day=day, hour=hour,
+    def download_range(
+            self,
+            start: Union[date, datetime],
+            end: Union[date, datetime],
+            workers: int = 4,
+            rate: float = 1.0,
+            burst: int = 1,
+            rate_limiter: TokenBucket = None,
+            retry: RetryPolicy = None,
+    ) -> DownloadReport:
+        """
+        Download and install game ids of each hour from start to end concurrently.
+        Hours already present are skipped, and requests of all workers
+        share token bucket of rate per second and keep-alive connection pool
+        of workers connections.
+        :param start: First hour. date is 0 o'clock of the day.
+        :param end: End hour, excluded. date is 0 o'clock of the day.
+        :param workers: Number of concurrent downloads.
+        :param rate: Requests per second of all workers.
+        :param burst: Max requests sent at once.
+        :param rate_limiter: Shared rate limiter. Overrides rate and burst.
+        :param retry: Retry policy. Default RetryPolicy if None.
+        :return: Report of download. report.succeeded is set of installed file names,
+        report.failed maps failed hours to errors, and throughput is also reported.
+        """
+        if rate_limiter is None:
+            rate_limiter = TokenBucket(rate, burst)
+            ...
+        if retry is None:
+            retry = RetryPolicy()
+            ...
+
+        # hours not present
+        hours = [
+            hour for hour in self.iter_hours(start, end)
+            if not self.exists(self.generate_file_name(hour.year, hour.month, hour.day, hour.hour))
+        ]
+
+        def fetch(hour: datetime) -> str:
+            rate_limiter.acquire()
+            return download_and_unzip_game_id_list(
+                hour.year, hour.month, hour.day, hour.hour,
+                self.generate_save_file_path(
+                    self.generate_file_name(hour.year, hour.month, hour.day, hour.hour)
+                ),
+                sleep_time=0,
+                url_config=self.__url_config,
+                pool=pool,
             )
 
-        saved_file_path = self.save_file_from_zipped_bytes(
-            zipped_bytes, save_file_name
-        )
+        def install(hour: datetime) -> Tuple[str, int]:
+            save_file_path = retry.call(lambda: fetch(hour))
+            self.add_file(os.path.basename(save_file_path))
+            return os.path.basename(save_file_path), os.path.getsize(save_file_path)
 
-        return saved_file_path
+        with ConnectionPool(max_per_host=workers) as pool:
+            report = download_many(hours, install, workers)
+            ...
+
+        logger.info("%s", report)
+        for hour, error in report.failed.items():
+            logger.warning("Failed to download game ids of %s: %r", hour, error)
+            continue
+
+        return report
 
     """ Extract game id from html """
 
@@ -206,4 +318,73 @@ class GameIdDirectory(DirectoryManager):
             white_key,
         )
 
-    ...
\ No newline at end of file
+    def iter_game_id_records(
+            self, file_name: str,
+            white_key: Tuple[str] = WhiteKeyConfig.player_num_4
+    ) -> Iterator[GameIdRecord]:
+        """
+        Extract records of game id, lobby type, start time, players and scores
+        from html file, or zipped html file in chunks.
+        :param file_name: File name of html or zipped html file.
+        :param white_key: White key.
+        :return: Iterator of records.
+        """
+        return iter_game_id_records_from_file(
+            self.generate_save_file_path(file_name),
+            white_key,
+            self.__url_config.zip_tool,
+        )
+
+    def extract_game_ids_from_archive(
+            self,
+            archive_path: str,
+            white_key: Tuple[str] = WhiteKeyConfig.player_num_4,
+            workers: int = None,
+    ) -> Dict[str, List[str]]:
+        """
+        Extract game ids from yearly zip archive of zipped html files.
+        Members are decompressed in memory over process pool, and no html file is written.
+        :param archive_path: Path of yearly zip archive.
+        :param white_key: White key.
+        :param workers: Number of worker processes. CPU count if None.
+        :return: Game ids of each html file name.
+        """
+        return extract_game_ids_from_archive(
+            archive_path,
+            white_key,
+            self.__url_config,
+            self.__game_id_config,
+            workers,
+        )
+
+    """ Game id index """
+
+    __index: Union[GameIdIndex, None] = None
+    @property
+    def index(self) -> GameIdIndex:
+        """
+        Return game id index in save directory. Opened on first access.
+        :return: Game id index.
+        """
+        if self.__index is None:
+            self.__index = GameIdIndex(self.generate_save_file_path(INDEX_FILE_NAME))
+            ...
+        return self.__index
+
+    def update_index(self) -> int:
+        """
+        Index hour files that are new or changed since last update.
+        Directory is scanned again to find files added by others.
+        :return: Number of added game ids.
+        """
+        self.refresh()
+        return self.index.update(
+            (
+                self.generate_save_file_path(file_name)
+                for file_name in sorted(self.listdir())
+                if file_name.startswith(self.__url_config.table_key)
+            ),
+            self.__url_config.zip_tool,
+        )
+
+    ...
@@ -13,4 +13,13 @@ from .download import (
 
 from .parse import GameLogParser
 
+from .event import GameEvent
+
+from .meld import Meld, decode_meld, decode_melds
+
+from .replay import ReplayEngine
+
+# shanten functions are used from the submodule, whose name is same as a function
+from . import shanten
+
 from .manager import GameLogDirectory
@@ -0,0 +1,178 @@
+""" Columnar export module of TenhouAPI
+This file contains processes that convert game log into event columns.
+"""
+
+
+# types
+
+
+from typing import (
+    Dict, Iterable, Sequence, Any
+)
+
+
+# libs
+
+
+import re
+from array import array
+
+from ..config.game_log_tag import GameLogEventKind
+from .event import ID_TAG_KINDS, decode_named_tag
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+""" Column constants
+"""
+
+
+# array type codes of columns
+COLUMN_TYPES: Dict[str, str] = {
+    "kind": "b",
+    "actor": "b",
+    "tile": "h",
+    "round": "i",
+    "seq": "i",
+}
+
+# numpy dtypes of columns
+COLUMN_DTYPES: Dict[str, str] = {
+    "kind": "int8",
+    "actor": "int8",
+    "tile": "int16",
+    "round": "int32",
+    "seq": "int32",
+    "game": "int32",
+}
+
+ROUND_END_KINDS = (GameLogEventKind.AGARI, GameLogEventKind.RYUUKYOKU)
+
+
+""" Fill columns """
+
+
+def game_log_columns(
+        game_log_text: str,
+        tag_pattern: re.Pattern,
+) -> Dict[str, array]:
+    """
+    Scan game log once, and fill typed event columns.
+    The GO tag is skipped same as GameLogParser rounds.
+    :param game_log_text: String of game log text.
+    :param tag_pattern: Tag pattern of CompiledFileParser.
+    :return: Columns of kind, actor, tile, round and seq.
+    """
+
+    kinds = array(COLUMN_TYPES["kind"])
+    actors = array(COLUMN_TYPES["actor"])
+    tiles = array(COLUMN_TYPES["tile"])
+    rounds = array(COLUMN_TYPES["round"])
+
+    round_idx = 0
+
+    for id_name, tile_id, name, attrs_text in tag_pattern.findall(game_log_text):
+
+        # draw and discard tag
+        if id_name:
+            kind, actor = ID_TAG_KINDS[id_name]
+            tile = int(tile_id)
+
+        # normal tag
+        else:
+            if name == "GO": continue
+            kind, actor, tile = decode_named_tag(name, attrs_text)
+            ...
+
+        kinds.append(kind)
+        actors.append(actor)
+        tiles.append(tile)
+        rounds.append(round_idx)
+
+        if kind in ROUND_END_KINDS: round_idx += 1
+
+        continue
+
+    return {
+        "kind": kinds,
+        "actor": actors,
+        "tile": tiles,
+        "round": rounds,
+        "seq": array(COLUMN_TYPES["seq"], range(len(kinds))),
+    }
+
+
+def event_columns(game_logs: Iterable[Sequence[Any]]) -> Dict[str, array]:
+    """
+    Fill typed event columns from rounds of already parsed events.
+    Events are TagParser or GameEvent, which both have kind, actor and tile.
+    :param game_logs: Rounds of events.
+    :return: Columns of kind, actor, tile, round and seq.
+    """
+
+    kinds = array(COLUMN_TYPES["kind"])
+    actors = array(COLUMN_TYPES["actor"])
+    tiles = array(COLUMN_TYPES["tile"])
+    rounds = array(COLUMN_TYPES["round"])
+
+    for round_idx, game_log in enumerate(game_logs):
+        for event in game_log:
+            kinds.append(event.kind)
+            actors.append(event.actor)
+            tiles.append(event.tile)
+            continue
+        rounds.extend([round_idx] * len(game_log))
+        continue
+
+    return {
+        "kind": kinds,
+        "actor": actors,
+        "tile": tiles,
+        "round": rounds,
+        "seq": array(COLUMN_TYPES["seq"], range(len(kinds))),
+    }
+
+
+def concat_columns(games_columns: Iterable[Dict[str, array]]) -> Dict[str, array]:
+    """
+    Concatenate columns of games, and add game index column.
+    :param games_columns: Columns of each game.
+    :return: Concatenated columns.
+    """
+
+    result = {key: array(type_code) for key, type_code in COLUMN_TYPES.items()}
+    result["game"] = array("i")
+
+    for game_idx, columns in enumerate(games_columns):
+        for key, column in columns.items():
+            result[key].extend(column)
+            continue
+        result["game"].extend([game_idx] * len(columns["kind"]))
+        continue
+
+    return result
+
+
+""" Convert to numpy """
+
+
+def to_numpy(columns: Dict[str, array]) -> Dict[str, Any]:
+    """
+    Convert typed columns to numpy arrays without copying.
+    :param columns: Columns to convert.
+    :return: numpy arrays of columns.
+    """
+    if numpy is None:
+        raise ImportError(
+            "numpy is required for array export. Install TenhouAPI[numpy]."
+        )
+    return {
+        key: (
+            numpy.frombuffer(column, dtype=COLUMN_DTYPES[key])
+            if len(column) else numpy.empty(0, dtype=COLUMN_DTYPES[key])
+        )
+        for key, column in columns.items()
+    }
@@ -8,9 +8,14 @@
 # libs
 
 
+import os
 from time import sleep
 
-from ..util.download import download
+from ..util import metrics
+from ..util.directory_manager import make_temp_file
+from ..util.download import download, ConnectionPool
+from ..util.metrics import logger
+from ..util.retry import RetryPolicy
 
 from ..config.tenhou_url import TenhouUrlConfig
 
@@ -26,26 +31,32 @@ def download_game_log(
         game_id: str,
         sleep_time: float = 5,
         url_config: TenhouUrlConfig = TenhouUrlConfig(),
+        pool: ConnectionPool = None,
+        retry: RetryPolicy = None,
 ) -> bytes:
     """
     Download game log from tenhou.
     :param game_id: Game id to download.
     :param sleep_time: Sleep time.
     :param url_config: URL config.
+    :param pool: Keep-alive connection pool. Requested by urllib if None.
+    :param retry: Retry policy of failed request. Not retried if None.
     :return: Downloaded game log bytes.
     """
 
     # gen url
-    game_log_url = url_config.generate_game_log_url(url_config, game_id)
+    game_log_url = url_config.generate_game_log_url(game_id)
 
     # download
     header = {"User-Agent": "Mozilla/5.0"}
 
-    print("Downloading: {url}".format(url=game_log_url))
+    logger.debug("Downloading: %s", game_log_url)
 
-    result = download(game_log_url, headers=header)
+    result = download(game_log_url, headers=header, pool=pool, retry=retry)
 
-    sleep(sleep_time)
+    with metrics.timer(metrics.SLEEP_TIME):
+        sleep(sleep_time)
+        ...
 
     return result
 
@@ -64,11 +75,20 @@ def save_game_log(
     :return: Saved game log file path.
     """
 
-    print("Building game log file: {path}".format(path=file_path))
-
-    # make and write game log file.
-    with open(file_path, "wb") as f_mjlog:
-        f_mjlog.write(bytes_data)
+    logger.debug("Building game log file: %s", file_path)
+
+    # write hidden temporary file and rename, so that crash leaves no truncated game log.
+    with metrics.timer(metrics.WRITE_TIME):
+        fd, temp_path = make_temp_file(file_path)
+        try:
+            with os.fdopen(fd, "wb") as f_mjlog:
+                f_mjlog.write(bytes_data)
+                ...
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
         ...
+    metrics.increment(metrics.BYTES_WRITTEN, len(bytes_data))
 
     return file_path
@@ -0,0 +1,245 @@
+""" Compact event module of TenhouAPI
+This file contains compact event object of game log.
+"""
+
+
+# types
+
+
+from typing import (
+    Tuple, Dict, Union, Sequence
+)
+
+
+# libs
+
+
+import re
+from array import array
+from ..config.game_log_tag import DisplayGameLogTag, GameLogEventKind
+from .meld import Meld, decode_meld
+
+
+""" Event constants
+"""
+
+
+# display tag of each event kind
+EVENT_KIND_TAGS: Tuple[str, ...] = (
+    DisplayGameLogTag.GO,
+    DisplayGameLogTag.INIT,
+    DisplayGameLogTag.OPEN_DORA,
+    DisplayGameLogTag.P0_DRAW,
+    DisplayGameLogTag.P1_DRAW,
+    DisplayGameLogTag.P2_DRAW,
+    DisplayGameLogTag.P3_DRAW,
+    DisplayGameLogTag.P0_DISCARD,
+    DisplayGameLogTag.P1_DISCARD,
+    DisplayGameLogTag.P2_DISCARD,
+    DisplayGameLogTag.P3_DISCARD,
+    DisplayGameLogTag.NAKI,
+    DisplayGameLogTag.REACH,
+    DisplayGameLogTag.AGARI,
+    DisplayGameLogTag.RYUUKYOKU,
+)
+
+# event kind of each display tag
+TAG_EVENT_KINDS: Dict[str, int] = {
+    tag: kind for kind, tag in enumerate(EVENT_KIND_TAGS)
+}
+
+# (kind, actor) of draw and discard tags
+ID_TAG_KINDS: Dict[str, Tuple[int, int]] = {
+    "T": (GameLogEventKind.P0_DRAW, 0),
+    "U": (GameLogEventKind.P1_DRAW, 1),
+    "V": (GameLogEventKind.P2_DRAW, 2),
+    "W": (GameLogEventKind.P3_DRAW, 3),
+    "D": (GameLogEventKind.P0_DISCARD, 0),
+    "E": (GameLogEventKind.P1_DISCARD, 1),
+    "F": (GameLogEventKind.P2_DISCARD, 2),
+    "G": (GameLogEventKind.P3_DISCARD, 3),
+}
+
+# kind of other tags
+NAMED_TAG_KINDS: Dict[str, int] = {
+    "GO": GameLogEventKind.GO,
+    "INIT": GameLogEventKind.INIT,
+    "DORA": GameLogEventKind.OPEN_DORA,
+    "N": GameLogEventKind.NAKI,
+    "REACH": GameLogEventKind.REACH,
+    "AGARI": GameLogEventKind.AGARI,
+    "RYUUKYOKU": GameLogEventKind.RYUUKYOKU,
+}
+
+# attribute that holds tile id of each kind
+TILE_ATTRS: Dict[int, str] = {
+    GameLogEventKind.OPEN_DORA: "hai",
+    GameLogEventKind.AGARI: "machi",
+}
+
+TILE_ATTR_PATTERNS: Dict[int, re.Pattern] = {
+    kind: re.compile(rf'(?:^|\s){key}="(\d+)"')
+    for kind, key in TILE_ATTRS.items()
+}
+
+WHO_PATTERN: re.Pattern = re.compile(r'(?:^|\s)who="(\d+)"')
+
+MELD_PATTERN: re.Pattern = re.compile(r'(?:^|\s)m="(\d+)"')
+
+ATTR_PATTERN: re.Pattern = re.compile(r'(\w+)="([^"]*)"')
+
+
+""" Decode tag values """
+
+
+def decode_named_tag(name: str, attrs_text: str) -> Tuple[int, int, int]:
+    """
+    Decode kind, actor and tile id of tag other than draw and discard.
+    :param name: Tag name in game log.
+    :param attrs_text: Raw attribute text of tag.
+    :return: kind, actor and tile id. actor and tile are -1 if missing.
+    """
+    kind = NAMED_TAG_KINDS[name]
+
+    who = WHO_PATTERN.search(attrs_text)
+    actor = -1 if who is None else int(who.group(1))
+
+    tile = -1
+    if kind in TILE_ATTR_PATTERNS:
+        tile_match = TILE_ATTR_PATTERNS[kind].search(attrs_text)
+        if tile_match is not None: tile = int(tile_match.group(1))
+        ...
+
+    return kind, actor, tile
+
+
+""" Compact event class """
+
+
+class GameEvent:
+    """
+    Compact event of game log.
+    kind is GameLogEventKind value, actor is player index and tile is tile id.
+    actor and tile are -1 if the event does not have them.
+    """
+
+    __slots__ = ("kind", "actor", "tile", "attrs_text")
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            kind: int,
+            actor: int = -1,
+            tile: int = -1,
+            attrs_text: Union[str, None] = None,
+    ) -> None:
+        """
+        Assign event values.
+        :param kind: GameLogEventKind value.
+        :param actor: Player index.
+        :param tile: Tile id.
+        :param attrs_text: Raw attribute text of tag.
+        """
+        self.kind = kind
+        self.actor = actor
+        self.tile = tile
+        self.attrs_text = attrs_text
+        return
+
+    @classmethod
+    def from_tokens(cls, name: str, attrs_text: str) -> "GameEvent":
+        """
+        Build event from tag name and raw attribute text.
+        :param name: Tag name in game log.
+        :param attrs_text: Raw attribute text of tag.
+        :return: Event instance.
+        """
+
+        # draw and discard tag
+        if name in ID_TAG_KINDS:
+            kind, actor = ID_TAG_KINDS[name]
+            return cls(kind, actor, int(attrs_text))
+
+        # normal tag
+        return cls(*decode_named_tag(name, attrs_text), attrs_text)
+
+    def __str__(self):
+        return EVENT_KIND_TAGS[self.kind]
+
+    def __repr__(self):
+        return "{class_name}({kind}, {actor}, {tile})".format(
+            class_name=self.__class__.__name__,
+            kind=self.kind, actor=self.actor, tile=self.tile,
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, GameEvent):
+            return self.kind == other.kind
+        elif isinstance(other, str):
+            return EVENT_KIND_TAGS[self.kind] == other
+        return False
+
+    """ Derived views """
+
+    @property
+    def tag(self) -> str: return EVENT_KIND_TAGS[self.kind]
+
+    @property
+    def attrs(self) -> Dict[str, str]:
+        """
+        Return attributes of tag like TagParser.attrs.
+        :return: Attributes of tag.
+        """
+        if self.attrs_text is None:
+            return {"id": str(self.tile)}
+        return dict(ATTR_PATTERN.findall(self.attrs_text))
+
+    @property
+    def info(self) -> Tuple[str, Dict[str, str]]: return self.tag, self.attrs
+
+    @property
+    def meld(self) -> Union[Meld, None]:
+        """
+        Return decoded meld of N tag.
+        :return: Decoded meld. None if not N tag.
+        """
+        if self.kind != GameLogEventKind.NAKI: return None
+        return decode_meld(MELD_PATTERN.search(self.attrs_text).group(1))
+
+    """ Compact pickling """
+
+    def __reduce__(self):
+        return self.__class__, (self.kind, self.actor, self.tile, self.attrs_text)
+
+    @staticmethod
+    def pack_events(
+            events: Sequence["GameEvent"]
+    ) -> Tuple[bytes, bytes, bytes, Tuple[Union[str, None], ...]]:
+        """
+        Pack events into typed columns for pickling.
+        :param events: Events to pack.
+        :return: Packed events.
+        """
+        return (
+            array("b", [event.kind for event in events]).tobytes(),
+            array("b", [event.actor for event in events]).tobytes(),
+            array("h", [event.tile for event in events]).tobytes(),
+            tuple(event.attrs_text for event in events),
+        )
+
+    @classmethod
+    def unpack_events(
+            cls, packed: Tuple[bytes, bytes, bytes, Tuple[Union[str, None], ...]]
+    ) -> Tuple["GameEvent", ...]:
+        """
+        Unpack events packed by pack_events.
+        :param packed: Packed events.
+        :return: Events.
+        """
+        kinds, actors, tiles, attrs_texts = packed
+        return tuple(map(
+            cls, array("b", kinds), array("b", actors), array("h", tiles), attrs_texts
+        ))
+
+    ...
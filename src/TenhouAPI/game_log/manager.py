@@ -7,6 +7,12 @@
 
 from typing import (
     Union,
+    Tuple,
+    List,
+    Iterator,
+    Iterable,
+    Dict,
+    Any,
 )
 
 
@@ -14,19 +20,97 @@ from typing import (
 
 
 import os.path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 
 from ..config.tenhou_url import TenhouUrlConfig
 
 from ..util.directory_manager import DirectoryManager
+from ..util.cache import LRUCache, file_stamp
+from ..util.download import ConnectionPool, DownloadReport, download_many
+from ..util.rate_limit import TokenBucket
+from ..util.retry import RetryPolicy
+from ..util.journal import DownloadJournal, DONE, PENDING, IN_FLIGHT, FAILED
+from ..util.pack import PackStore
+from ..util.metrics import logger
 
 from .download import download_game_log, save_game_log
-from .parse import GameLogParser
+from .parse import (
+    GameLogParser, FileParser, CompiledFileParser, CompactFileParser, TagParser
+)
+from .columns import concat_columns, to_numpy
+from .event import GameEvent
 
 
 """ Game logs directory manager
 """
 
 
+# hidden file name of download journal in save directory
+JOURNAL_FILE_NAME: str = ".download_journal.sqlite3"
+
+# hidden directory name of pack store in save directory
+PACK_DIR_NAME: str = ".pack"
+
+
+# estimated bytes of one parsed event
+EVENT_BYTES: Dict[type, int] = {
+    TagParser: 320,
+    GameEvent: 72,
+}
+
+
+def estimate_game_log_bytes(parser: GameLogParser) -> int:
+    """
+    Estimate memory of parsed game log from its event count.
+    Use as size_of of LRUCache.
+    :param parser: Parsed game log.
+    :return: Estimated bytes.
+    """
+    event_count = sum(map(len, parser))
+    if event_count == 0: return 0
+    return event_count * EVENT_BYTES.get(type(parser[0][0]), EVENT_BYTES[TagParser])
+
+
+def parse_game_logs(
+        game_log_file_paths: List[str],
+        file_parser: type[FileParser],
+) -> Tuple[GameLogParser, ...]:
+    """
+    Parse chunk of game logs in worker process.
+    :param game_log_file_paths: File paths of game logs.
+    :param file_parser: FileParser class.
+    :return: Game log parsers.
+    """
+    return tuple(
+        GameLogParser(game_log_file_path, file_parser)
+        for game_log_file_path in game_log_file_paths
+    )
+
+
+def parse_packed_game_logs(
+        pack_dir: str,
+        file_names: List[str],
+        file_parser: type[FileParser],
+) -> Tuple[GameLogParser, ...]:
+    """
+    Parse chunk of game logs stored in pack in worker process.
+    Pack store is opened for the chunk, and closed before return.
+    :param pack_dir: Directory of pack store.
+    :param file_names: Game log names in pack.
+    :param file_parser: FileParser class.
+    :return: Game log parsers.
+    """
+    with PackStore(pack_dir) as pack:
+        return tuple(
+            GameLogParser.from_text(
+                pack.get(file_name).decode("utf-8"), file_parser, file_name
+            )
+            for file_name in file_names
+        )
+
+
 class GameLogDirectory(DirectoryManager):
     """ Manage directory of game logs """
 
@@ -40,32 +124,175 @@ class GameLogDirectory(DirectoryManager):
             self,
             save_dir: str = os.path.join("../util", "dist", "game_logs"),
             url_config: TenhouUrlConfig = __url_config(),
+            cache: LRUCache = None,
+            pack: bool = False,
+            segment_size: int = 1 << 30,
     ) -> None:
         """
         Assign directory that downloads game log files.
         :param save_dir: Directory path to save game log files.
         :param url_config: URL config.
+        :param cache: Cache of parsed game logs. Not cached if None.
+        :param pack: Save game logs in segment files of pack store instead of files if True.
+        :param segment_size: Size of pack segment file.
         """
         DirectoryManager.__init__(self, save_dir)
         self.__url_config = url_config
+        self.__cache = cache
+        if pack:
+            self.__pack = PackStore(
+                self.generate_save_file_path(PACK_DIR_NAME), segment_size
+            )
+            ...
+        return
+
+    def __enter__(self) -> "GameLogDirectory": return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
         return
 
+    def close(self) -> None:
+        """
+        Close pack store and download journal.
+        Journal is opened again on next access.
+        :return: None
+        """
+        if self.__pack is not None:
+            self.__pack.close()
+            ...
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+            ...
+        return
+
+    """ Parse cache """
+
+    __cache: Union[LRUCache, None] = None
+    @property
+    def cache(self) -> Union[LRUCache, None]: return self.__cache
+
+    """ Download journal """
+
+    __journal: Union[DownloadJournal, None] = None
+    @property
+    def journal(self) -> DownloadJournal:
+        """
+        Return download journal in save directory. Opened on first access.
+        :return: Download journal.
+        """
+        if self.__journal is None:
+            self.__journal = DownloadJournal(
+                self.generate_save_file_path(JOURNAL_FILE_NAME)
+            )
+            ...
+        return self.__journal
+
+    """ Pack store """
+
+    __pack: Union[PackStore, None] = None
+    @property
+    def pack(self) -> Union[PackStore, None]: return self.__pack
+
+    def migrate_to_pack(self, remove: bool = True, batch_size: int = 256) -> int:
+        """
+        Move game log files in save directory into pack store.
+        Files are removed after their batch is indexed, so interrupted migration can be run again.
+        :param remove: Remove migrated files if True.
+        :param batch_size: Number of files indexed in one transaction.
+        :return: Number of migrated files.
+        """
+        if self.__pack is None:
+            raise ValueError("pack store is not enabled.")
+
+        self.refresh()
+        file_names = DirectoryManager.listdir(self)
+        for start in range(0, len(file_names), batch_size):
+            batch = file_names[start:start + batch_size]
+            items = []
+            for file_name in batch:
+                with open(self.generate_save_file_path(file_name), "rb") as f:
+                    items.append((file_name, f.read()))
+                    ...
+                continue
+            self.__pack.put_many(items)
+
+            if not remove: continue
+            for file_name in batch:
+                os.remove(self.generate_save_file_path(file_name))
+                self.discard_file(file_name)
+                continue
+            continue
+
+        return len(file_names)
+
+    """ Stored game logs """
+
+    def listdir(self) -> List[str]:
+        """
+        List game log names of files and pack store.
+        :return: Game log names.
+        """
+        file_names = DirectoryManager.listdir(self)
+        if self.__pack is None: return file_names
+        return sorted(set(file_names).union(self.__pack.keys()))
+
+    def stored_size(self, file_name: str) -> Union[int, None]:
+        """
+        Return byte size of stored game log.
+        :param file_name: Game log name.
+        :return: Byte size. None if not stored.
+        """
+        if self.__pack is not None:
+            location = self.__pack.locate(file_name)
+            if location is not None: return location[2]
+
+        if not DirectoryManager.exists(self, file_name): return None
+        return os.path.getsize(self.generate_save_file_path(file_name))
+
+    def exists(self, file_name: str) -> bool:
+        """
+        Return whether game log is stored in file or pack store.
+        :param file_name: Game log name.
+        :return: True if stored.
+        """
+        if self.__pack is not None and file_name in self.__pack: return True
+        return DirectoryManager.exists(self, file_name)
+
+    def read_text(self, file_name: str) -> str:
+        """
+        Read game log text from pack store or file.
+        :param file_name: Game log name.
+        :return: Game log text.
+        """
+        if self.__pack is not None and file_name in self.__pack:
+            return self.__pack.get(file_name).decode("utf-8")
+        return FileParser.read(self.generate_save_file_path(file_name))
+
     """ Save game log file """
 
     def save_game_log(self, bytes_data: bytes, file_name: str) -> str:
         """
-        Build and save game log file.
+        Build and save game log file, or append it to pack store if enabled.
         :param bytes_data: Bytes data of game log.
         :param file_name: File name to generate.
-        :return: Generated file path.
+        :return: Generated file path. File name if saved in pack store.
         """
 
+        """ Save in pack """
+
+        if self.__pack is not None:
+            self.__pack.put(file_name, bytes_data)
+            return file_name
+
         """ Save file """
 
         file_path = save_game_log(
             bytes_data,
             self.generate_save_file_path(file_name),
         )
+        self.add_file(file_name)
 
         return file_path
 
@@ -83,10 +310,13 @@ class GameLogDirectory(DirectoryManager):
         :return: Saved file path.
         """
 
+        if file_name is None:
+            file_name = game_id
+
         """ check file exists """
 
-        if os.path.exists(self.generate_save_file_path(file_name)):
-            print("File {file_name} already exists".format(file_name=file_name))
+        if self.exists(file_name):
+            logger.info("File %s already exists", file_name)
             return file_name
 
         """ Download """
@@ -99,25 +329,306 @@ class GameLogDirectory(DirectoryManager):
 
         """ Install """
 
-        if file_name is None:
-            file_name = game_id
-
         saved_file_path = self.save_game_log(
             bytes_, file_name
         )
 
         return saved_file_path
 
+    def download_and_install_many(
+            self,
+            game_ids: Iterable[str],
+            workers: int = 4,
+            rate: float = 1.0,
+            burst: int = 1,
+            rate_limiter: TokenBucket = None,
+            retry: RetryPolicy = None,
+            use_journal: bool = True,
+    ) -> DownloadReport:
+        """
+        Download and install game logs concurrently.
+        Requests of all workers share token bucket of rate per second
+        instead of sleeping after each request, and keep-alive connection pool
+        of workers connections.
+        Failed requests are retried with exponential backoff and jitter.
+        State of each game id is recorded in download journal, and game ids
+        done in journal are skipped without checking file.
+        Other game logs that already exist are skipped without request.
+        Game ids are read and journaled in batches, so they can be long iterator.
+        :param game_ids: Game ids to download. Saved as file name of game id.
+        :param workers: Number of concurrent downloads.
+        :param rate: Requests per second of all workers.
+        :param burst: Max requests sent at once.
+        :param rate_limiter: Shared rate limiter. Overrides rate and burst.
+        :param retry: Retry policy. Default RetryPolicy if None.
+        :param use_journal: Record and resume by download journal if True.
+        :return: Report of saved file paths, skipped and failed game ids, and throughput.
+        """
+        if rate_limiter is None:
+            rate_limiter = TokenBucket(rate, burst)
+            ...
+        if retry is None:
+            retry = RetryPolicy()
+            ...
+
+        # journal states of game ids read ahead, recorded before they are added
+        journal = self.journal if use_journal else None
+        states: Dict[str, str] = {}
+        if journal is not None:
+            game_ids = self.__journal_batches(journal, game_ids, states)
+            ...
+
+        def fetch(game_id: str) -> bytes:
+            if journal is not None: journal.start(game_id)
+            rate_limiter.acquire()
+            return download_game_log(
+                game_id,
+                sleep_time=0,
+                url_config=self.__url_config,
+                pool=pool,
+            )
+
+        def install(game_id: str) -> Union[Tuple[str, int], None]:
+            state = states.pop(game_id, None)
+            if state == DONE: return None
+
+            # stored game logs of game ids unknown to journal are checked
+            if state is None:
+                size = self.stored_size(game_id)
+                if size is not None:
+                    if journal is not None: journal.done(game_id, size)
+                    return None
+
+            try:
+                bytes_ = retry.call(lambda: fetch(game_id))
+            except Exception as error:
+                if journal is not None: journal.fail(game_id, error)
+                raise
+
+            try:
+                saved_file_path = self.save_game_log(bytes_, game_id)
+            except Exception as error:
+                if journal is not None: journal.fail(game_id, error)
+                raise
+            if journal is not None: journal.done(game_id, len(bytes_))
+
+            return saved_file_path, len(bytes_)
+
+        with ConnectionPool(max_per_host=workers) as pool:
+            report = download_many(game_ids, install, workers)
+            ...
+
+        logger.info("%s", report)
+
+        return report
+
+    @staticmethod
+    def __journal_batches(
+            journal: DownloadJournal,
+            game_ids: Iterable[str],
+            states: Dict[str, str],
+            batch_size: int = 256,
+    ) -> Iterator[str]:
+        """
+        Yield game ids, and record each batch of them as pending before yielding it.
+        Recorded states of batch are put in states until install pops them.
+        :return: Iterator of game ids.
+        """
+        iterator = iter(game_ids)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch: return
+            states.update(journal.states(batch))
+            journal.add(batch)
+            yield from batch
+            continue
+
+    def resume_downloads(
+            self,
+            workers: int = 4,
+            rate: float = 1.0,
+            burst: int = 1,
+            rate_limiter: TokenBucket = None,
+            retry: RetryPolicy = None,
+    ) -> DownloadReport:
+        """
+        Download game ids of journal that are not done,
+        such as left by crashed run or failed.
+        :param workers: Number of concurrent downloads.
+        :param rate: Requests per second of all workers.
+        :param burst: Max requests sent at once.
+        :param rate_limiter: Shared rate limiter. Overrides rate and burst.
+        :param retry: Retry policy. Default RetryPolicy if None.
+        :return: Report of downloads.
+        """
+        return self.download_and_install_many(
+            sorted(self.journal.keys(PENDING, IN_FLIGHT, FAILED)),
+            workers=workers,
+            rate=rate,
+            burst=burst,
+            rate_limiter=rate_limiter,
+            retry=retry,
+        )
+
     """ Parse game log """
 
-    def parse(self, file_name: str) -> GameLogParser:
+    def parse(
+            self,
+            file_name: str,
+            file_parser: type[FileParser] = FileParser,
+    ) -> GameLogParser:
         """
         Return game log parser.
+        Parsed result is reused while the file is not changed if cache is set.
         :param file_name: Game log name to parse.
+        :param file_parser: FileParser class.
         :return: Game log parser.
         """
-        return GameLogParser(
-            self.generate_save_file_path(file_name)
+        file_path = self.generate_save_file_path(file_name)
+
+        # pack
+        location = None if self.__pack is None else self.__pack.locate(file_name)
+        if location is not None:
+            def load() -> GameLogParser:
+                return GameLogParser.from_text(
+                    self.__pack.read_at(*location).decode("utf-8"), file_parser, file_name
+                )
+            stamp = location
+        else:
+            def load() -> GameLogParser:
+                return GameLogParser(file_path, file_parser)
+            stamp = None
+
+        if self.__cache is None:
+            return load()
+
+        return self.__cache.get_or_load(
+            (file_path, file_parser),
+            file_stamp(file_path) if stamp is None else stamp,
+            load,
         )
 
+    def parse_many(
+            self,
+            file_names: Iterable[str] = None,
+            workers: int = None,
+            file_parser: type[FileParser] = CompactFileParser,
+            ordered: bool = True,
+            chunk_size: int = 16,
+    ) -> Iterator[GameLogParser]:
+        """
+        Parse game logs over process pool.
+        Parsers are sent back packed, and unpack their rounds on first access.
+        Game logs in pack store are read in workers through their own pack store.
+        At most twice of workers tasks are submitted at once, so parsers do not pile up
+        ahead of the consumer. Worker processes are shut down when iterator is exhausted
+        or closed, so close iterator stopped early, such as by contextlib.closing.
+        :param file_names: Game log names to parse. All files if None.
+        :param workers: Number of worker processes. CPU count if None.
+        :param file_parser: FileParser class. CompactFileParser is cheapest to send.
+        :param ordered: Yield in order of file_names if True, else as completed.
+        :param chunk_size: Number of game logs parsed per task.
+        :return: Iterator of game log parsers.
+        """
+        if file_names is None:
+            file_names = self.listdir()
+            ...
+
+        # tasks of files and pack
+        file_names = list(file_names)
+        packed = set() if self.__pack is None else set(self.__pack.keys())
+        tasks = []
+        for start in range(0, len(file_names), chunk_size):
+            chunk = file_names[start:start + chunk_size]
+            if all(file_name in packed for file_name in chunk):
+                tasks.append((parse_packed_game_logs, (self.__pack.directory, chunk, file_parser)))
+            elif not any(file_name in packed for file_name in chunk):
+                tasks.append((parse_game_logs, (
+                    [self.generate_save_file_path(file_name) for file_name in chunk], file_parser
+                )))
+            else:
+                tasks.extend(
+                    (parse_packed_game_logs, (self.__pack.directory, [file_name], file_parser))
+                    if file_name in packed else
+                    (parse_game_logs, ([self.generate_save_file_path(file_name)], file_parser))
+                    for file_name in chunk
+                )
+            continue
+
+        workers = workers or os.cpu_count() or 1
+        max_pending = 2 * workers
+        executor = ProcessPoolExecutor(max_workers=workers)
+        tasks = iter(tasks)
+        try:
+            pending = deque(
+                executor.submit(task, *args) for task, args in islice(tasks, max_pending)
+            )
+
+            # in order
+            if ordered:
+                while pending:
+                    parsers = pending.popleft().result()
+                    for task, args in islice(tasks, 1):
+                        pending.append(executor.submit(task, *args))
+                        continue
+                    yield from parsers
+                    continue
+                return
+
+            # as completed
+            pending = set(pending)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for task, args in islice(tasks, len(done)):
+                    pending.add(executor.submit(task, *args))
+                    continue
+                for future in done:
+                    yield from future.result()
+                    continue
+                continue
+        finally:
+            # stopped iteration does not wait for tasks not started
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return
+
+    def iter_rounds(
+            self,
+            file_name: str,
+            file_parser: type[FileParser] = FileParser,
+    ) -> Iterator[Tuple[TagParser, ...]]:
+        """
+        Parse game log lazily, and yield rounds.
+        :param file_name: Game log name to parse.
+        :param file_parser: FileParser class.
+        :return: Iterator of rounds.
+        """
+        if self.__pack is not None and file_name in self.__pack:
+            return GameLogParser.split_rounds(file_parser.iter_tags(self.read_text(file_name)))
+
+        return GameLogParser.iter_rounds(
+            self.generate_save_file_path(file_name),
+            file_parser,
+        )
+
+    """ Columnar export """
+
+    def to_arrays(self, file_names: Iterable[str] = None) -> Dict[str, Any]:
+        """
+        Return numpy event columns of game logs.
+        Columns are same as GameLogParser.to_arrays with game (int32) column.
+        :param file_names: Game log names. All files if None.
+        :return: Event columns.
+        """
+        if file_names is None:
+            file_names = self.listdir()
+            ...
+
+        columns = concat_columns(
+            CompiledFileParser.columns(self.read_text(file_name))
+            for file_name in file_names
+        )
+
+        return to_numpy(columns)
+
     ...
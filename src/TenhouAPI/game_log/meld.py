@@ -0,0 +1,242 @@
+""" Meld decode module of TenhouAPI
+This file contains processes that decode "m" attribute of N tag.
+"""
+
+
+# types
+
+
+from typing import (
+    Tuple, Dict, List, Iterable, Union, Any
+)
+
+
+# libs
+
+
+from array import array
+from ..config.game_log_tag import MeldType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+""" Meld constants
+"""
+
+
+MELD_CODE_SIZE: int = 1 << 16
+
+MELD_TYPE_NAMES: Tuple[str, ...] = ("chi", "pon", "kan", "kakan", "nuki")
+
+# array type codes of meld columns
+MELD_COLUMN_TYPES: Dict[str, str] = {
+    "type": "b",
+    "called_tile": "h",
+    "from_who": "b",
+}
+
+
+""" Meld class """
+
+
+class Meld:
+    """
+    Decoded meld of N tag.
+    type is MeldType value, tiles are tile ids of meld, called_tile is
+    tile id taken from other player (added tile is the last of tiles in kakan),
+    and from_who is relative seat called from (0: self, 1: next, 2: across, 3: previous).
+    """
+
+    __slots__ = ("code", "type", "called_tile", "tiles", "from_who")
+
+    def __init__(
+            self,
+            code: int,
+            type_: int,
+            called_tile: int,
+            tiles: Tuple[int, ...],
+            from_who: int,
+    ) -> None:
+        """
+        Assign meld values.
+        :param code: "m" attribute code.
+        :param type_: MeldType value.
+        :param called_tile: Called tile id.
+        :param tiles: Tile ids of meld.
+        :param from_who: Relative seat called from.
+        """
+        self.code = code
+        self.type = type_
+        self.called_tile = called_tile
+        self.tiles = tiles
+        self.from_who = from_who
+        return
+
+    @property
+    def type_name(self) -> str: return MELD_TYPE_NAMES[self.type]
+
+    @property
+    def is_closed(self) -> bool:
+        return self.type == MeldType.KAN and self.from_who == 0
+
+    def called_from(self, who: int) -> int:
+        """
+        Return absolute seat called from.
+        :param who: Seat of player who called.
+        :return: Seat of player called from.
+        """
+        return (who + self.from_who) % 4
+
+    def __repr__(self):
+        return "{class_name}({type}, called_tile={called_tile}, tiles={tiles}, from_who={from_who})".format(
+            class_name=self.__class__.__name__,
+            type=self.type_name,
+            called_tile=self.called_tile,
+            tiles=self.tiles,
+            from_who=self.from_who,
+        )
+
+    ...
+
+
+""" Decode by bits """
+
+
+def decode_meld_bits(code: int) -> Union[Meld, None]:
+    """
+    Decode "m" attribute code by bit operations.
+    Used to build lookup table.
+    :param code: "m" attribute code.
+    :return: Decoded meld. None if code is invalid.
+    """
+    from_who = code & 3
+
+    # chi
+    if code & 0x0004:
+        base_and_called = code >> 10
+        called = base_and_called % 3
+        base = base_and_called // 3
+        if base > 20: return None
+        base = base // 7 * 9 + base % 7
+        tiles = tuple(
+            (base + i) * 4 + ((code >> (3 + 2 * i)) & 3)
+            for i in range(3)
+        )
+        return Meld(code, MeldType.CHI, tiles[called], tiles, from_who)
+
+    # pon and kakan
+    if code & 0x0018:
+        unused = (code >> 5) & 3
+        base_and_called = code >> 9
+        called = base_and_called % 3
+        base = base_and_called // 3
+        if base > 33: return None
+        tiles = tuple(base * 4 + i for i in range(4) if i != unused)
+        if code & 0x0008:
+            return Meld(code, MeldType.PON, tiles[called], tiles, from_who)
+        return Meld(
+            code, MeldType.KAKAN, tiles[called], tiles + (base * 4 + unused,), from_who
+        )
+
+    # nuki
+    if code & 0x0020:
+        tile = code >> 8
+        if tile > 135: return None
+        return Meld(code, MeldType.NUKI, tile, (tile,), from_who)
+
+    # kan
+    called_tile = code >> 8
+    if called_tile > 135: return None
+    base = called_tile // 4 * 4
+    tiles = (base, base + 1, base + 2, base + 3)
+    return Meld(code, MeldType.KAN, called_tile, tiles, from_who)
+
+
+""" Lookup table """
+
+
+_meld_table: Union[List[Union[Meld, None]], None] = None
+_meld_columns: Union[Dict[str, array], None] = None
+
+
+def meld_table() -> List[Union[Meld, None]]:
+    """
+    Return lookup table of all "m" codes. Built on first call.
+    :return: Decoded meld indexed by code.
+    """
+    global _meld_table
+    if _meld_table is None:
+        _meld_table = [decode_meld_bits(code) for code in range(MELD_CODE_SIZE)]
+        ...
+    return _meld_table
+
+
+def meld_table_columns() -> Dict[str, array]:
+    """
+    Return lookup table of all "m" codes as typed columns. Built on first call.
+    Invalid codes are -1.
+    :return: Columns of type, called_tile and from_who indexed by code.
+    """
+    global _meld_columns
+    if _meld_columns is None:
+        table = meld_table()
+        _meld_columns = {
+            "type": array(MELD_COLUMN_TYPES["type"], (
+                -1 if meld is None else meld.type for meld in table
+            )),
+            "called_tile": array(MELD_COLUMN_TYPES["called_tile"], (
+                -1 if meld is None else meld.called_tile for meld in table
+            )),
+            "from_who": array(MELD_COLUMN_TYPES["from_who"], (
+                -1 if meld is None else meld.from_who for meld in table
+            )),
+        }
+        ...
+    return _meld_columns
+
+
+""" Decode functions """
+
+
+def decode_meld(code: Union[int, str]) -> Union[Meld, None]:
+    """
+    Decode "m" attribute code by lookup table.
+    :param code: "m" attribute code.
+    :return: Decoded meld. None if code is invalid.
+    """
+    return meld_table()[int(code)]
+
+
+def decode_melds(codes: Iterable[int]) -> Tuple[Union[Meld, None], ...]:
+    """
+    Decode "m" attribute codes by lookup table.
+    :param codes: "m" attribute codes.
+    :return: Decoded melds.
+    """
+    return tuple(map(meld_table().__getitem__, map(int, codes)))
+
+
+def meld_columns(codes: Any) -> Dict[str, Any]:
+    """
+    Decode "m" attribute codes into typed columns by lookup table.
+    numpy array of codes is decoded by fancy indexing into numpy columns.
+    :param codes: "m" attribute codes.
+    :return: Columns of type, called_tile and from_who.
+    """
+    columns = meld_table_columns()
+
+    # vectorized
+    if numpy is not None and isinstance(codes, numpy.ndarray):
+        return {
+            key: numpy.frombuffer(column, dtype=column.typecode)[codes]
+            for key, column in columns.items()
+        }
+
+    codes = list(map(int, codes))
+    return {
+        key: array(column.typecode, map(column.__getitem__, codes))
+        for key, column in columns.items()
+    }
@@ -7,7 +7,7 @@ This file contains processes that parse game log.
 
 
 from typing import (
-    Set, Tuple, List, Dict, Iterator
+    Set, Tuple, List, Dict, Iterator, Iterable, Sequence, Union, Any
 )
 
 
@@ -15,7 +15,14 @@ from typing import (
 
 
 import re
+from array import array
 from ..config.game_log_tag import DisplayGameLogTag
+from ..util import metrics
+from .event import (
+    GameEvent, ID_TAG_KINDS, TAG_EVENT_KINDS, TILE_ATTRS, ATTR_PATTERN
+)
+from .columns import game_log_columns, event_columns, to_numpy
+from .meld import Meld, decode_meld
 
 
 """ Parse processes 
@@ -27,6 +34,28 @@ GAME_END_KEY: Tuple[str, ...] = (
 )
 
 
+""" Compiled tokenizer patterns """
+
+
+ID_TAGS: Tuple[str, ...] = ("T", "U", "V", "W", "D", "E", "F", "G")
+
+def compile_tag_pattern(pick_up_tags: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile pattern that matches all pick up tags in one scan.
+    Draw and discard tags capture (name, tile id), other tags capture
+    (name, attribute text).
+    :param pick_up_tags: Tag names to match.
+    :return: Compiled tag pattern.
+    """
+    id_tags = "".join(tag for tag in pick_up_tags if tag in ID_TAGS)
+    named_tags = "|".join(
+        re.escape(tag) for tag in pick_up_tags if tag not in ID_TAGS
+    )
+    return re.compile(
+        rf"<(?:([{id_tags}])(\d+)/?|({named_tags})\s([^>]*))>"
+    )
+
+
 """ Tage management class """
 
 
@@ -53,15 +82,34 @@ class TagParser:
         "RYUUKYOKU": DisplayGameLogTag.RYUUKYOKU,
     }
 
+    # display tags of draw and discard
+    _id_display_tags: Set[str] = frozenset(
+        display_tag for name, display_tag in _rename_tag.items() if name in ID_TAGS
+    )
+
+    # actor of draw and discard display tags
+    _id_display_actors: Dict[str, int] = {
+        display_tag: ID_TAG_KINDS[name][1]
+        for name, display_tag in _rename_tag.items() if name in ID_TAG_KINDS
+    }
+
     """ Initialize """
 
     def __init__(self, tag_text: str) -> None:
         """
-        Parse constructor, and assign attributes.
+        Split tag name, and keep raw attributes until first access.
         :param tag_text: Text that describes the tag.
         """
-        tag, self.__attrs = self.parse(tag_text)
-        self.__tag = self._rename_tag[tag]
+        name, _, attrs_text = tag_text[:-1].partition(" ")
+
+        # check special tag
+        if re.match(r"\w\d+", name):
+            attrs_text = name[1:]
+            name = name[0]
+            ...
+
+        self.__tag = self._rename_tag[name]
+        self.__attrs = attrs_text
         return
 
     def __str__(self):
@@ -80,12 +128,113 @@ class TagParser:
     @property
     def tag(self) -> str: return self.__tag
 
-    __attrs: Dict[str, str]
+    # raw attribute text until first access
+    __attrs: Union[Dict[str, str], str]
+    @property
+    def attrs(self) -> Dict[str, str]:
+        if isinstance(self.__attrs, str): return self.__decode_attrs()
+        return self.__attrs
+
     @property
-    def attrs(self) -> Dict[str, str]: return self.__attrs
+    def info(self) -> Tuple[str, Dict[str, str]]: return self.__tag, self.attrs
 
     @property
-    def info(self) -> Tuple[str, Dict[str, str]]: return self.__tag, self.__attrs
+    def meld(self) -> Union[Meld, None]:
+        """
+        Return decoded meld of N tag.
+        :return: Decoded meld. None if not N tag.
+        """
+        if self.__tag != DisplayGameLogTag.NAKI: return None
+        return decode_meld(self.attrs["m"])
+
+    """ Compact values same as GameEvent """
+
+    @property
+    def kind(self) -> int: return TAG_EVENT_KINDS[self.__tag]
+
+    @property
+    def actor(self) -> int:
+        if self.__tag in self._id_display_actors:
+            return self._id_display_actors[self.__tag]
+        return int(self.attrs.get("who", -1))
+
+    @property
+    def tile(self) -> int:
+        if self.__tag in self._id_display_tags:
+            return int(self.__attrs if isinstance(self.__attrs, str) else self.__attrs["id"])
+        key = TILE_ATTRS.get(self.kind)
+        if key is None: return -1
+        return int(self.attrs.get(key, -1))
+
+    def __decode_attrs(self) -> Dict[str, str]:
+        """
+        Decode raw attribute text, and memoize result.
+        :return: Attributes of tag.
+        """
+        if self.__tag in self._id_display_tags:
+            self.__attrs = {"id": self.__attrs}
+        else:
+            self.__attrs = dict(ATTR_PATTERN.findall(self.__attrs))
+            ...
+        return self.__attrs
+
+    @classmethod
+    def from_tokens(cls, name: str, attrs: Dict[str, str]) -> "TagParser":
+        """
+        Build tag from already tokenized name and attributes.
+        :param name: Tag name in game log.
+        :param attrs: Attributes of tag.
+        :return: Tag instance.
+        """
+        tag = cls.__new__(cls)
+        tag.__tag = cls._rename_tag[name]
+        tag.__attrs = attrs
+        return tag
+
+    @classmethod
+    def from_raw(cls, name: str, attrs_text: str) -> "TagParser":
+        """
+        Build tag from tag name and raw attribute text decoded on first access.
+        :param name: Tag name in game log.
+        :param attrs_text: Raw attribute text, or tile id of draw and discard.
+        :return: Tag instance.
+        """
+        tag = cls.__new__(cls)
+        tag.__tag = cls._rename_tag[name]
+        tag.__attrs = attrs_text
+        return tag
+
+    """ Compact pickling """
+
+    @staticmethod
+    def pack_events(
+            tags: Sequence["TagParser"]
+    ) -> Tuple[Tuple[str, ...], Tuple[Union[Dict[str, str], str], ...]]:
+        """
+        Pack tags into display tags and attributes for pickling.
+        Attributes not decoded yet are packed as raw text.
+        :param tags: Tags to pack.
+        :return: Packed tags.
+        """
+        return tuple(tag.__tag for tag in tags), tuple(tag.__attrs for tag in tags)
+
+    @classmethod
+    def unpack_events(
+            cls, packed: Tuple[Tuple[str, ...], Tuple[Union[Dict[str, str], str], ...]]
+    ) -> Tuple["TagParser", ...]:
+        """
+        Unpack tags packed by pack_events.
+        :param packed: Packed tags.
+        :return: Tags.
+        """
+        result: List[TagParser] = []
+        for tag_name, attrs in zip(*packed):
+            tag = cls.__new__(cls)
+            tag.__tag = tag_name
+            tag.__attrs = attrs
+            result.append(tag)
+            continue
+        return tuple(result)
 
     """ parse """
 
@@ -147,17 +296,15 @@ class FileParser:
     """ parse class method """
 
     @classmethod
-    def parse(cls, game_log_text: str) -> Tuple[TagParser, ...]:
+    def iter_tags(cls, game_log_text: str) -> Iterator[TagParser]:
         """
-        Parse game log, and return to pick up tags.
+        Parse game log incrementally, and yield pick up tags.
         :param game_log_text: String of game log text.
-        :return: pick upped tags.
+        :return: Iterator of pick upped tags.
         """
 
-        result: List[TagParser] = []
-
         # split tag and loop
-        for tag_text in game_log_text[1:-1].split(cls._split_key):
+        for tag_text in cls.__iter_split(game_log_text):
 
             # get tag name
             tag_match = re.match(r"[A-Z]+[ |\d]", tag_text)
@@ -168,12 +315,51 @@ class FileParser:
             if tag_name not in cls._pick_up_tags: continue
 
             # assign tag
-            tag = TagParser(tag_text)
-            result.append(tag)
+            yield TagParser(tag_text)
 
             continue
 
-        return tuple(result)
+        return
+
+    @classmethod
+    def __iter_split(cls, game_log_text: str) -> Iterator[str]:
+        """
+        Split tag texts one by one, same as splitting game_log_text[1:-1] by split key.
+        :param game_log_text: String of game log text.
+        :return: Iterator of tag texts.
+        """
+        split_key = cls._split_key
+        start, end = 1, max(len(game_log_text) - 1, 1)
+
+        while start <= end:
+            stop = game_log_text.find(split_key, start, end)
+            if stop == -1: stop = end
+            yield game_log_text[start:stop]
+            start = stop + len(split_key)
+            continue
+
+        return
+
+    @classmethod
+    def parse(cls, game_log_text: str) -> Tuple[TagParser, ...]:
+        """
+        Parse game log, and return to pick up tags.
+        :param game_log_text: String of game log text.
+        :return: pick upped tags.
+        """
+        return tuple(cls.iter_tags(game_log_text))
+
+    @staticmethod
+    def read(game_log_file_path: str) -> str:
+        """
+        Read game log text.
+        :param game_log_file_path: File path of game log.
+        :return: Game log text.
+        """
+        with open(game_log_file_path, "r", encoding="utf-8") as f:
+            game_log_text = f.read()
+            ...
+        return game_log_text
 
     """ Initialize """
 
@@ -184,16 +370,31 @@ class FileParser:
         """
 
         # read game log
-        with open(game_log_file_path, "r", encoding="utf-8") as f:
-            game_log_text = f.read()
-            ...
+        game_log_text = self.read(game_log_file_path)
         self.__file_path = game_log_file_path
 
         # parse
-        self.__tags = self.parse(game_log_text)
+        with metrics.timer(metrics.PARSE_TIME):
+            self.__tags = self.parse(game_log_text)
+            ...
 
         return
 
+    @classmethod
+    def from_text(cls, game_log_text: str, game_log_file_path: str = "") -> "FileParser":
+        """
+        Parse game log text read from other storage than file.
+        :param game_log_text: String of game log text.
+        :param game_log_file_path: Name of game log source.
+        :return: File parser.
+        """
+        file_parsed = cls.__new__(cls)
+        file_parsed.__file_path = game_log_file_path
+        with metrics.timer(metrics.PARSE_TIME):
+            file_parsed.__tags = cls.parse(game_log_text)
+            ...
+        return file_parsed
+
     """ Instance attributes """
 
     __file_path: str
@@ -207,6 +408,150 @@ class FileParser:
     ...
 
 
+""" Compiled file parse class """
+
+
+class CompiledFileParser(FileParser):
+    """
+    Parse game log by scanning once with a precompiled pattern.
+    Results are the same as FileParser.
+    """
+
+    """ Class attributes """
+
+    # recompile this when overriding _pick_up_tags
+    _tag_pattern: re.Pattern = compile_tag_pattern(FileParser._pick_up_tags)
+
+    """ parse class method """
+
+    @classmethod
+    def iter_tags(cls, game_log_text: str) -> Iterator[TagParser]:
+        """
+        Parse game log incrementally, and yield pick up tags.
+        :param game_log_text: String of game log text.
+        :return: Iterator of pick upped tags.
+        """
+
+        from_raw = TagParser.from_raw
+
+        for match in cls._tag_pattern.finditer(game_log_text):
+            id_name, tile_id, name, attrs_text = match.groups()
+
+            # draw and discard tag
+            if id_name:
+                yield from_raw(id_name, tile_id)
+                continue
+
+            # normal tag
+            yield from_raw(name, attrs_text)
+
+            continue
+
+        return
+
+    @classmethod
+    def parse(cls, game_log_text: str) -> Tuple[TagParser, ...]:
+        """
+        Parse game log, and return to pick up tags.
+        :param game_log_text: String of game log text.
+        :return: pick upped tags.
+        """
+
+        result: List[TagParser] = []
+        from_raw = TagParser.from_raw
+
+        for id_name, tile_id, name, attrs_text in cls._tag_pattern.findall(game_log_text):
+
+            # draw and discard tag
+            if id_name:
+                result.append(from_raw(id_name, tile_id))
+                continue
+
+            # normal tag
+            result.append(from_raw(name, attrs_text))
+
+            continue
+
+        return tuple(result)
+
+    @classmethod
+    def columns(cls, game_log_text: str) -> Dict[str, array]:
+        """
+        Scan game log into event columns without building tags.
+        Columns are kind, actor, tile, round and seq as arrays.
+        :param game_log_text: String of game log text.
+        :return: Event columns.
+        """
+        return game_log_columns(game_log_text, cls._tag_pattern)
+
+    ...
+
+
+""" Compact file parse class """
+
+
+class CompactFileParser(CompiledFileParser):
+    """
+    Parse game log into compact GameEvent objects instead of TagParser.
+    """
+
+    """ parse class method """
+
+    @classmethod
+    def iter_tags(cls, game_log_text: str) -> Iterator[GameEvent]:
+        """
+        Parse game log incrementally, and yield pick up events.
+        :param game_log_text: String of game log text.
+        :return: Iterator of pick upped events.
+        """
+
+        from_tokens = GameEvent.from_tokens
+
+        for match in cls._tag_pattern.finditer(game_log_text):
+            id_name, tile_id, name, attrs_text = match.groups()
+
+            # draw and discard tag
+            if id_name:
+                kind, actor = ID_TAG_KINDS[id_name]
+                yield GameEvent(kind, actor, int(tile_id))
+                continue
+
+            # normal tag
+            yield from_tokens(name, attrs_text)
+
+            continue
+
+        return
+
+    @classmethod
+    def parse(cls, game_log_text: str) -> Tuple[GameEvent, ...]:
+        """
+        Parse game log, and return to pick up events.
+        :param game_log_text: String of game log text.
+        :return: pick upped events.
+        """
+
+        result: List[GameEvent] = []
+        from_tokens = GameEvent.from_tokens
+
+        for id_name, tile_id, name, attrs_text in cls._tag_pattern.findall(game_log_text):
+
+            # draw and discard tag
+            if id_name:
+                kind, actor = ID_TAG_KINDS[id_name]
+                result.append(GameEvent(kind, actor, int(tile_id)))
+                continue
+
+            # normal tag
+            result.append(from_tokens(name, attrs_text))
+
+            continue
+
+        return tuple(result)
+
+    ...
+
+
 """ Game log that parse tag """
 
 
@@ -233,31 +578,180 @@ class GameLogParser:
         """
 
         # file parse
-        file_parsed = file_parser(game_log_file_path)
+        self.__assign(file_parser(game_log_file_path))
+        return
+
+    @classmethod
+    def from_text(
+            cls,
+            game_log_text: str,
+            file_parser: type[FileParser] = _default_file_parse,
+            game_log_file_path: str = "",
+    ) -> "GameLogParser":
+        """
+        Parse game log text read from other storage than file, such as pack.
+        :param game_log_text: String of game log text.
+        :param file_parser: FileParser class.
+        :param game_log_file_path: Name of game log source.
+        :return: Game log parser.
+        """
+        parser = cls.__new__(cls)
+        parser.__assign(file_parser.from_text(game_log_text, game_log_file_path))
+        return parser
+
+    def __assign(self, file_parsed: FileParser) -> None:
+        """
+        Split parsed tags into rounds, and assign them.
+        :param file_parsed: Parsed game log file.
+        :return: None
+        """
+        self.__game_log_file_path = file_parsed.file_path
 
         # split game log
-        game_logs = []
+        self.__game_tag = next(
+            (tag for tag in file_parsed.tags if tag == "GO"), None
+        )
+        self.__game_logs = tuple(self.split_rounds(file_parsed.tags))
+
+        return
+
+    """ Split rounds """
+
+    @staticmethod
+    def split_rounds(tags: Iterable[TagParser]) -> Iterator[Tuple[TagParser, ...]]:
+        """
+        Split tags into rounds, and yield each round when its end tag is reached.
+        :param tags: Tags of game log.
+        :return: Iterator of rounds.
+        """
+
         game_log = []
 
-        for tag in file_parsed.tags:
+        for tag in tags:
 
-            if tag == "GO":
-                self.__game_tag = tag
-                continue
+            if tag == "GO": continue
 
             game_log.append(tag)
 
             if tag not in GAME_END_KEY: continue
 
-            game_logs.append(tuple(game_log))
+            yield tuple(game_log)
             game_log = []
 
             continue
 
+        return
 
-        self.__game_logs = tuple(game_logs)
+    @classmethod
+    def iter_rounds(
+            cls,
+            game_log_file_path: str,
+            file_parser: type[FileParser] = _default_file_parse
+    ) -> Iterator[Tuple[TagParser, ...]]:
+        """
+        Parse game log lazily, and yield rounds.
+        Tags are parsed only until the end tag of the yielded round.
+        :param game_log_file_path: File path of game log.
+        :param file_parser: FileParser class.
+        :return: Iterator of rounds.
+        """
+        game_log_text = file_parser.read(game_log_file_path)
+        yield from cls.split_rounds(file_parser.iter_tags(game_log_text))
         return
 
+    """ Columnar export """
+
+    @staticmethod
+    def read_arrays(game_log_file_path: str) -> Dict[str, Any]:
+        """
+        Scan game log file into numpy event columns without building tags.
+        Columns are kind (int8), actor (int8), tile (int16),
+        round (int32) and seq (int32).
+        :param game_log_file_path: File path of game log.
+        :return: Event columns.
+        """
+        return to_numpy(CompiledFileParser.columns(FileParser.read(game_log_file_path)))
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """
+        Return numpy event columns of rounds this parser holds.
+        The file is not read again, so parsers built from text are supported.
+        :return: Event columns.
+        """
+        return to_numpy(event_columns(self.game_logs))
+
+    """ Compact pickling """
+
+    def __reduce__(self):
+        """
+        Pickle rounds as packed events of the event class.
+        Used to send parsed results from worker processes cheaply.
+        """
+        return self._unpack, (
+            self.__game_log_file_path, self.__game_tag, *self.__pack_rounds()
+        )
+
+    def __pack_rounds(self) -> Tuple[type, bytes, Any]:
+        """
+        Pack rounds, or return packed rounds not unpacked yet.
+        :return: Event class, event count of each round and packed events.
+        """
+        if self.__packed is not None:
+            return self.__packed
+
+        events = [event for game_log in self.__game_logs for event in game_log]
+        event_type = type(events[0]) if events else TagParser
+        return (
+            event_type,
+            array("i", map(len, self.__game_logs)).tobytes(),
+            event_type.pack_events(events),
+        )
+
+    @classmethod
+    def _unpack(
+            cls,
+            game_log_file_path: str,
+            game_tag: TagParser,
+            event_type: type,
+            round_lengths: bytes,
+            packed_events: Any,
+    ) -> "GameLogParser":
+        """
+        Restore game log parser pickled by __reduce__.
+        Events are unpacked when rounds are accessed first.
+        :param game_log_file_path: File path of game log.
+        :param game_tag: GO tag.
+        :param event_type: Event class of packed events.
+        :param round_lengths: Event count of each round.
+        :param packed_events: Packed events.
+        :return: Game log parser.
+        """
+        parser = cls.__new__(cls)
+        parser.__game_log_file_path = game_log_file_path
+        parser.__game_tag = game_tag
+        parser.__game_logs = None
+        parser.__packed = (event_type, round_lengths, packed_events)
+        return parser
+
+    def __unpack_rounds(self) -> Tuple[Tuple[TagParser, ...], ...]:
+        """
+        Unpack packed events into rounds.
+        :return: Rounds.
+        """
+        event_type, round_lengths, packed_events = self.__packed
+        events = event_type.unpack_events(packed_events)
+
+        game_logs = []
+        start = 0
+        for length in array("i", round_lengths):
+            game_logs.append(events[start:start + length])
+            start += length
+            continue
+
+        self.__game_logs = tuple(game_logs)
+        self.__packed = None
+        return self.__game_logs
+
     """ Instance attributes """
 
     __game_log_file_path: str
@@ -268,9 +762,13 @@ class GameLogParser:
     @property
     def game_tag(self) -> TagParser: return self.__game_tag
 
+    __packed: Tuple[type, bytes, Any] = None
+
     __game_logs: Tuple[Tuple[TagParser, ...], ...]
     @property
-    def game_logs(self) -> Tuple[Tuple[TagParser, ...], ...]: return self.__game_logs
+    def game_logs(self) -> Tuple[Tuple[TagParser, ...], ...]:
+        if self.__game_logs is None: return self.__unpack_rounds()
+        return self.__game_logs
 
     def __getitem__(self, idx: int) -> Tuple[TagParser, ...]:
         """
@@ -278,10 +776,10 @@ class GameLogParser:
         :param idx: Index of game log info.
         :return: Game log info by index.
         """
-        return self.__game_logs[idx]
+        return self.game_logs[idx]
 
-    def __len__(self): return len(self.__game_logs)
+    def __len__(self): return len(self.game_logs)
 
-    def __iter__(self) -> Iterator[Tuple[TagParser, ...]]: return iter(self.__game_logs)
+    def __iter__(self) -> Iterator[Tuple[TagParser, ...]]: return iter(self.game_logs)
 
     ...
@@ -0,0 +1,370 @@
+""" Replay module of TenhouAPI
+This file contains engine that replays game state from parsed rounds.
+"""
+
+
+# types
+
+
+from typing import (
+    Tuple, List, Iterable, Iterator, Callable, Union
+)
+
+
+# libs
+
+
+from ..config.game_log_tag import GameLogEventKind, MeldType
+from .event import GameEvent, EVENT_KIND_TAGS
+from .parse import TagParser
+from .meld import Meld
+
+
+Event = Union[TagParser, GameEvent]
+
+
+""" Replay constants
+"""
+
+
+TILE_KINDS: int = 34
+PLAYER_NUM: int = 4
+RIVER_CAPACITY: int = 32
+DORA_CAPACITY: int = 5
+
+# score unit of ten and sc attributes
+SCORE_UNIT: int = 100
+
+
+""" Player state """
+
+
+class PlayerState:
+    """
+    State of one player.
+    hand is count of each 34 tile kinds, and river is fixed-capacity
+    tile ids of discards filled up to river_size.
+    """
+
+    __slots__ = (
+        "hand", "river", "river_size", "melds", "reach", "score", "last_draw"
+    )
+
+    def __init__(self) -> None:
+        """ Allocate state arrays. """
+        self.hand: List[int] = [0] * TILE_KINDS
+        self.river: List[int] = [-1] * RIVER_CAPACITY
+        self.river_size: int = 0
+        self.melds: List[Meld] = []
+        self.reach: bool = False
+        self.score: int = 0
+        self.last_draw: int = -1
+        return
+
+    def reset(self, tiles: Iterable[int], score: int) -> None:
+        """
+        Reset state to start of round.
+        :param tiles: Tile ids of dealt hand.
+        :param score: Score of player.
+        :return: None
+        """
+        hand = self.hand
+        for kind in range(TILE_KINDS):
+            hand[kind] = 0
+            continue
+        for tile in tiles:
+            hand[tile >> 2] += 1
+            continue
+        self.river_size = 0
+        self.melds.clear()
+        self.reach = False
+        self.score = score
+        self.last_draw = -1
+        return
+
+    @property
+    def river_tiles(self) -> Tuple[int, ...]: return tuple(self.river[:self.river_size])
+
+    def copy(self) -> "PlayerState":
+        """
+        Return copy of state.
+        :return: Copied state.
+        """
+        player = PlayerState.__new__(PlayerState)
+        player.hand = self.hand.copy()
+        player.river = self.river.copy()
+        player.river_size = self.river_size
+        player.melds = self.melds.copy()
+        player.reach = self.reach
+        player.score = self.score
+        player.last_draw = self.last_draw
+        return player
+
+    def __repr__(self):
+        return "{class_name}(hand={hand}, river={river}, reach={reach}, score={score})".format(
+            class_name=self.__class__.__name__,
+            hand=self.hand, river=self.river_tiles, reach=self.reach, score=self.score,
+        )
+
+    ...
+
+
+""" Table state """
+
+
+class TableState:
+    """
+    State of table. The same instance is updated by each event.
+    """
+
+    __slots__ = (
+        "players", "round", "honba", "kyotaku", "dealer",
+        "dora_indicators", "dora_count", "last_discard", "last_discarder", "step",
+    )
+
+    def __init__(self) -> None:
+        """ Allocate state arrays. """
+        self.players: Tuple[PlayerState, ...] = tuple(
+            PlayerState() for _ in range(PLAYER_NUM)
+        )
+        self.round: int = 0
+        self.honba: int = 0
+        self.kyotaku: int = 0
+        self.dealer: int = 0
+        self.dora_indicators: List[int] = [-1] * DORA_CAPACITY
+        self.dora_count: int = 0
+        self.last_discard: int = -1
+        self.last_discarder: int = -1
+        self.step: int = 0
+        return
+
+    @property
+    def dora_indicator_tiles(self) -> Tuple[int, ...]:
+        return tuple(self.dora_indicators[:self.dora_count])
+
+    @property
+    def scores(self) -> Tuple[int, ...]:
+        return tuple(player.score for player in self.players)
+
+    def snapshot(self) -> "TableState":
+        """
+        Return copy of state that is not updated by later events.
+        :return: Copied state.
+        """
+        state = TableState.__new__(TableState)
+        state.players = tuple(player.copy() for player in self.players)
+        state.round = self.round
+        state.honba = self.honba
+        state.kyotaku = self.kyotaku
+        state.dealer = self.dealer
+        state.dora_indicators = self.dora_indicators.copy()
+        state.dora_count = self.dora_count
+        state.last_discard = self.last_discard
+        state.last_discarder = self.last_discarder
+        state.step = self.step
+        return state
+
+    ...
+
+
+""" Replay engine """
+
+
+class ReplayEngine:
+    """
+    Replay rounds of GameLogParser, and keep table state incrementally.
+    Rounds of TagParser and GameEvent are both supported.
+    """
+
+    """ Initialize """
+
+    def __init__(self) -> None:
+        """ Allocate table state and event handlers. """
+        self.__state = TableState()
+
+        handlers: List[Callable[[Event], None]] = [self._ignore] * len(EVENT_KIND_TAGS)
+        handlers[GameLogEventKind.INIT] = self._init
+        handlers[GameLogEventKind.OPEN_DORA] = self._open_dora
+        for kind in range(GameLogEventKind.P0_DRAW, GameLogEventKind.P3_DRAW + 1):
+            handlers[kind] = self._draw
+            continue
+        for kind in range(GameLogEventKind.P0_DISCARD, GameLogEventKind.P3_DISCARD + 1):
+            handlers[kind] = self._discard
+            continue
+        handlers[GameLogEventKind.NAKI] = self._naki
+        handlers[GameLogEventKind.REACH] = self._reach
+        handlers[GameLogEventKind.AGARI] = self._agari
+        handlers[GameLogEventKind.RYUUKYOKU] = self._ryuukyoku
+        self.__handlers = handlers
+
+        return
+
+    @property
+    def state(self) -> TableState: return self.__state
+
+    """ Replay """
+
+    def apply(self, event: Event) -> TableState:
+        """
+        Update table state by one event.
+        :param event: Event to apply.
+        :return: Updated table state.
+        """
+        self.__handlers[event.kind](event)
+        self.__state.step += 1
+        return self.__state
+
+    def replay_round(self, game_log: Iterable[Event]) -> Iterator[Tuple[Event, TableState]]:
+        """
+        Replay one round, and yield table state after each event.
+        The yielded state is the same instance. Use snapshot to keep it.
+        :param game_log: Events of round.
+        :return: Iterator of event and table state.
+        """
+        apply = self.apply
+        for event in game_log:
+            yield event, apply(event)
+            continue
+        return
+
+    def replay(self, game_logs: Iterable[Iterable[Event]]) -> Iterator[Tuple[Event, TableState]]:
+        """
+        Replay rounds, and yield table state after each event.
+        :param game_logs: Rounds such as GameLogParser.
+        :return: Iterator of event and table state.
+        """
+        for game_log in game_logs:
+            yield from self.replay_round(game_log)
+            continue
+        return
+
+    def run(self, game_logs: Iterable[Iterable[Event]]) -> TableState:
+        """
+        Replay rounds without yielding.
+        :param game_logs: Rounds such as GameLogParser.
+        :return: Table state after last event.
+        """
+        apply = self.apply
+        for game_log in game_logs:
+            for event in game_log:
+                apply(event)
+                continue
+            continue
+        return self.__state
+
+    """ Event handlers """
+
+    def _ignore(self, event: Event) -> None:
+        return
+
+    def _init(self, event: Event) -> None:
+        attrs = event.attrs
+        state = self.__state
+
+        seed = [int(value) for value in attrs["seed"].split(",")]
+        state.round, state.honba, state.kyotaku = seed[0], seed[1], seed[2]
+        state.dealer = int(attrs["oya"])
+        state.dora_indicators[0] = seed[5]
+        state.dora_count = 1
+        state.last_discard = -1
+        state.last_discarder = -1
+
+        scores = attrs["ten"].split(",")
+        for idx, player in enumerate(state.players):
+            hand = attrs.get(f"hai{idx}", "")
+            player.reset(
+                (int(tile) for tile in hand.split(",")) if hand else (),
+                int(scores[idx]) * SCORE_UNIT if idx < len(scores) else 0,
+            )
+            continue
+        return
+
+    def _open_dora(self, event: Event) -> None:
+        state = self.__state
+        state.dora_indicators[state.dora_count] = event.tile
+        state.dora_count += 1
+        return
+
+    def _draw(self, event: Event) -> None:
+        tile = event.tile
+        player = self.__state.players[event.actor]
+        player.hand[tile >> 2] += 1
+        player.last_draw = tile
+        return
+
+    def _discard(self, event: Event) -> None:
+        tile = event.tile
+        state = self.__state
+        player = state.players[event.actor]
+        player.hand[tile >> 2] -= 1
+        player.river[player.river_size] = tile
+        player.river_size += 1
+        state.last_discard = tile
+        state.last_discarder = event.actor
+        return
+
+    def _naki(self, event: Event) -> None:
+        meld = event.meld
+        player = self.__state.players[event.actor]
+        hand = player.hand
+
+        # kakan adds tile to pon
+        if meld.type == MeldType.KAKAN:
+            hand[meld.tiles[-1] >> 2] -= 1
+            kind = meld.called_tile >> 2
+            player.melds = [
+                meld if (old.type == MeldType.PON and old.called_tile >> 2 == kind) else old
+                for old in player.melds
+            ]
+            return
+
+        # called tile is not in hand except closed kan and nuki
+        for tile in meld.tiles:
+            hand[tile >> 2] -= 1
+            continue
+        if not (meld.is_closed or meld.type == MeldType.NUKI):
+            hand[meld.called_tile >> 2] += 1
+            ...
+
+        player.melds.append(meld)
+        return
+
+    def _reach(self, event: Event) -> None:
+        attrs = event.attrs
+        state = self.__state
+        player = state.players[event.actor]
+
+        if attrs["step"] == "1":
+            player.reach = True
+            return
+
+        state.kyotaku += 1
+        if "ten" in attrs:
+            for player, score in zip(state.players, attrs["ten"].split(",")):
+                player.score = int(score) * SCORE_UNIT
+                continue
+            ...
+        return
+
+    def _agari(self, event: Event) -> None:
+        # riichi sticks are taken by winner
+        self.__settle(event)
+        self.__state.kyotaku = 0
+        return
+
+    def _ryuukyoku(self, event: Event) -> None:
+        # riichi sticks carry over to next round
+        self.__settle(event)
+        return
+
+    def __settle(self, event: Event) -> None:
+        sc = event.attrs.get("sc")
+        if sc is None: return
+        values = [int(value) for value in sc.split(",")]
+        for idx, player in enumerate(self.__state.players):
+            if 2 * idx + 1 >= len(values): break
+            player.score = (values[2 * idx] + values[2 * idx + 1]) * SCORE_UNIT
+            continue
+        return
+
+    ...
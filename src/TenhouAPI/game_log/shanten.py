@@ -0,0 +1,414 @@
+""" Shanten module of TenhouAPI
+This file contains calculator of shanten and ukeire on 34-count hands.
+"""
+
+
+# types
+
+
+from typing import (
+    Tuple, List, Dict, Set, Iterable, Sequence, Any, Union
+)
+
+
+# libs
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+""" Shanten constants
+"""
+
+
+TILE_KINDS: int = 34
+SUIT_SIZE: int = 9
+TILE_COPIES: int = 4
+
+# first kind of man, pin, sou and honors
+SUIT_STARTS: Tuple[int, ...] = (0, 9, 18)
+HONOR_START: int = 27
+
+TERMINAL_KINDS: Tuple[int, ...] = (0, 8, 9, 17, 18, 26, 27, 28, 29, 30, 31, 32, 33)
+_TERMINAL_SET: Set[int] = set(TERMINAL_KINDS)
+
+
+""" Tile id tools """
+
+
+def tiles_to_counts(tile_ids: Iterable[int]) -> List[int]:
+    """
+    Convert tile ids of TagParser or GameEvent into 34-count hand.
+    :param tile_ids: Tile ids (0-135).
+    :return: Count of each tile kind.
+    """
+    counts = [0] * TILE_KINDS
+    for tile_id in tile_ids:
+        counts[tile_id >> 2] += 1
+        continue
+    return counts
+
+
+""" Suit decomposition tables """
+
+
+# (mentsu, taatsu, head) options of each suit key, filled on first use
+_suit_table: Dict[int, Tuple[Tuple[int, int, int], ...]] = {}
+_honor_table: Dict[int, Tuple[Tuple[int, int, int], ...]] = {}
+
+
+def suit_key(counts: Sequence[int], start: int, size: int) -> int:
+    """
+    Encode counts of one suit into base-5 key.
+    :param counts: 34-count hand.
+    :param start: First kind of suit.
+    :param size: Number of kinds of suit.
+    :return: Key of suit.
+    """
+    key = 0
+    for kind in range(start, start + size):
+        key = key * 5 + counts[kind]
+        continue
+    return key
+
+
+def _pareto(options: Iterable[Tuple[int, int, int]]) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Drop options dominated by other option with same head.
+    :param options: (mentsu, taatsu, head) options.
+    :return: Non dominated options.
+    """
+    options = set(options)
+    return tuple(sorted(
+        option for option in options
+        if not any(
+            other != option and other[2] == option[2]
+            and other[0] >= option[0] and other[1] >= option[1]
+            for other in options
+        )
+    ))
+
+
+def _decompose(
+        counts: List[int],
+        idx: int,
+        mentsu: int,
+        taatsu: int,
+        head: int,
+        is_suit: bool,
+        result: Set[Tuple[int, int, int]],
+) -> None:
+    """
+    Enumerate decompositions of one suit by depth first search.
+    :param counts: Counts of suit. Restored after search.
+    :param idx: Current kind index.
+    :param mentsu: Number of mentsu so far.
+    :param taatsu: Number of taatsu so far.
+    :param head: 1 if head is chosen.
+    :param is_suit: False for honors that can not be sequence.
+    :param result: Set to add (mentsu, taatsu, head).
+    :return: None
+    """
+    size = len(counts)
+    while idx < size and counts[idx] == 0:
+        idx += 1
+        continue
+    if idx == size:
+        result.add((mentsu, taatsu, head))
+        return
+
+    count = counts[idx]
+    next1 = is_suit and idx + 1 < size and counts[idx + 1] > 0
+    next2 = is_suit and idx + 2 < size and counts[idx + 2] > 0
+
+    # triplet
+    if count >= 3:
+        counts[idx] -= 3
+        _decompose(counts, idx, mentsu + 1, taatsu, head, is_suit, result)
+        counts[idx] += 3
+
+    # sequence
+    if next1 and next2:
+        counts[idx] -= 1; counts[idx + 1] -= 1; counts[idx + 2] -= 1
+        _decompose(counts, idx, mentsu + 1, taatsu, head, is_suit, result)
+        counts[idx] += 1; counts[idx + 1] += 1; counts[idx + 2] += 1
+
+    # pair as head or taatsu
+    if count >= 2:
+        counts[idx] -= 2
+        if not head:
+            _decompose(counts, idx, mentsu, taatsu, 1, is_suit, result)
+        _decompose(counts, idx, mentsu, taatsu + 1, head, is_suit, result)
+        counts[idx] += 2
+
+    # ryanmen or penchan
+    if next1:
+        counts[idx] -= 1; counts[idx + 1] -= 1
+        _decompose(counts, idx, mentsu, taatsu + 1, head, is_suit, result)
+        counts[idx] += 1; counts[idx + 1] += 1
+
+    # kanchan
+    if next2:
+        counts[idx] -= 1; counts[idx + 2] -= 1
+        _decompose(counts, idx, mentsu, taatsu + 1, head, is_suit, result)
+        counts[idx] += 1; counts[idx + 2] += 1
+
+    # isolated tile
+    counts[idx] -= 1
+    _decompose(counts, idx, mentsu, taatsu, head, is_suit, result)
+    counts[idx] += 1
+
+    return
+
+
+def suit_options(counts: Sequence[int], start: int, is_suit: bool = True) -> Tuple[Tuple[int, int, int], ...]:
+    """
+    Return (mentsu, taatsu, head) options of one suit from table.
+    :param counts: 34-count hand.
+    :param start: First kind of suit.
+    :param is_suit: False for honors.
+    :return: Non dominated options.
+    """
+    size = SUIT_SIZE if is_suit else TILE_KINDS - HONOR_START
+    table = _suit_table if is_suit else _honor_table
+    key = suit_key(counts, start, size)
+
+    options = table.get(key)
+    if options is None:
+        part = list(counts[start:start + size])
+        if min(part) < 0 or max(part) > TILE_COPIES:
+            raise ValueError(f"Tile counts must be 0-{TILE_COPIES}: {part}")
+        result: Set[Tuple[int, int, int]] = set()
+        _decompose(part, 0, 0, 0, 0, is_suit, result)
+        options = table[key] = _pareto(result)
+        ...
+    return options
+
+
+""" Shanten """
+
+
+def hand_options(counts: Sequence[int]) -> List[Tuple[Tuple[int, int, int], ...]]:
+    """
+    Return options of man, pin, sou and honors from tables.
+    :param counts: 34-count hand.
+    :return: Options of each group.
+    """
+    return [
+        suit_options(counts, SUIT_STARTS[0]),
+        suit_options(counts, SUIT_STARTS[1]),
+        suit_options(counts, SUIT_STARTS[2]),
+        suit_options(counts, HONOR_START, False),
+    ]
+
+
+def combine_options(groups: Sequence[Tuple[Tuple[int, int, int], ...]], sets: int) -> int:
+    """
+    Return best regular shanten of combinations of group options.
+    :param groups: Options of man, pin, sou and honors.
+    :param sets: Number of sets needed by hand.
+    :return: Shanten number.
+    """
+    man, pin, sou, honors = groups
+    best = 2 * sets
+
+    for m0, t0, h0 in man:
+        for m1, t1, h1 in pin:
+            h01 = h0 + h1
+            if h01 > 1: continue
+            m01, t01 = m0 + m1, t0 + t1
+            for m2, t2, h2 in sou:
+                h012 = h01 + h2
+                if h012 > 1: continue
+                m012, t012 = m01 + m2, t01 + t2
+                for m3, t3, h3 in honors:
+                    head = h012 + h3
+                    if head > 1: continue
+                    mentsu = m012 + m3
+                    taatsu = t012 + t3
+                    if taatsu > sets - mentsu: taatsu = sets - mentsu
+                    value = 2 * sets - 2 * mentsu - taatsu - head
+                    if value < best: best = value
+                    continue
+                continue
+            continue
+        continue
+
+    return best
+
+
+def regular_shanten(counts: Sequence[int]) -> int:
+    """
+    Return shanten of regular hand (4 sets and head).
+    Called melds are counted from missing tiles.
+    :param counts: 34-count hand.
+    :return: Shanten number. -1 is complete hand.
+    """
+    return combine_options(hand_options(counts), sum(counts) // 3)
+
+
+def chiitoitsu_shanten(counts: Sequence[int]) -> int:
+    """
+    Return shanten of seven pairs.
+    :param counts: 34-count hand.
+    :return: Shanten number.
+    """
+    pairs = sum(1 for count in counts if count >= 2)
+    kinds = sum(1 for count in counts if count > 0)
+    return 6 - pairs + max(0, 7 - kinds)
+
+
+def kokushi_shanten(counts: Sequence[int]) -> int:
+    """
+    Return shanten of thirteen orphans.
+    :param counts: 34-count hand.
+    :return: Shanten number.
+    """
+    kinds = sum(1 for kind in TERMINAL_KINDS if counts[kind] > 0)
+    pair = any(counts[kind] >= 2 for kind in TERMINAL_KINDS)
+    return 13 - kinds - pair
+
+
+def shanten(counts: Sequence[int]) -> int:
+    """
+    Return shanten of hand. Seven pairs and thirteen orphans are
+    considered for closed hand of 13 or 14 tiles.
+    Waits on the fifth copy of a tile held four times are not excluded.
+    :param counts: 34-count hand.
+    :return: Shanten number. -1 is complete hand.
+    """
+    result = regular_shanten(counts)
+    if sum(counts) >= 13:
+        result = min(result, chiitoitsu_shanten(counts), kokushi_shanten(counts))
+    return result
+
+
+""" Ukeire """
+
+
+def _is_connected(counts: Sequence[int], kind: int) -> bool:
+    """
+    Return whether added tile can form set, taatsu or pair with other tiles.
+    :param counts: 34-count hand including added tile.
+    :param kind: Kind of added tile.
+    :return: False if added tile is isolated.
+    """
+    if counts[kind] > 1: return True
+    if kind >= HONOR_START: return False
+    start = kind - kind % SUIT_SIZE
+    for near in range(max(start, kind - 2), min(start + SUIT_SIZE, kind + 3)):
+        if near != kind and counts[near]: return True
+        continue
+    return False
+
+
+def ukeire(
+        counts: Sequence[int],
+        visible: Sequence[int] = None,
+) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Return number of tiles that decrease shanten, and their kinds.
+    Hand must have 3n+1 tiles.
+    :param counts: 34-count hand.
+    :param visible: 34-count of other visible tiles such as rivers and dora.
+    :return: Number of improving tiles and improving kinds.
+    """
+    if sum(counts) % 3 != 1:
+        raise ValueError("Hand of ukeire must have 3n+1 tiles.")
+
+    hand = list(counts)
+    groups = hand_options(hand)
+    sets = (sum(hand) + 1) // 3
+    regular = combine_options(groups, sets)
+    closed = sum(hand) + 1 >= 13
+
+    # counts of seven pairs and thirteen orphans, updated by added tile
+    pairs = sum(1 for count in hand if count >= 2)
+    used_kinds = sum(1 for count in hand if count > 0)
+    terminals = sum(1 for kind in TERMINAL_KINDS if hand[kind] > 0)
+    terminal_pair = any(hand[kind] >= 2 for kind in TERMINAL_KINDS)
+
+    base = regular
+    if closed:
+        base = min(base, chiitoitsu_shanten(hand), kokushi_shanten(hand))
+
+    total = 0
+    kinds: List[int] = []
+    for kind in range(TILE_KINDS):
+        count = hand[kind]
+        remain = TILE_COPIES - count - (0 if visible is None else visible[kind])
+        if remain <= 0: continue
+
+        hand[kind] += 1
+
+        # isolated tile does not change regular shanten
+        value = regular
+        if _is_connected(hand, kind):
+            group = min(kind // SUIT_SIZE, 3)
+            changed = groups.copy()
+            if group < 3:
+                changed[group] = suit_options(hand, SUIT_STARTS[group])
+            else:
+                changed[group] = suit_options(hand, HONOR_START, False)
+            value = combine_options(changed, sets)
+            ...
+
+        if closed:
+            added_pairs = pairs + (count == 1)
+            added_kinds = used_kinds + (count == 0)
+            value = min(value, 6 - added_pairs + max(0, 7 - added_kinds))
+            if kind in _TERMINAL_SET:
+                value = min(value, 13 - (terminals + (count == 0)) - (terminal_pair or count == 1))
+            else:
+                value = min(value, 13 - terminals - terminal_pair)
+            ...
+
+        hand[kind] -= 1
+
+        if value >= base: continue
+        total += remain
+        kinds.append(kind)
+        continue
+
+    return total, tuple(kinds)
+
+
+""" Batch """
+
+
+def shanten_batch(hands: Any) -> Union[List[int], Any]:
+    """
+    Return shanten of each hand in 2-D array of 34-count hands.
+    :param hands: 2-D array (hands x 34) such as list of lists or numpy array.
+    :return: Shanten numbers. numpy int8 array for numpy input.
+    """
+    if numpy is not None and isinstance(hands, numpy.ndarray):
+        return numpy.fromiter(
+            (shanten(hand) for hand in hands.tolist()), dtype=numpy.int8, count=len(hands)
+        )
+    return [shanten(hand) for hand in hands]
+
+
+def ukeire_batch(hands: Any, visible: Any = None) -> Union[List[int], Any]:
+    """
+    Return number of improving tiles of each hand in 2-D array.
+    :param hands: 2-D array (hands x 34) of 3n+1 tiles hands.
+    :param visible: 2-D array (hands x 34) of visible tiles, or None.
+    :return: Numbers of improving tiles. numpy int16 array for numpy input.
+    """
+    is_numpy = numpy is not None and isinstance(hands, numpy.ndarray)
+    if is_numpy:
+        hands = hands.tolist()
+        visible = None if visible is None else numpy.asarray(visible).tolist()
+        ...
+
+    result = [
+        ukeire(hand, None if visible is None else visible[idx])[0]
+        for idx, hand in enumerate(hands)
+    ]
+
+    if is_numpy: return numpy.array(result, dtype=numpy.int16)
+    return result
@@ -0,0 +1,17 @@
+""" Tools that exercise downloads and parsers without tenhou.
+"""
+
+
+""" Testing tools
+"""
+
+
+from .corpus import (
+    generate_hour_records,
+    generate_hour_file,
+    generate_game_log,
+    write_hour_files,
+    write_game_logs,
+)
+
+from .server import TenhouStandIn
@@ -0,0 +1,269 @@
+""" Tools that generate synthetic game id lists and game logs.
+"""
+
+
+# types
+
+
+from typing import (
+    Dict,
+    List,
+    Tuple,
+)
+
+
+# libs
+
+
+import os
+import random
+import zlib
+from datetime import datetime, timedelta
+
+from ..config.manager import WhiteKeyConfig
+from ..config.tenhou_url import TenhouUrlConfig
+
+
+""" Synthetic corpus
+"""
+
+
+# lobby types and rule names of hour file
+LOBBY_RULES: Dict[str, str] = {
+    WhiteKeyConfig.player_num_4[0]: "四鳳東喰赤－",
+    WhiteKeyConfig.player_num_4[1]: "四鳳南喰赤－",
+    WhiteKeyConfig.player_num_3[0]: "三鳳南喰赤－",
+}
+
+PLAYER_NAMES: Tuple[str, ...] = tuple(f"NoName{idx:03d}" for idx in range(256))
+
+# meld codes of chi, pon, kan and added kan
+MELD_CODES: Tuple[int, ...] = (1097, 13164, 34314, 40117, 47723)
+
+
+def seeded_random(key: str, seed: int = 0) -> random.Random:
+    """
+    Return random generator that is same for key and seed in every process.
+    :param key: Key such as game id or file name.
+    :param seed: Seed of corpus.
+    :return: Random generator.
+    """
+    return random.Random(zlib.crc32(key.encode("utf-8")) ^ (seed << 32))
+
+
+""" Game ids """
+
+
+def generate_hour_records(
+        hour: datetime,
+        games: int = 100,
+        seed: int = 0,
+) -> List[Tuple[str, str, List[Tuple[str, float]]]]:
+    """
+    Generate games of hour.
+    :param hour: Hour of games.
+    :param games: Number of games.
+    :param seed: Seed of corpus.
+    :return: Game id, rule name and players with scores of each game.
+    """
+    rng = seeded_random(f"{hour:%Y%m%d%H}", seed)
+    lobby_types = tuple(LOBBY_RULES)
+
+    records = []
+    for _ in range(games):
+        lobby_type = rng.choice(lobby_types)
+        game_id = "{hour:%Y%m%d%H}gm-{lobby_type}-0000-{suffix:08x}".format(
+            hour=hour, lobby_type=lobby_type, suffix=rng.getrandbits(32),
+        )
+        player_num = 3 if lobby_type in WhiteKeyConfig.player_num_3 else 4
+        scores = sorted((round(rng.uniform(-60, 60), 1) for _ in range(player_num)), reverse=True)
+        players = list(zip(rng.sample(PLAYER_NAMES, player_num), scores))
+        records.append((game_id, LOBBY_RULES[lobby_type], players))
+        continue
+
+    return records
+
+
+def generate_hour_file(
+        hour: datetime,
+        games: int = 100,
+        seed: int = 0,
+) -> bytes:
+    """
+    Generate html of game ids of hour in format of tenhou hour file.
+    :param hour: Hour of games.
+    :param games: Number of games.
+    :param seed: Seed of corpus.
+    :return: Html bytes.
+    """
+    lines = []
+    for idx, (game_id, rule, players) in enumerate(generate_hour_records(hour, games, seed)):
+        minute = idx * 60 // max(games, 1)
+        lines.append(
+            f'{hour.hour:02d}:{minute:02d} | {20 + idx % 40} | {rule} | '
+            f'<a href="http://tenhou.net/0/?log={game_id}">牌譜</a> | '
+            + " ".join(f"{name}({score:+.1f})" for name, score in players)
+            + "<br>\n"
+        )
+        continue
+    return "".join(lines).encode("utf-8")
+
+
+""" Game logs """
+
+
+def generate_game_log(
+        game_id: str,
+        rounds: int = 8,
+        seed: int = 0,
+) -> str:
+    """
+    Generate mjlog text with tags of real game logs.
+    Draws and discards are random, so the log is not a legal game.
+    :param game_id: Game id of game log.
+    :param rounds: Number of rounds.
+    :param seed: Seed of corpus.
+    :return: mjlog text.
+    """
+    rng = seeded_random(game_id, seed)
+    lobby_type = game_id.split("-")[1] if game_id.count("-") >= 3 else "00a9"
+
+    tags = [
+        '<mjloggm ver="2.3">',
+        '<SHUFFLE seed="mt19937ar-sha512-n288-base64,{seed}" ref=""/>'.format(
+            seed=rng.getrandbits(64)
+        ),
+        f'<GO type="{int(lobby_type, 16)}" lobby="0"/>',
+        '<UN n0="%41" n1="%42" n2="%43" n3="%44" dan="16,16,16,16" '
+        'rate="2000.00,2000.00,2000.00,2000.00" sx="M,M,M,M"/>',
+        '<TAIKYOKU oya="0"/>',
+    ]
+
+    for round_ in range(rounds):
+        wall = list(range(136))
+        rng.shuffle(wall)
+        hands = [sorted(wall[player * 13:(player + 1) * 13]) for player in range(4)]
+        tags.append(
+            '<INIT seed="{round},0,0,{dice0},{dice1},{dora}" ten="250,250,250,250" oya="{oya}" '
+            'hai0="{0}" hai1="{1}" hai2="{2}" hai3="{3}"/>'.format(
+                *(",".join(map(str, hand)) for hand in hands),
+                round=round_, dice0=rng.randint(0, 5), dice1=rng.randint(0, 5),
+                dora=wall[130], oya=round_ % 4,
+            )
+        )
+
+        position, player, doras = 52, round_ % 4, 0
+        for _ in range(rng.randint(40, 70)):
+            tile = wall[position]
+            position += 1
+            tags.append(f"<{'TUVW'[player]}{tile}/>")
+            if rng.random() < 0.02:
+                tags.append(f'<REACH who="{player}" step="1"/>')
+            tags.append(f"<{'DEFG'[player]}{tile}/>")
+            if rng.random() < 0.03:
+                player = (player + 1) % 4
+                tags.append(f'<N who="{player}" m="{rng.choice(MELD_CODES)}" />')
+            if rng.random() < 0.02 and doras < 4:
+                doras += 1
+                tags.append(f'<DORA hai="{wall[130 - doras]}" />')
+            player = (player + 1) % 4
+            continue
+
+        if rng.random() < 0.7:
+            tags.append(
+                '<AGARI ba="0,0" hai="1,2,3,4,5,6,7,8,9,10,11,12,13,14" machi="14" '
+                'ten="30,7700,0" yaku="1,1,7,1,52,1" doraHai="{dora}" who="{who}" fromWho="{from_who}" '
+                'sc="250,-77,250,77,250,0,250,0" />'.format(
+                    dora=wall[130], who=player, from_who=(player + 1) % 4,
+                )
+            )
+        else:
+            tags.append('<RYUUKYOKU ba="0,0" sc="250,10,250,-10,250,10,250,-10" hai0="1,2,3" />')
+        continue
+
+    tags[-1] = tags[-1][:-3] + ' owari="250,0.0,250,0.0,250,0.0,250,0.0" />'
+    tags.append("</mjloggm>")
+    return "".join(tags)
+
+
+""" Corpus files """
+
+
+def write_hour_files(
+        directory: str,
+        start: datetime,
+        hours: int,
+        games_per_hour: int = 100,
+        seed: int = 0,
+        zipped: bool = False,
+        url_config: TenhouUrlConfig = TenhouUrlConfig(),
+) -> List[str]:
+    """
+    Write hour files named same as tenhou from start hour.
+    :param directory: Directory to write.
+    :param start: First hour.
+    :param hours: Number of hours.
+    :param games_per_hour: Number of games of each hour file.
+    :param seed: Seed of corpus.
+    :param zipped: Write files zipped by zip tool of url config if True.
+    :param url_config: URL config of file name and zip tool.
+    :return: Written file paths.
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+        ...
+
+    file_paths = []
+    for offset in range(hours):
+        hour = start + timedelta(hours=offset)
+        file_name = url_config.id_file_name_format.format(
+            key=url_config.table_key, year=hour.year, month=hour.month, day=hour.day, hour=hour.hour,
+        )
+        content = generate_hour_file(hour, games_per_hour, seed)
+        if zipped:
+            file_name = url_config.zip_tool.add_extension(file_name)
+            content = url_config.zip_tool.compress(content)
+        file_path = os.path.join(directory, file_name)
+        with open(file_path, "wb") as f:
+            f.write(content)
+            ...
+        file_paths.append(file_path)
+        continue
+
+    return file_paths
+
+
+def write_game_logs(
+        directory: str,
+        start: datetime,
+        games: int,
+        rounds: int = 8,
+        seed: int = 0,
+) -> List[str]:
+    """
+    Write game logs of games of hour files from start hour.
+    :param directory: Directory to write.
+    :param start: First hour.
+    :param games: Number of game logs.
+    :param rounds: Number of rounds of each game log.
+    :param seed: Seed of corpus.
+    :return: Written file paths.
+    """
+    if not os.path.exists(directory):
+        os.makedirs(directory)
+        ...
+
+    file_paths = []
+    hour = start
+    while len(file_paths) < games:
+        for game_id, _, _ in generate_hour_records(hour, min(100, games - len(file_paths)), seed):
+            file_path = os.path.join(directory, game_id)
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(generate_game_log(game_id, rounds, seed))
+                ...
+            file_paths.append(file_path)
+            continue
+        hour += timedelta(hours=1)
+        continue
+
+    return file_paths
@@ -0,0 +1,243 @@
+""" Local stand-in of tenhou server.
+"""
+
+
+# types
+
+
+from typing import (
+    Dict,
+    Union,
+)
+
+
+# libs
+
+
+import random
+import re
+import threading
+from datetime import datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from urllib.parse import urlsplit
+
+from ..config.tenhou_url import TenhouUrlConfig
+
+from .corpus import generate_hour_file, generate_game_log
+
+
+""" Stand-in server
+"""
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """ Serve requests of stand-in server over keep-alive connection """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    stand_in: "TenhouStandIn"
+
+    def do_GET(self) -> None:
+        status, body, headers = self.stand_in.respond(self.path)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+            continue
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return
+
+    def log_message(self, *args) -> None:
+        return
+
+    ...
+
+
+class TenhouStandIn:
+    """
+    Local HTTP server that serves synthetic gzipped hour files and mjlogs
+    at the paths of TenhouUrlConfig, with latency and injected failures.
+    Use url_config() as url_config of download functions and directories.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            latency: float = 0.0,
+            error_rate: float = 0.0,
+            throttle_rate: float = 0.0,
+            games_per_hour: int = 100,
+            rounds: int = 8,
+            seed: int = 0,
+            host: str = "127.0.0.1",
+            port: int = 0,
+            url_config: TenhouUrlConfig = TenhouUrlConfig(),
+    ) -> None:
+        """
+        Assign behavior of server. Server is started by start or with statement.
+        :param latency: Seconds before each response.
+        :param error_rate: Rate of 503 responses.
+        :param throttle_rate: Rate of 429 responses.
+        :param games_per_hour: Number of games of each hour file.
+        :param rounds: Number of rounds of each game log.
+        :param seed: Seed of corpus and failures.
+        :param host: Host to bind.
+        :param port: Port to bind. Free port if 0.
+        :param url_config: URL config of table key, zip tool and paths.
+        """
+        if not 0 <= error_rate + throttle_rate <= 1:
+            raise ValueError("error_rate + throttle_rate must be in [0, 1].")
+
+        self.latency = latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.__url_config = url_config
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__counts = dict.fromkeys(("requests", "ok", "errors", "throttled", "missing", "bytes"), 0)
+
+        # paths of tenhou urls
+        self.__ids_path = urlsplit(url_config.ids_directory).path
+        self.__game_log_path = urlsplit(url_config.game_log_file).path
+        self.__hour_pattern = re.compile(
+            r"^{key}(\d{{4}})(\d\d)(\d\d)(\d\d)\.html$".format(key=re.escape(url_config.table_key))
+        )
+
+        # generated bodies are reused
+        self.__hour_file = lru_cache(maxsize=4096)(
+            lambda hour: url_config.zip_tool.compress(generate_hour_file(hour, games_per_hour, seed))
+        )
+        self.__game_log = lru_cache(maxsize=4096)(
+            lambda game_id: generate_game_log(game_id, rounds, seed).encode("utf-8")
+        )
+
+        handler = type("Handler", (StandInHandler,), {"stand_in": self})
+        self.__server = ThreadingHTTPServer((host, port), handler)
+        self.__server.daemon_threads = True
+        self.__thread: Union[threading.Thread, None] = None
+        return
+
+    @property
+    def root(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url_config(self) -> TenhouUrlConfig:
+        """
+        Return URL config whose urls point to this server.
+        :return: URL config.
+        """
+        return TenhouUrlConfig(
+            table_key=self.__url_config.table_key,
+            zip_tool=self.__url_config.zip_tool,
+            root=self.root,
+            ids_directory=self.root + self.__ids_path,
+            game_log_file=self.root + self.__game_log_path + "?",
+        )
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """
+        Return number of requests, responses of each kind and bytes of bodies.
+        :return: Counts.
+        """
+        with self.__lock:
+            return dict(self.__counts)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}('{self.root}', latency={self.latency}, "
+            f"error_rate={self.error_rate}, throttle_rate={self.throttle_rate})"
+        )
+
+    """ Lifecycle """
+
+    def start(self) -> "TenhouStandIn":
+        """
+        Serve requests in background thread.
+        :return: self
+        """
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__server.serve_forever, daemon=True)
+            self.__thread.start()
+            ...
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop server, and close socket.
+        :return: None
+        """
+        if self.__thread is not None:
+            self.__server.shutdown()
+            self.__thread.join()
+            self.__thread = None
+            ...
+        self.__server.server_close()
+        return
+
+    def __enter__(self) -> "TenhouStandIn": return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+        return
+
+    """ Response """
+
+    def respond(self, path: str) -> tuple:
+        """
+        Return response of request path.
+        :param path: Request path with query.
+        :return: Status, body and headers.
+        """
+        if self.latency > 0: sleep(self.latency)
+
+        with self.__lock:
+            self.__counts["requests"] += 1
+            roll = self.__random.random()
+            ...
+
+        # injected failures
+        if roll < self.throttle_rate:
+            return self.__count("throttled", 429, b"Too Many Requests", {"Retry-After": "1"})
+        if roll < self.throttle_rate + self.error_rate:
+            return self.__count("errors", 503, b"Service Unavailable")
+
+        body = self.__body(path)
+        if body is None:
+            return self.__count("missing", 404, b"Not Found")
+        return self.__count("ok", 200, body)
+
+    def __body(self, path: str) -> Union[bytes, None]:
+        target, _, query = path.partition("?")
+
+        # game log
+        if target == self.__game_log_path and query:
+            return self.__game_log(query)
+
+        # hour file
+        if target.startswith(self.__ids_path):
+            file_name = self.__url_config.zip_tool.remove_extension(target[len(self.__ids_path):])
+            match = self.__hour_pattern.match(file_name)
+            if match is None: return None
+            try:
+                hour = datetime(*map(int, match.groups()))
+            except ValueError:
+                return None
+            return self.__hour_file(hour)
+
+        return None
+
+    def __count(self, kind: str, status: int, body: bytes, headers: Dict[str, str] = None) -> tuple:
+        with self.__lock:
+            self.__counts[kind] += 1
+            self.__counts["bytes"] += len(body)
+            ...
+        return status, body, headers or {}
+
+    ...
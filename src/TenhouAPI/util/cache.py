@@ -0,0 +1,198 @@
+""" Utility tools of in-process cache.
+"""
+
+
+# types
+
+
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Tuple,
+    Union,
+)
+
+
+# libs
+
+
+import os
+from collections import OrderedDict
+from threading import Lock
+
+
+""" Cache tools
+"""
+
+
+""" File stamp """
+
+
+def file_stamp(file_path: str) -> Tuple[int, int]:
+    """
+    Return stamp that changes when file changes on disk.
+    :param file_path: File path to stamp.
+    :return: Modified time in nanoseconds and size.
+    """
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+""" LRU cache """
+
+
+class LRUCache:
+    """
+    Least recently used cache bounded by entry count and estimated bytes.
+    Each entry holds a stamp, and the entry is invalidated when
+    the stamp of the key changes.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            max_entries: Union[int, None] = 128,
+            max_bytes: Union[int, None] = None,
+            size_of: Callable[[Any], int] = None,
+    ) -> None:
+        """
+        Assign bounds of cache.
+        :param max_entries: Max number of entries. No bound if None.
+        :param max_bytes: Max estimated bytes of entries. No bound if None.
+        :param size_of: Function that estimates bytes of value.
+        """
+        if max_bytes is not None and size_of is None:
+            raise ValueError("size_of is required to bound cache by bytes.")
+
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__size_of = size_of
+
+        self.__entries: OrderedDict = OrderedDict()
+        self.__lock = Lock()
+        self.__bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        return
+
+    """ Counters """
+
+    @property
+    def hits(self) -> int: return self.__hits
+
+    @property
+    def misses(self) -> int: return self.__misses
+
+    @property
+    def evictions(self) -> int: return self.__evictions
+
+    @property
+    def bytes(self) -> int: return self.__bytes
+
+    def __len__(self) -> int: return len(self.__entries)
+
+    def __contains__(self, key: Hashable) -> bool: return key in self.__entries
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(entries={len(self)}, bytes={self.__bytes}, "
+            f"hits={self.__hits}, misses={self.__misses}, evictions={self.__evictions})"
+        )
+
+    """ Access """
+
+    def get_or_load(
+            self,
+            key: Hashable,
+            stamp: Hashable,
+            load: Callable[[], Any],
+    ) -> Any:
+        """
+        Return cached value, or load and cache value.
+        Cached value with other stamp is discarded.
+        :param key: Key of value.
+        :param stamp: Stamp of current source of value.
+        :param load: Function that loads value.
+        :return: Value.
+        """
+
+        # check cache
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.__entries.move_to_end(key)
+                self.__hits += 1
+                return entry[1]
+            self.__misses += 1
+            if entry is not None: self.__remove(key)
+            ...
+
+        # load outside of lock
+        value = load()
+        self.put(key, stamp, value)
+
+        return value
+
+    def put(self, key: Hashable, stamp: Hashable, value: Any) -> None:
+        """
+        Cache value, and evict least recently used entries over bounds.
+        :param key: Key of value.
+        :param stamp: Stamp of current source of value.
+        :param value: Value to cache.
+        :return: None
+        """
+        size = 0 if self.__size_of is None else self.__size_of(value)
+
+        with self.__lock:
+            if key in self.__entries: self.__remove(key)
+            self.__entries[key] = (stamp, value, size)
+            self.__bytes += size
+
+            while self.__entries and self.__over_bounds():
+                self.__remove(next(iter(self.__entries)))
+                self.__evictions += 1
+                continue
+            ...
+
+        return
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Discard cached value of key.
+        :param key: Key of value.
+        :return: None
+        """
+        with self.__lock:
+            if key in self.__entries: self.__remove(key)
+            ...
+        return
+
+    def clear(self) -> None:
+        """
+        Discard all cached values.
+        :return: None
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__bytes = 0
+            ...
+        return
+
+    """ Internal """
+
+    def __remove(self, key: Hashable) -> None:
+        _, _, size = self.__entries.pop(key)
+        self.__bytes -= size
+        return
+
+    def __over_bounds(self) -> bool:
+        if self.__max_entries is not None and len(self.__entries) > self.__max_entries:
+            return True
+        if self.__max_bytes is not None and self.__bytes > self.__max_bytes:
+            return True
+        return False
+
+    ...
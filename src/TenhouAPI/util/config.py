@@ -6,8 +6,10 @@
 
 
 from typing import (
+    Callable,
     Dict,
-     Any
+    Tuple,
+    Any
 )
 
 
@@ -15,38 +17,105 @@ from typing import (
 
 
 from abc import ABC
-import re
-from .repr import ReprBase
+from functools import partial
+from .repr import generate_representation
 
 
 """ Utility tools
 """
 
 
+""" derived value """
+
+
+class derived(property):
+    """
+    Property of config computed once at construction of config object.
+    Value is kept in slot of object, so reading it costs same as reading config value.
+    """
+    ...
+
+
 """ config base class """
 
 
-class ConfigBase(ReprBase, ABC):
-    """ Base class of config object """
+class ConfigBase(ABC):
+    """
+    Base class of frozen config object.
+    Public class attributes are configs and their defaults, and stay plain class attributes.
+    Objects are instances of slotted subclass generated for each config class,
+    which keeps configs and derived values in slots.
+    Objects can not be modified, so they can be shared by threads,
+    and they are pickled as configs to be used in other processes.
+    """
+
+    __slots__ = ()
+
+    """ Class structure """
+
+    # defaults of configs and functions of derived values of config class
+    __defaults: Dict[str, Any] = {}
+    __derived: Dict[str, Callable[["ConfigBase"], Any]] = {}
+
+    # slotted subclass whose instances are created
+    __instance_class: type = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Collect configs and derived values, and generate slotted subclass.
+        :param kwargs: Keywords of superclass.
+        """
+        super().__init_subclass__(**kwargs)
+
+        # generated slotted subclass
+        if "_ConfigBase__config_class" in cls.__dict__: return
+
+        defaults, derived_values = {}, {}
+        for klass in reversed(cls.__mro__):
+            for key, value in klass.__dict__.items():
+                if key.startswith("_"): continue
+                if isinstance(value, derived):
+                    derived_values[key] = value.fget
+                elif not hasattr(type(value), "__get__"):
+                    defaults[key] = value
+                continue
+            continue
+
+        cls.__defaults = defaults
+        cls.__derived = derived_values
+        cls.__instance_class = type(cls)(cls.__name__, (cls,), {
+            "__slots__": tuple(defaults) + tuple(derived_values),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+            "_ConfigBase__config_class": cls,
+        })
+        return
 
     """ Initialize  """
 
+    def __new__(cls, **kwargs) -> "ConfigBase":
+        return object.__new__(cls.__instance_class or cls)
+
     def __init__(self, **kwargs) -> None:
         """
-        Assign instance attributes to class attributes.
+        Assign configs of class attributes overwritten by kwargs, and compute derived values.
         :param kwargs: Value that overwrite.
         """
+        defaults = self.__defaults
 
-        # assign config values
-        self.__assign_cls_attrs_to_ins()
-        self.__assign_args_to_ins_attrs(kwargs)
+        for key in kwargs:
+            if key not in defaults:
+                raise TypeError(
+                    f"{self.__class__.__name__} got an unexpected config '{key}'."
+                )
+            continue
 
-        # repr process
-        value_name_and_keyword = {
-            keyword: keyword
-            for keyword in self.configs.keys()
-        }
-        ReprBase.__init__(self, value_name_and_keyword)
+        for key, value in defaults.items():
+            object.__setattr__(self, key, kwargs.get(key, value))
+            continue
+        for key, func in self.__derived.items():
+            object.__setattr__(self, key, func(self))
+            continue
 
         return
 
@@ -58,42 +127,44 @@ class ConfigBase(ReprBase, ABC):
         Return attributes of config.
         :return: Config attributes.
         """
-        return {
-            key: value
-            for key, value in self.__dict__.items()
-            if re.match(r"^__?", key) is None
-        }
-
-    """ Assign instance attributes to class attributes """
+        return {key: getattr(self, key) for key in self.__defaults}
 
-    def __assign_cls_attrs_to_ins(self) -> None:
+    def replace(self, **kwargs) -> "ConfigBase":
         """
-        Assign class attributes to instance attributes.
-        :return: None
+        Return new config whose configs are overwritten by kwargs.
+        :param kwargs: Value that overwrite.
+        :return: New config.
         """
-        for key, value in self.__class__.__dict__.items():
+        return self.__config_class(**{**self.configs, **kwargs})
 
-            if re.match(r"^__?", key) is not None:
-                continue
+    @property
+    def __config_class(self) -> type:
+        return self.__class__.__dict__.get("_ConfigBase__config_class", self.__class__)
 
-            try: setattr(self, key, value)
-            except AttributeError: ...
-            continue
+    """ Frozen """
 
-        return
+    def __setattr__(self, key: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is frozen. Use replace to change '{key}'.")
 
-    def __assign_args_to_ins_attrs(
-            self,
-            kwargs: Dict[str, Any]
-    ) -> None:
-        """
-        Assign instance attributes to class attributes.
-        :param kwargs: Keyword arguments to assign to instance attributes.
-        :return: None
-        """
-        for key, value in kwargs.items():
-            setattr(self, key, value)
-            continue
-        return
+    def __delattr__(self, key: str) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is frozen. Can not delete '{key}'.")
+
+    def __reduce__(self) -> tuple:
+        return partial(self.__config_class, **self.configs), ()
+
+    """ Compare """
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ConfigBase): return NotImplemented
+        return self.__config_class is other.__config_class and self.configs == other.configs
+
+    def __hash__(self) -> int:
+        return hash((self.__config_class, tuple(self.configs.values())))
+
+    """ Representation """
+
+    def __repr__(self) -> str:
+        """ Return representation string """
+        return generate_representation(self.__class__.__name__, **self.configs)
 
     ...
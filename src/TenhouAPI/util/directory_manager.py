@@ -7,7 +7,10 @@ Utility tools that manage directory.
 
 
 from typing import (
-    List
+    List,
+    Set,
+    Tuple,
+    Union,
 )
 
 
@@ -17,6 +20,7 @@ from typing import (
 from abc import ABC
 
 import os
+import tempfile
 
 """ Directory manager
 """
@@ -25,6 +29,9 @@ import os
 class DirectoryManager(ABC):
     """
     Manage directory tool.
+    Names of present files are kept in memory, built by one scan on first use
+    and updated as files are saved, so existence checks do not touch file system.
+    Call refresh after files are changed by others.
     """
 
     """ Save directory processes """
@@ -45,7 +52,6 @@ class DirectoryManager(ABC):
         :param file_name: File name.
         :return: Generated save file path.
         """
-        print(self.__save_dir, file_name)
         return os.path.join(self.__save_dir, file_name)
 
     """ Initializer """
@@ -61,13 +67,82 @@ class DirectoryManager(ABC):
             ...
         return
 
+    """ Present files """
+
+    __files: Union[Set[str], None] = None
+
+    def refresh(self) -> None:
+        """
+        Rebuild names of present files by one scan of directory.
+        Hidden files such as journal and temporary files are excluded.
+        :return: None
+        """
+        with os.scandir(self.__save_dir) as entries:
+            self.__files = {
+                entry.name for entry in entries if not entry.name.startswith(".")
+            }
+            ...
+        return
+
+    def __present_files(self) -> Set[str]:
+        if self.__files is None: self.refresh()
+        return self.__files
+
+    def add_file(self, file_name: str) -> None:
+        """
+        Record file saved in directory.
+        :param file_name: Saved file name.
+        :return: None
+        """
+        self.__present_files().add(file_name)
+        return
+
+    def discard_file(self, file_name: str) -> None:
+        """
+        Record file removed from directory.
+        :param file_name: Removed file name.
+        :return: None
+        """
+        self.__present_files().discard(file_name)
+        return
+
+    def exists(self, file_name: str) -> bool:
+        """
+        Return whether file is present in directory.
+        :param file_name: File name.
+        :return: True if present.
+        """
+        return file_name in self.__present_files()
+
     """ Util methods """
 
     def listdir(self) -> List[str]:
         """
         List all files in directory.
+        Hidden files such as journal and temporary files are excluded.
         :return: File list.
         """
-        return os.listdir(self.save_dir)
+        return list(self.__present_files())
 
     ...
+
+
+""" Temporary file
+"""
+
+
+# mode of files written through temporary file, instead of 0600 of mkstemp
+TEMP_FILE_MODE: int = 0o644
+
+
+def make_temp_file(file_path: str) -> Tuple[int, str]:
+    """
+    Create hidden temporary file in directory of file path, to be renamed to file path.
+    Permission is TEMP_FILE_MODE, so renamed file is readable by others like saved files.
+    :param file_path: File path that temporary file replaces.
+    :return: File descriptor and path of temporary file.
+    """
+    directory, file_name = os.path.split(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix="." + file_name + ".", suffix=".part", dir=directory)
+    os.chmod(temp_path, TEMP_FILE_MODE)
+    return fd, temp_path
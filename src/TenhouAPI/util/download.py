@@ -4,34 +4,470 @@
 
 # types
 
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
+
+
 # libs
 
 
+import http.client
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
+from threading import Lock, BoundedSemaphore
+from time import perf_counter, thread_time
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, urljoin
 from urllib.request import Request, urlopen
 
+from . import metrics
+from .retry import HTTPStatusError, RetryPolicy
+
 
 """ Utility functions
 """
 
 
+""" Response body """
+
+
+def _read(response: http.client.HTTPResponse) -> bytes:
+    body = response.read()
+    metrics.increment(metrics.BYTES_DOWNLOADED, len(body))
+    return body
+
+
+def _iter_chunks(response: http.client.HTTPResponse, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    for chunk in iter(partial(response.read, chunk_size), b""):
+        metrics.increment(metrics.BYTES_DOWNLOADED, len(chunk))
+        yield chunk
+        continue
+    return
+
+
+""" Connection pool """
+
+
+# errors of connection closed by server while kept alive
+RECONNECT_ERRORS: Tuple[type, ...] = (
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+)
+
+REDIRECT_STATUSES: Tuple[int, ...] = (301, 302, 303, 307, 308)
+
+
+class ConnectionPool:
+    """
+    Pool of keep-alive http.client connections shared by threads.
+    Connections are reused per host, and at most max_per_host
+    connections of each host are used at once.
+    Unlike urllib, proxy environment variables are not used,
+    and response other than 200 raises HTTPStatusError.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            max_per_host: int = 4,
+            timeout: float = 30,
+            max_redirects: int = 5,
+    ) -> None:
+        """
+        Assign limits of pool.
+        :param max_per_host: Max connections used at once per host.
+        :param timeout: Socket timeout of connections.
+        :param max_redirects: Max redirects followed per request.
+        """
+        if max_per_host < 1:
+            raise ValueError("max_per_host must be 1 or more.")
+
+        self.__max_per_host = max_per_host
+        self.__timeout = timeout
+        self.__max_redirects = max_redirects
+
+        self.__idle: Dict[Tuple[str, str], deque] = {}
+        self.__slots: Dict[Tuple[str, str], BoundedSemaphore] = {}
+        self.__lock = Lock()
+        self.__connects = 0
+        self.__reconnects = 0
+        return
+
+    @property
+    def max_per_host(self) -> int: return self.__max_per_host
+
+    @property
+    def connects(self) -> int: return self.__connects
+
+    @property
+    def reconnects(self) -> int: return self.__reconnects
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(max_per_host={self.__max_per_host}, "
+            f"connects={self.__connects}, reconnects={self.__reconnects})"
+        )
+
+    def __enter__(self) -> "ConnectionPool": return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        return
+
+    """ Request """
+
+    def get(self, url: str, headers: Dict[str, str] = None) -> bytes:
+        """
+        Download url over pooled connection. Redirects are followed.
+        :param url: File URL to download.
+        :param headers: Request headers.
+        :return: Downloaded file.
+        """
+        return self.__follow(url, headers or {}, _read)
+
+    def stream(
+            self,
+            url: str,
+            consume: Callable[[Iterator[bytes]], Any],
+            headers: Dict[str, str] = None,
+            chunk_size: int = 1 << 16,
+    ) -> Any:
+        """
+        Download url over pooled connection, and pass body to consume in chunks
+        while it is received. Redirects are followed.
+        :param url: File URL to download.
+        :param consume: Function that consumes iterator of body chunks.
+        :param headers: Request headers.
+        :param chunk_size: Max bytes of chunk.
+        :return: Result of consume.
+        """
+        return self.__follow(
+            url, headers or {},
+            lambda response: consume(_iter_chunks(response, chunk_size)),
+        )
+
+    def close(self) -> None:
+        """
+        Close idle connections.
+        :return: None
+        """
+        with self.__lock:
+            for connections in self.__idle.values():
+                while connections:
+                    connections.pop().close()
+                    continue
+                continue
+            ...
+        return
+
+    """ Internal """
+
+    def __follow(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            consume: Callable[[http.client.HTTPResponse], Any],
+    ) -> Any:
+        """
+        Send GET request following redirects, and consume body of 200 response.
+        :return: Result of consume.
+        """
+        for _ in range(self.__max_redirects + 1):
+            status, location, result = self.__request(url, headers, consume)
+
+            if status in REDIRECT_STATUSES and location:
+                url = urljoin(url, location)
+                continue
+
+            if not status == 200:
+                raise HTTPStatusError(status)
+            return result
+
+        raise RuntimeError(f"Too many redirects: {url}")
+
+    def __request(
+            self,
+            url: str,
+            headers: Dict[str, str],
+            consume: Callable[[http.client.HTTPResponse], Any],
+    ) -> Tuple[int, str, Any]:
+        """
+        Send GET request, and reconnect once if kept alive connection is closed.
+        Body of other than 200 response is discarded.
+        :return: Status, location header and result of consume.
+        """
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+
+        with self.__lock:
+            slot = self.__slots.get(key)
+            if slot is None:
+                slot = self.__slots[key] = BoundedSemaphore(self.__max_per_host)
+                self.__idle[key] = deque()
+                ...
+
+        start, start_cpu = perf_counter(), thread_time()
+        with slot:
+            connection, reused = self.__checkout(key)
+            try:
+                try:
+                    response = self.__send(connection, target, headers)
+                except RECONNECT_ERRORS:
+                    connection.close()
+                    if not reused: raise
+                    with self.__lock: self.__reconnects += 1
+                    connection, reused = self.__connect(key), False
+                    response = self.__send(connection, target, headers)
+                    ...
+                if response.status == 200:
+                    result = consume(response)
+                else:
+                    response.read()
+                    result = None
+                    ...
+                # body left by consume can not be reused
+                if not response.isclosed(): response.read()
+            except BaseException:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                with self.__lock:
+                    self.__idle[key].append(connection)
+                    ...
+
+        metrics.increment(metrics.REQUESTS)
+        metrics.observe_time(
+            metrics.REQUEST_LATENCY, perf_counter() - start, thread_time() - start_cpu
+        )
+        if response.status != 200 and response.status not in REDIRECT_STATUSES:
+            metrics.increment(metrics.REQUEST_ERRORS)
+
+        return response.status, response.getheader("Location", ""), result
+
+    @staticmethod
+    def __send(
+            connection: http.client.HTTPConnection,
+            target: str,
+            headers: Dict[str, str],
+    ) -> http.client.HTTPResponse:
+        connection.request("GET", target, headers=headers)
+        return connection.getresponse()
+
+    def __checkout(self, key: Tuple[str, str]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self.__lock:
+            idle = self.__idle[key]
+            if idle: return idle.pop(), True
+            ...
+        return self.__connect(key), False
+
+    def __connect(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        connection_class = (
+            http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        )
+        with self.__lock: self.__connects += 1
+        return connection_class(netloc, timeout=self.__timeout)
+
+    ...
+
+
 """ download from internet """
 
 
-def download(url: str, headers=None) -> bytes:
+def _urlopen(
+        url: str,
+        headers: Union[Dict[str, str], None],
+        consume: Callable[[http.client.HTTPResponse], Any],
+) -> Any:
+    """
+    Send GET request by urllib, and consume body of 200 response.
+    Redirects and proxy environment variables are followed by urllib.
+    :return: Result of consume.
+    """
+    start, start_cpu = perf_counter(), thread_time()
+    try:
+        with urlopen(Request(url, headers=headers or {})) as response:
+            if not response.status == 200:
+                raise RuntimeError(response.status)
+            return consume(response)
+    except HTTPError:
+        metrics.increment(metrics.REQUEST_ERRORS)
+        raise
+    finally:
+        metrics.increment(metrics.REQUESTS)
+        metrics.observe_time(
+            metrics.REQUEST_LATENCY, perf_counter() - start, thread_time() - start_cpu
+        )
+
+
+def download(
+        url: str,
+        headers=None,
+        pool: ConnectionPool = None,
+        retry: RetryPolicy = None,
+) -> bytes:
     """
     Download file function.
+    Without pool, file is requested by urllib, and urllib.error.HTTPError is raised
+    for error status. With pool, HTTPStatusError is raised instead.
     :param url: File URL to download.
     :param headers: Request headers.
+    :param pool: Keep-alive connection pool. Requested by urllib if None.
+    :param retry: Retry policy of failed request. Not retried if None.
     :return: Downloaded file.
     """
-    # request
-    req = Request(url, headers=headers)
+    if pool is None:
+        get = lambda: _urlopen(url, headers, _read)
+    else:
+        get = lambda: pool.get(url, headers)
+
+    if retry is None:
+        return get()
+
+    return retry.call(get)
+
+
+def download_stream(
+        url: str,
+        consume: Callable[[Iterator[bytes]], Any],
+        headers=None,
+        pool: ConnectionPool = None,
+) -> Any:
+    """
+    Download file, and pass it to consume in chunks while it is received.
+    :param url: File URL to download.
+    :param consume: Function that consumes iterator of body chunks.
+    :param headers: Request headers.
+    :param pool: Keep-alive connection pool. Requested by urllib if None.
+    :return: Result of consume.
+    """
+    if pool is None:
+        return _urlopen(url, headers, lambda response: consume(_iter_chunks(response)))
+
+    return pool.stream(url, consume, headers)
+
+
+""" Bulk download """
+
+
+class DownloadReport:
+    """
+    Result and throughput of bulk download.
+    installed holds results of downloaded items in completed order, succeeded is
+    set of them, and failed holds exception of each failed item.
+    """
+
+    def __init__(self) -> None:
+        """ Initialize counters. """
+        self.installed: List[Any] = []
+        self.skipped: List[Any] = []
+        self.failed: Dict[Any, BaseException] = {}
+        self.bytes: int = 0
+        self.elapsed: float = 0.0
+        return
+
+    @property
+    def succeeded(self) -> Set[Any]: return set(self.installed)
+
+    @property
+    def downloaded(self) -> int: return len(self.installed)
+
+    @property
+    def requested(self) -> int:
+        return len(self.installed) + len(self.skipped) + len(self.failed)
+
+    @property
+    def requests_per_second(self) -> float:
+        return (self.downloaded + len(self.failed)) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(downloaded={self.downloaded}, "
+            f"skipped={len(self.skipped)}, failed={len(self.failed)}, "
+            f"bytes={self.bytes}, elapsed={self.elapsed:.3f}, "
+            f"requests_per_second={self.requests_per_second:.2f})"
+        )
+
+    ...
+
+
+def download_many(
+        items: Iterable[Any],
+        task: Callable[[Any], Union[Tuple[Any, int], None]],
+        workers: int = 4,
+) -> DownloadReport:
+    """
+    Run download task of each item over bounded thread pool.
+    At most twice of workers items are submitted at once,
+    so items can be long iterator.
+    :param items: Items to download such as game ids.
+    :param task: Function that downloads item, and returns result and bytes size,
+    or None if item is skipped.
+    :param workers: Number of concurrent downloads.
+    :return: Report of downloads.
+    """
+    if workers < 1:
+        raise ValueError("workers must be 1 or more.")
+
+    report = DownloadReport()
+    start = perf_counter()
+
+    def collect(done) -> None:
+        for future in done:
+            item = pending.pop(future)
+            try:
+                result = future.result()
+            except Exception as error:
+                report.failed[item] = error
+                continue
+            if result is None:
+                report.skipped.append(item)
+                continue
+            report.installed.append(result[0])
+            report.bytes += result[1]
+            continue
+        return
+
+    pending: Dict[Any, Any] = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+
+        for item in items:
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+                ...
+            pending[executor.submit(task, item)] = item
+            continue
 
-    # check response
-    with urlopen(req) as response:
-        if not response.status == 200:
-            raise RuntimeError(response.status)
-        result: bytes = response.read()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+            continue
 
-    return result
+    report.elapsed = perf_counter() - start
 
+    return report
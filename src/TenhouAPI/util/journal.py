@@ -0,0 +1,245 @@
+""" Utility tools that journal downloads.
+"""
+
+
+# types
+
+
+from typing import (
+    Dict,
+    Iterable,
+    Set,
+    Union,
+)
+
+
+# libs
+
+
+import sqlite3
+from threading import Lock
+from time import time
+
+
+""" Journal tools
+"""
+
+
+""" States """
+
+
+PENDING: str = "pending"
+IN_FLIGHT: str = "in-flight"
+DONE: str = "done"
+FAILED: str = "failed"
+
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+
+""" Download journal """
+
+
+class DownloadJournal:
+    """
+    Persistent journal of download state of each key in SQLite.
+    Keys left in-flight by crashed run are returned to pending on open.
+    """
+
+    SCHEMA: str = (
+        "CREATE TABLE IF NOT EXISTS downloads ("
+        "key TEXT PRIMARY KEY, "
+        "state TEXT NOT NULL, "
+        "size INTEGER NOT NULL DEFAULT 0, "
+        "attempts INTEGER NOT NULL DEFAULT 0, "
+        "error TEXT, "
+        "updated REAL NOT NULL)"
+    )
+
+    """ Initialize """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open journal database, and recover in-flight keys.
+        :param path: Database file path.
+        """
+        self.__path = path
+        self.__lock = Lock()
+
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        with self.__lock, self.__connection as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(self.SCHEMA)
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS downloads_state ON downloads (state)"
+            )
+            connection.execute(
+                "UPDATE downloads SET state = ? WHERE state = ?", (PENDING, IN_FLIGHT)
+            )
+            ...
+        return
+
+    @property
+    def path(self) -> str: return self.__path
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.__path}', {self.counts()})"
+
+    def __enter__(self) -> "DownloadJournal": return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        return
+
+    def close(self) -> None:
+        """
+        Close journal database.
+        :return: None
+        """
+        with self.__lock:
+            self.__connection.close()
+            ...
+        return
+
+    """ Update """
+
+    def add(self, keys: Iterable[str]) -> None:
+        """
+        Record keys as pending. Recorded keys are not changed.
+        :param keys: Keys to record.
+        :return: None
+        """
+        now = time()
+        self.__write(
+            "INSERT OR IGNORE INTO downloads (key, state, updated) VALUES (?, ?, ?)",
+            ((key, PENDING, now) for key in keys),
+            many=True,
+        )
+        return
+
+    def start(self, key: str) -> None:
+        """
+        Record attempt of key as in-flight.
+        :param key: Key to download.
+        :return: None
+        """
+        self.__write(
+            "INSERT INTO downloads (key, state, attempts, updated) VALUES (?, ?, 1, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "state = excluded.state, attempts = attempts + 1, updated = excluded.updated",
+            (key, IN_FLIGHT, time()),
+        )
+        return
+
+    def done(self, key: str, size: int) -> None:
+        """
+        Record key as done.
+        :param key: Downloaded key.
+        :param size: Byte size of downloaded data.
+        :return: None
+        """
+        self.__write(
+            "INSERT INTO downloads (key, state, size, updated) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "state = excluded.state, size = excluded.size, error = NULL, updated = excluded.updated",
+            (key, DONE, size, time()),
+        )
+        return
+
+    def fail(self, key: str, error: Union[BaseException, str]) -> None:
+        """
+        Record key as failed.
+        :param key: Failed key.
+        :param error: Error of last attempt.
+        :return: None
+        """
+        self.__write(
+            "INSERT INTO downloads (key, state, error, updated) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET "
+            "state = excluded.state, error = excluded.error, updated = excluded.updated",
+            (key, FAILED, repr(error), time()),
+        )
+        return
+
+    """ Query """
+
+    def state(self, key: str) -> Union[str, None]:
+        """
+        Return state of key.
+        :param key: Key to look up.
+        :return: State. None if not recorded.
+        """
+        row = self.__read("SELECT state FROM downloads WHERE key = ?", (key,))
+        return row[0][0] if row else None
+
+    def entry(self, key: str) -> Union[Dict[str, object], None]:
+        """
+        Return recorded values of key.
+        :param key: Key to look up.
+        :return: state, size, attempts and error. None if not recorded.
+        """
+        row = self.__read(
+            "SELECT state, size, attempts, error FROM downloads WHERE key = ?", (key,)
+        )
+        if not row: return None
+        return dict(zip(("state", "size", "attempts", "error"), row[0]))
+
+    def states(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Return states of recorded keys in one query.
+        :param keys: Keys to look up. Up to hundreds of keys at once.
+        :return: State of each recorded key. Keys not recorded are left out.
+        """
+        keys = tuple(keys)
+        if not keys: return {}
+        return dict(self.__read(
+            "SELECT key, state FROM downloads WHERE key IN ({marks})".format(
+                marks=", ".join("?" * len(keys))
+            ),
+            keys,
+        ))
+
+    def keys(self, *states: str) -> Set[str]:
+        """
+        Return keys in states.
+        :param states: States to select. All states if empty.
+        :return: Keys.
+        """
+        if not states:
+            return {row[0] for row in self.__read("SELECT key FROM downloads")}
+        return {
+            row[0] for row in self.__read(
+                "SELECT key FROM downloads WHERE state IN ({marks})".format(
+                    marks=", ".join("?" * len(states))
+                ),
+                states,
+            )
+        }
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Return number of keys of each state.
+        :return: Count of each state.
+        """
+        counts = dict.fromkeys(STATES, 0)
+        for state, count in self.__read(
+                "SELECT state, COUNT(*) FROM downloads GROUP BY state"
+        ):
+            counts[state] = count
+            continue
+        return counts
+
+    """ Internal """
+
+    def __write(self, sql: str, parameters, many: bool = False) -> None:
+        with self.__lock, self.__connection as connection:
+            if many: connection.executemany(sql, parameters)
+            else: connection.execute(sql, parameters)
+            ...
+        return
+
+    def __read(self, sql: str, parameters=()) -> list:
+        with self.__lock:
+            return self.__connection.execute(sql, parameters).fetchall()
+
+    ...
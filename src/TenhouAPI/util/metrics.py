@@ -0,0 +1,290 @@
+""" Utility tools that report logs and metrics.
+"""
+
+
+# types
+
+
+from typing import (
+    ContextManager,
+    Dict,
+    List,
+    Union,
+)
+
+
+# libs
+
+
+import logging
+from threading import Lock
+from time import perf_counter, thread_time
+
+
+""" Logger
+"""
+
+
+# logger of package. Nothing is output until user configures logging.
+logger: logging.Logger = logging.getLogger("TenhouAPI")
+logger.addHandler(logging.NullHandler())
+
+
+""" Metric names
+"""
+
+
+# counters
+REQUESTS: str = "download.requests"
+REQUEST_ERRORS: str = "download.errors"
+BYTES_DOWNLOADED: str = "download.bytes"
+BYTES_WRITTEN: str = "file.bytes"
+
+# histograms of seconds
+REQUEST_LATENCY: str = "download.latency"
+SLEEP_TIME: str = "download.sleep"
+DECOMPRESS_TIME: str = "zip.decompress"
+WRITE_TIME: str = "file.write"
+PARSE_TIME: str = "game_log.parse"
+EXTRACT_TIME: str = "game_id.extract"
+
+
+""" Sinks
+"""
+
+
+class _Timer:
+    """ Observe wall and CPU seconds of with block to sink """
+
+    __slots__ = ("__sink", "__name", "__start", "__start_cpu")
+
+    def __init__(self, sink: "MetricsSink", name: str) -> None:
+        self.__sink = sink
+        self.__name = name
+        return
+
+    def __enter__(self) -> "_Timer":
+        self.__start = perf_counter()
+        self.__start_cpu = thread_time()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__sink.observe_time(
+            self.__name, perf_counter() - self.__start, thread_time() - self.__start_cpu
+        )
+        return
+
+    ...
+
+
+class _NullTimer:
+    """ Timer that does nothing """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullTimer": return self
+
+    def __exit__(self, *args) -> None: return
+
+    ...
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class MetricsSink:
+    """
+    Receiver of metrics. Subclass and override increment and observe,
+    and attach it by set_sink. Methods are called from many threads.
+    Base class ignores all metrics.
+    """
+
+    # whether time is measured for this sink
+    measures_time: bool = True
+
+    def increment(self, name: str, value: Union[int, float] = 1) -> None:
+        """
+        Add value to counter.
+        :param name: Counter name.
+        :param value: Value to add.
+        :return: None
+        """
+        return
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Record value of histogram.
+        :param name: Histogram name.
+        :param value: Observed value such as seconds.
+        :return: None
+        """
+        return
+
+    def observe_time(self, name: str, wall: float, cpu: float) -> None:
+        """
+        Record time of histogram. Wall seconds are observed by default.
+        :param name: Histogram name.
+        :param wall: Wall seconds.
+        :param cpu: CPU seconds of the thread.
+        :return: None
+        """
+        self.observe(name, wall)
+        return
+
+    def timer(self, name: str) -> ContextManager:
+        """
+        Return context manager that observes wall and CPU seconds of with block.
+        :param name: Histogram name.
+        :return: Timer.
+        """
+        return _Timer(self, name)
+
+    ...
+
+
+class NullSink(MetricsSink):
+    """ Sink that ignores metrics without measuring time. Default sink """
+
+    measures_time: bool = False
+
+    def observe_time(self, name: str, wall: float, cpu: float) -> None: return
+
+    def timer(self, name: str) -> ContextManager: return _NULL_TIMER
+
+    ...
+
+
+class InMemorySink(MetricsSink):
+    """
+    Sink that keeps counters and values of histograms in memory.
+    """
+
+    def __init__(self) -> None:
+        """ Initialize counters and histograms. """
+        self.__lock = Lock()
+        self.__counters: Dict[str, Union[int, float]] = {}
+        self.__histograms: Dict[str, List[float]] = {}
+        return
+
+    def increment(self, name: str, value: Union[int, float] = 1) -> None:
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+            ...
+        return
+
+    def observe(self, name: str, value: float) -> None:
+        with self.__lock:
+            self.__histograms.setdefault(name, []).append(value)
+            ...
+        return
+
+    @property
+    def counters(self) -> Dict[str, Union[int, float]]:
+        with self.__lock:
+            return dict(self.__counters)
+
+    @property
+    def histograms(self) -> Dict[str, List[float]]:
+        with self.__lock:
+            return {name: list(values) for name, values in self.__histograms.items()}
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return count, total, min, mean and max of each histogram.
+        :return: Summary of each histogram.
+        """
+        return {
+            name: {
+                "count": len(values),
+                "total": sum(values),
+                "min": min(values),
+                "mean": sum(values) / len(values),
+                "max": max(values),
+            }
+            for name, values in self.histograms.items()
+        }
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(counters={self.counters})"
+
+    ...
+
+
+""" Current sink
+"""
+
+
+_sink: MetricsSink = NullSink()
+
+
+def get_sink() -> MetricsSink:
+    """
+    Return current sink.
+    :return: Sink.
+    """
+    return _sink
+
+
+def set_sink(sink: Union[MetricsSink, None]) -> MetricsSink:
+    """
+    Replace current sink.
+    :param sink: Sink to attach. NullSink if None.
+    :return: Previous sink.
+    """
+    global _sink
+    previous = _sink
+    _sink = NullSink() if sink is None else sink
+    return previous
+
+
+def increment(name: str, value: Union[int, float] = 1) -> None:
+    """
+    Add value to counter of current sink.
+    :param name: Counter name.
+    :param value: Value to add.
+    :return: None
+    """
+    _sink.increment(name, value)
+    return
+
+
+def observe(name: str, value: float) -> None:
+    """
+    Record value of histogram of current sink.
+    :param name: Histogram name.
+    :param value: Observed value.
+    :return: None
+    """
+    _sink.observe(name, value)
+    return
+
+
+def observe_time(name: str, wall: float, cpu: float) -> None:
+    """
+    Record time of histogram of current sink.
+    :param name: Histogram name.
+    :param wall: Wall seconds.
+    :param cpu: CPU seconds of the thread.
+    :return: None
+    """
+    _sink.observe_time(name, wall, cpu)
+    return
+
+
+def measures_time() -> bool:
+    """
+    Return whether current sink measures time.
+    Loops that accumulate time by themselves check it once before the loop,
+    so clocks are not read with the default NullSink.
+    :return: True if time is measured.
+    """
+    return _sink.measures_time
+
+
+def timer(name: str) -> ContextManager:
+    """
+    Return timer of current sink that observes wall and CPU seconds of with block.
+    :param name: Histogram name.
+    :return: Timer.
+    """
+    return _sink.timer(name)
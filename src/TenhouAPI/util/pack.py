@@ -0,0 +1,287 @@
+""" Utility tools that pack small files into segment files.
+"""
+
+
+# types
+
+
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
+
+
+# libs
+
+
+import mmap
+import os
+import re
+import sqlite3
+from threading import Lock
+
+
+""" Pack tools
+"""
+
+
+SEGMENT_FILE_FORMAT: str = "segment-{number:05d}.pack"
+SEGMENT_FILE_PATTERN: re.Pattern = re.compile(r"^segment-(\d{5})\.pack$")
+INDEX_FILE_NAME: str = "index.sqlite3"
+
+
+""" Pack store """
+
+
+class PackStore:
+    """
+    Store of bytes by key, appended to large segment files.
+    Index of key to (segment, offset, length) is kept in SQLite,
+    and bytes are read by random access through mmap of segments.
+    Data is written and synced to disk before its index entry is committed,
+    so crash leaves only unused bytes.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            directory: str,
+            segment_size: int = 1 << 30,
+    ) -> None:
+        """
+        Open pack directory.
+        :param directory: Directory of segment and index files.
+        :param segment_size: Size of segment to start next segment.
+        """
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+            ...
+
+        self.__directory = directory
+        self.__segment_size = segment_size
+        self.__lock = Lock()
+
+        self.__connection = sqlite3.connect(
+            os.path.join(directory, INDEX_FILE_NAME), check_same_thread=False
+        )
+        with self.__lock, self.__connection as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, "
+                "segment INTEGER NOT NULL, "
+                "offset INTEGER NOT NULL, "
+                "length INTEGER NOT NULL)"
+            )
+            ...
+
+        # last segment to append
+        numbers = [
+            int(match.group(1))
+            for match in map(SEGMENT_FILE_PATTERN.match, os.listdir(directory))
+            if match is not None
+        ]
+        self.__segment = max(numbers, default=0)
+        self.__writer = None
+
+        # mapped segments
+        self.__maps: Dict[int, mmap.mmap] = {}
+
+        return
+
+    @property
+    def directory(self) -> str: return self.__directory
+
+    def segment_path(self, segment: int) -> str:
+        """
+        Return path of segment file.
+        :param segment: Segment number.
+        :return: Segment file path.
+        """
+        return os.path.join(self.__directory, SEGMENT_FILE_FORMAT.format(number=segment))
+
+    def __len__(self) -> int:
+        return self.__read("SELECT COUNT(*) FROM entries")[0][0]
+
+    def __contains__(self, key: str) -> bool:
+        return bool(self.__read("SELECT 1 FROM entries WHERE key = ?", (key,)))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.__directory}', entries={len(self)})"
+
+    def __enter__(self) -> "PackStore": return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+        return
+
+    def close(self) -> None:
+        """
+        Close segments and index.
+        :return: None
+        """
+        with self.__lock:
+            if self.__writer is not None:
+                self.__writer.close()
+                self.__writer = None
+            for mapped in self.__maps.values():
+                mapped.close()
+                continue
+            self.__maps.clear()
+            self.__connection.close()
+            ...
+        return
+
+    """ Write """
+
+    def put(self, key: str, data: bytes) -> Tuple[int, int, int]:
+        """
+        Append bytes of key. Bytes of same key are replaced.
+        :param key: Key of bytes.
+        :param data: Bytes to store.
+        :return: Segment, offset and length.
+        """
+        return self.put_many(((key, data),))[0]
+
+    def put_many(self, items: Iterable[Tuple[str, bytes]]) -> List[Tuple[int, int, int]]:
+        """
+        Append bytes of keys, and index them in one transaction.
+        Segments are synced once per call, so many items are cheaper than many puts.
+        :param items: Keys and bytes to store.
+        :return: Segment, offset and length of each item.
+        """
+        with self.__lock:
+            entries = []
+            for key, data in items:
+                writer = self.__get_writer(len(data))
+                offset = writer.tell()
+                writer.write(data)
+                entries.append((key, self.__segment, offset, len(data)))
+                continue
+            if self.__writer is not None: self.__sync(self.__writer)
+
+            with self.__connection as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", entries
+                )
+                ...
+
+        return [entry[1:] for entry in entries]
+
+    """ Read """
+
+    def locate(self, key: str) -> Union[Tuple[int, int, int], None]:
+        """
+        Return location of key.
+        :param key: Key of bytes.
+        :return: Segment, offset and length. None if not stored.
+        """
+        row = self.__read("SELECT segment, offset, length FROM entries WHERE key = ?", (key,))
+        return row[0] if row else None
+
+    def get(self, key: str) -> bytes:
+        """
+        Read bytes of key.
+        :param key: Key of bytes.
+        :return: Stored bytes.
+        """
+        location = self.locate(key)
+        if location is None: raise KeyError(key)
+        return self.read_at(*location)
+
+    def read_at(self, segment: int, offset: int, length: int) -> bytes:
+        """
+        Read bytes at location through mmap of segment.
+        :param segment: Segment number.
+        :param offset: Offset in segment.
+        :param length: Length of bytes.
+        :return: Bytes.
+        """
+        # empty segment can not be mapped
+        if length == 0: return b""
+
+        with self.__lock:
+            mapped = self.__maps.get(segment)
+
+            # remap segment grown after mapped
+            if mapped is None or len(mapped) < offset + length:
+                if mapped is not None: mapped.close()
+                if segment == self.__segment and self.__writer is not None:
+                    self.__writer.flush()
+                with open(self.segment_path(segment), "rb") as f_segment:
+                    mapped = mmap.mmap(f_segment.fileno(), 0, access=mmap.ACCESS_READ)
+                    ...
+                self.__maps[segment] = mapped
+                ...
+
+            return mapped[offset:offset + length]
+
+    def keys(self) -> List[str]:
+        """
+        Return stored keys.
+        :return: Sorted keys.
+        """
+        return [row[0] for row in self.__read("SELECT key FROM entries ORDER BY key")]
+
+    def sizes(self) -> Dict[str, int]:
+        """
+        Return length of each key.
+        :return: Length of each key.
+        """
+        return dict(self.__read("SELECT key, length FROM entries"))
+
+    """ Internal """
+
+    def __get_writer(self, length: int):
+        if self.__writer is None:
+            self.__writer = self.__open_segment(self.__segment)
+            ...
+
+        # start next segment
+        if self.__writer.tell() > 0 and self.__writer.tell() + length > self.__segment_size:
+            self.__sync(self.__writer)
+            self.__writer.close()
+            self.__segment += 1
+            self.__writer = self.__open_segment(self.__segment)
+            ...
+
+        return self.__writer
+
+    def __open_segment(self, segment: int):
+        """
+        Open segment to append. Directory is synced when segment is created,
+        so new segment file is not lost after its index entry is committed.
+        :param segment: Segment number.
+        :return: Writer of segment.
+        """
+        segment_path = self.segment_path(segment)
+        created = not os.path.exists(segment_path)
+        writer = open(segment_path, "ab")
+
+        # directory can not be opened to sync on some platforms such as Windows
+        if created and hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self.__directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            ...
+
+        return writer
+
+    @staticmethod
+    def __sync(writer) -> None:
+        writer.flush()
+        os.fsync(writer.fileno())
+        return
+
+    def __read(self, sql: str, parameters=()) -> list:
+        with self.__lock:
+            return self.__connection.execute(sql, parameters).fetchall()
+
+    ...
@@ -0,0 +1,204 @@
+""" Utility tools that profile stages of download, install and parse.
+"""
+
+
+# types
+
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Union,
+)
+
+
+# libs
+
+
+import json
+import sys
+from threading import Lock
+from time import perf_counter, process_time
+
+from . import metrics
+from .metrics import MetricsSink
+
+
+""" Profiling tools
+"""
+
+
+# modules of instrumentation that are not call sites
+_SKIP_MODULES: Tuple[str, ...] = (metrics.__name__, __name__)
+
+# packages whose functions are reported as call sites
+CALL_SITE_PACKAGES: Tuple[str, ...] = ("TenhouAPI.game_id", "TenhouAPI.game_log")
+
+
+def find_call_site(depth: int = 64) -> str:
+    """
+    Return function of game_id or game_log package nearest to current frame.
+    Nearest function out of instrumentation is returned if none of them is found.
+    Local functions and lambdas are reported as function that defines them.
+    :param depth: Max frames to walk.
+    :return: Call site such as "TenhouAPI.game_log.download:download_game_log".
+    """
+    frame = sys._getframe(1)
+    fallback = None
+
+    for _ in range(depth):
+        if frame is None: break
+        module = frame.f_globals.get("__name__", "")
+        if module not in _SKIP_MODULES:
+            call_site = "{module}:{function}".format(
+                module=module, function=frame.f_code.co_qualname.split(".<locals>", 1)[0],
+            )
+            if module.startswith(CALL_SITE_PACKAGES): return call_site
+            if fallback is None: fallback = call_site
+        frame = frame.f_back
+        continue
+
+    return fallback or "unknown"
+
+
+class Profiler(MetricsSink):
+    """
+    Opt-in profiler of stages such as request, sleep, decompress, write, parse and extract.
+    Used as with statement, it is attached as metrics sink, and records wall and CPU
+    seconds of each stage per call site in game_id and game_log packages.
+    Metrics are also passed to sink attached before.
+    Stages may nest, for example request of streamed hour file includes decompress and write.
+    Work in worker processes of process pools is not recorded.
+    """
+
+    """ Initialize """
+
+    def __init__(self) -> None:
+        """ Initialize records. """
+        self.__lock = Lock()
+        self.__stages: Dict[Tuple[str, str], List[float]] = {}
+        self.__counters: Dict[str, Union[int, float]] = {}
+        self.__previous: Union[MetricsSink, None] = None
+        self.__elapsed = 0.0
+        self.__cpu = 0.0
+        return
+
+    def __enter__(self) -> "Profiler":
+        self.__previous = metrics.set_sink(self)
+        self.__start = perf_counter()
+        self.__start_cpu = process_time()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__elapsed += perf_counter() - self.__start
+        self.__cpu += process_time() - self.__start_cpu
+        metrics.set_sink(self.__previous)
+        self.__previous = None
+        return
+
+    """ Sink """
+
+    def increment(self, name: str, value: Union[int, float] = 1) -> None:
+        with self.__lock:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+            ...
+        if self.__previous is not None: self.__previous.increment(name, value)
+        return
+
+    def observe(self, name: str, value: float) -> None:
+        if self.__previous is not None: self.__previous.observe(name, value)
+        return
+
+    def observe_time(self, name: str, wall: float, cpu: float) -> None:
+        key = (name, find_call_site())
+        with self.__lock:
+            record = self.__stages.get(key)
+            if record is None:
+                record = self.__stages[key] = [0, 0.0, 0.0, 0.0]
+            record[0] += 1
+            record[1] += wall
+            record[2] += cpu
+            record[3] = max(record[3], wall)
+            ...
+        if self.__previous is not None: self.__previous.observe_time(name, wall, cpu)
+        return
+
+    """ Report """
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return machine-readable records.
+        :return: Wall and CPU seconds of profiled block, counters,
+        and calls, wall, CPU and max wall seconds of each stage and call site.
+        """
+        with self.__lock:
+            stages = [
+                {
+                    "stage": name,
+                    "call_site": call_site,
+                    "calls": calls,
+                    "wall": wall,
+                    "cpu": cpu,
+                    "max_wall": max_wall,
+                }
+                for (name, call_site), (calls, wall, cpu, max_wall) in self.__stages.items()
+            ]
+            counters = dict(self.__counters)
+            ...
+        stages.sort(key=lambda stage: stage["wall"], reverse=True)
+        return {
+            "elapsed": self.__elapsed,
+            "cpu": self.__cpu,
+            "counters": counters,
+            "stages": stages,
+        }
+
+    def dump(self, file_path: str) -> None:
+        """
+        Write records as JSON.
+        :param file_path: JSON file path.
+        :return: None
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(self.stats(), f, indent=2)
+            ...
+        return
+
+    def summary(self) -> str:
+        """
+        Return table of stages in order of wall seconds.
+        Share is wall seconds of stage per wall seconds of profiled block,
+        and can be over 100% when threads run stages at once.
+        :return: Summary table.
+        """
+        stats = self.stats()
+        elapsed = stats["elapsed"]
+
+        lines = [
+            f"elapsed {elapsed:.3f} s, process cpu {stats['cpu']:.3f} s",
+            "{:<18} {:<60} {:>7} {:>10} {:>10} {:>7} {:>10} {:>10}".format(
+                "stage", "call site", "calls", "wall s", "cpu s", "share", "mean ms", "max ms"
+            ),
+        ]
+        for stage in stats["stages"]:
+            lines.append(
+                "{:<18} {:<60} {:>7} {:>10.3f} {:>10.3f} {:>6.1f}% {:>10.3f} {:>10.3f}".format(
+                    stage["stage"], stage["call_site"][-60:], stage["calls"],
+                    stage["wall"], stage["cpu"],
+                    100 * stage["wall"] / elapsed if elapsed else 0.0,
+                    1000 * stage["wall"] / stage["calls"], 1000 * stage["max_wall"],
+                )
+            )
+            continue
+        for name, value in sorted(stats["counters"].items()):
+            lines.append(f"{name}: {value}")
+            continue
+
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(stages={len(self.__stages)}, elapsed={self.__elapsed:.3f})"
+
+    ...
@@ -0,0 +1,103 @@
+""" Utility tools that limit rate of requests.
+"""
+
+
+# types
+
+
+from typing import (
+    Union,
+)
+
+
+# libs
+
+
+from threading import Lock
+from time import monotonic, sleep
+
+
+""" Rate limit tools
+"""
+
+
+""" Token bucket """
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter shared by threads.
+    Tokens are refilled at rate per second up to burst,
+    and each request takes one token or waits for it.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            rate: float,
+            burst: Union[int, float] = 1,
+    ) -> None:
+        """
+        Assign rate and capacity of bucket.
+        :param rate: Tokens refilled per second.
+        :param burst: Max tokens stored in bucket.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if burst < 1:
+            raise ValueError("burst must be 1 or more.")
+
+        self.__rate = float(rate)
+        self.__burst = float(burst)
+
+        self.__tokens = float(burst)
+        self.__updated = monotonic()
+        self.__lock = Lock()
+        return
+
+    @property
+    def rate(self) -> float: return self.__rate
+
+    @property
+    def burst(self) -> float: return self.__burst
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rate={self.__rate}, burst={self.__burst})"
+
+    """ Acquire """
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens if available.
+        :param tokens: Number of tokens to take.
+        :return: 0 if taken, else seconds to wait until available.
+        """
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                self.__burst, self.__tokens + (now - self.__updated) * self.__rate
+            )
+            self.__updated = now
+
+            if self.__tokens >= tokens:
+                self.__tokens -= tokens
+                return 0.0
+
+            return (tokens - self.__tokens) / self.__rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens, and wait until they are available.
+        :param tokens: Number of tokens to take.
+        :return: Seconds waited.
+        """
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait == 0: return waited
+            sleep(wait)
+            waited += wait
+            continue
+
+    ...
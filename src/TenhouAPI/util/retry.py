@@ -0,0 +1,143 @@
+""" Utility tools that retry failed requests.
+"""
+
+
+# types
+
+
+from typing import (
+    Any,
+    Callable,
+    Tuple,
+    Union,
+)
+
+
+# libs
+
+
+import http.client
+import random
+from time import sleep
+from urllib.error import HTTPError
+
+
+""" Retry tools
+"""
+
+
+# statuses of server that may succeed later
+RETRY_STATUSES: Tuple[int, ...] = (408, 429, 500, 502, 503, 504)
+
+
+""" HTTP status error """
+
+
+class HTTPStatusError(RuntimeError):
+    """
+    Error of response other than 200.
+    args[0] is status same as RuntimeError raised before.
+    """
+
+    @property
+    def status(self) -> int: return self.args[0]
+
+    ...
+
+
+""" Retry policy """
+
+
+class RetryPolicy:
+    """
+    Retry with exponential backoff and full jitter.
+    Delay of n-th retry is random in [0, min(max_delay, base_delay * 2 ** n)].
+    Network errors and statuses of retry_statuses are retried.
+    """
+
+    """ Initialize """
+
+    def __init__(
+            self,
+            attempts: int = 5,
+            base_delay: float = 1.0,
+            max_delay: float = 60.0,
+            jitter: bool = True,
+            retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+            seed: Union[int, None] = None,
+    ) -> None:
+        """
+        Assign retry settings.
+        :param attempts: Max attempts including first one.
+        :param base_delay: Delay of first retry in seconds.
+        :param max_delay: Max delay in seconds.
+        :param jitter: Randomize delay if True.
+        :param retry_statuses: HTTP statuses to retry.
+        :param seed: Seed of jitter.
+        """
+        if attempts < 1:
+            raise ValueError("attempts must be 1 or more.")
+
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.__random = random.Random(seed)
+        return
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(attempts={self.attempts}, base_delay={self.base_delay}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter})"
+        )
+
+    """ Policy """
+
+    def delay(self, retry: int) -> float:
+        """
+        Return delay before retry.
+        :param retry: Number of retry from 0.
+        :return: Delay in seconds.
+        """
+        delay = min(self.max_delay, self.base_delay * (2 ** retry))
+        if self.jitter: delay = self.__random.uniform(0, delay)
+        return delay
+
+    def should_retry(self, error: BaseException) -> bool:
+        """
+        Return whether error may succeed by retry.
+        :param error: Raised error.
+        :return: True if retryable.
+        """
+        if isinstance(error, HTTPStatusError):
+            return error.status in self.retry_statuses
+        if isinstance(error, HTTPError):
+            return error.code in self.retry_statuses
+        return isinstance(error, (OSError, http.client.HTTPException, EOFError))
+
+    def call(
+            self,
+            func: Callable[[], Any],
+            on_retry: Callable[[BaseException, int, float], None] = None,
+    ) -> Any:
+        """
+        Call function, and retry it after backoff while error is retryable.
+        :param func: Function to call.
+        :param on_retry: Function called with error, retry number and delay before retry.
+        :return: Result of function.
+        """
+        for retry in range(self.attempts):
+            try:
+                return func()
+            except Exception as error:
+                if retry + 1 >= self.attempts or not self.should_retry(error): raise
+                delay = self.delay(retry)
+                if on_retry is not None: on_retry(error, retry, delay)
+                sleep(delay)
+                ...
+            continue
+
+        raise RuntimeError("unreachable")
+
+    ...
@@ -6,16 +6,25 @@
 
 
 from typing import (
+    Any,
     Callable,
+    Iterable,
+    Iterator,
 )
 
 
 # libs
 
 
-import os
 import gzip
+import os
+import zlib
 from abc import ABC, abstractmethod
+from time import perf_counter, thread_time
+
+from . import metrics
+from .metrics import logger
+from .directory_manager import make_temp_file
 
 
 """ Tools of zip file
@@ -32,33 +41,180 @@ class ZipBase(ABC):
 
     EXTENSION: str = None
 
+    """ Streaming """
+
+    CHUNK_SIZE: int = 1 << 16
+
+    # set True when decompressor is overridden, then unzip decompresses in chunks
+    STREAMING: bool = False
+
+    @classmethod
+    def decompressor(cls) -> Any:
+        """
+        Return new decompressor of one member.
+        It has decompress, flush, eof and unused_data same as zlib decompressobj.
+        Override to stream, and set STREAMING, because base class has no decompressor.
+        :return: Decompressor.
+        """
+        raise NotImplementedError(
+            f"{cls.__name__} does not implement decompressor, so it can not decompress "
+            f"in chunks. Override decompressor to stream, or use unzip of file."
+        )
+
+    @classmethod
+    def compress(cls, data: bytes) -> bytes:
+        """
+        Return zipped data of one member. Used by synthetic corpus of testing.
+        :param data: Data to zip.
+        :return: Zipped data.
+        """
+        raise NotImplementedError(f"{cls.__name__} does not implement compress.")
+
+    @classmethod
+    def iter_unzip(cls, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Decompress chunks of zipped data while they are received.
+        Concatenated members are decompressed in order.
+        :param chunks: Chunks of zipped data.
+        :return: Iterator of decompressed chunks.
+        """
+        decompressor = cls.decompressor()
+        fed = False
+        timed = metrics.measures_time()
+        elapsed, elapsed_cpu = 0.0, 0.0
+
+        for chunk in chunks:
+            while chunk:
+                fed = True
+                if timed:
+                    start, start_cpu = perf_counter(), thread_time()
+                    data = decompressor.decompress(chunk)
+                    elapsed += perf_counter() - start
+                    elapsed_cpu += thread_time() - start_cpu
+                else:
+                    data = decompressor.decompress(chunk)
+                if data: yield data
+                if not decompressor.eof: break
+
+                # next member
+                chunk = decompressor.unused_data
+                decompressor = cls.decompressor()
+                fed = False
+                continue
+            continue
+
+        if fed and not decompressor.eof:
+            raise EOFError("Compressed data ended before the end-of-stream marker was reached.")
+
+        data = decompressor.flush()
+        if timed: metrics.observe_time(metrics.DECOMPRESS_TIME, elapsed, elapsed_cpu)
+        if data: yield data
+
+        return
+
+    @classmethod
+    def unzip_stream(cls, chunks: Iterable[bytes], result_path: str) -> int:
+        """
+        Decompress chunks of zipped data into file.
+        The file is written as hidden temporary file in the same directory,
+        and renamed to result path when completed.
+        :param chunks: Chunks of zipped data.
+        :param result_path: Unzipped file path.
+        :return: Size of unzipped file.
+        """
+        fd, temp_path = make_temp_file(result_path)
+
+        size = 0
+        timed = metrics.measures_time()
+        elapsed, elapsed_cpu = 0.0, 0.0
+        try:
+            with os.fdopen(fd, "wb") as f_out:
+                for data in cls.iter_unzip(chunks):
+                    if timed:
+                        start, start_cpu = perf_counter(), thread_time()
+                        f_out.write(data)
+                        elapsed += perf_counter() - start
+                        elapsed_cpu += thread_time() - start_cpu
+                    else:
+                        f_out.write(data)
+                    size += len(data)
+                    continue
+                ...
+            if timed:
+                start, start_cpu = perf_counter(), thread_time()
+                os.replace(temp_path, result_path)
+                elapsed += perf_counter() - start
+                elapsed_cpu += thread_time() - start_cpu
+            else:
+                os.replace(temp_path, result_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+        if timed: metrics.observe_time(metrics.WRITE_TIME, elapsed, elapsed_cpu)
+        metrics.increment(metrics.BYTES_WRITTEN, size)
+        return size
+
+    @classmethod
+    def unzip_bytes(cls, zipped_bytes: bytes, result_path: str) -> int:
+        """
+        Decompress zipped bytes into file in chunks.
+        :param zipped_bytes: Zipped bytes data.
+        :param result_path: Unzipped file path.
+        :return: Size of unzipped file.
+        """
+        view = memoryview(zipped_bytes)
+        return cls.unzip_stream(
+            (view[start:start + cls.CHUNK_SIZE] for start in range(0, len(view), cls.CHUNK_SIZE)),
+            result_path,
+        )
+
+    @classmethod
+    def read_chunks(cls, file_path: str) -> Iterator[bytes]:
+        """
+        Read file in chunks.
+        :param file_path: File path to read.
+        :return: Iterator of chunks.
+        """
+        with open(file_path, "rb") as f_in:
+            yield from iter(lambda: f_in.read(cls.CHUNK_SIZE), b"")
+            ...
+        return
+
     """ Functools """
 
-    @staticmethod
+    @classmethod
     def unzip(
+            cls,
             file_path: str,
             result_path: str = None,
     ) -> None:
         """
         Unpack zip file and save result.
+        gzip file is read by gzip module if zip tool is not STREAMING.
         :param file_path: Zip file path to unzip.
         :param result_path: Unzipped file path.
         :return: None
         """
 
-        print(f"Unzipping: {file_path}")
+        logger.debug("Unzipping: %s", file_path)
 
         # check exists
         if os.path.exists(result_path):
-            print(f"Unzipping is already done: {result_path}")
+            logger.info("Unzipping is already done: %s", result_path)
             return
 
-        # unpack gz and save html
-        with gzip.open(file_path, "rb") as f_in:
-            with open(result_path, "wb") as f_out:
-                f_out.write(f_in.read())
+        # unpack gz and save html as before streaming
+        if not cls.STREAMING:
+            with gzip.open(file_path, "rb") as f_in:
+                with open(result_path, "wb") as f_out:
+                    f_out.write(f_in.read())
+                    ...
                 ...
-            ...
+            return
+
+        # unpack in chunks and save
+        cls.unzip_stream(cls.read_chunks(file_path), result_path)
 
         return
 
@@ -97,6 +253,16 @@ class Gzip(ZipBase):
 
     EXTENSION = ".gz"
 
+    STREAMING = True
+
+    @staticmethod
+    def decompressor() -> Any:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    @staticmethod
+    def compress(data: bytes) -> bytes:
+        return gzip.compress(data)
+
     @staticmethod
     def add_extension(file_path: str, extension: str = EXTENSION) -> str:
         return file_path + extension
@@ -0,0 +1,53 @@
+""" Tenhou.game_id archive tests
+Extract game ids from yearly zip archive of gz members.
+"""
+
+
+import gzip
+import os
+import shutil
+import tempfile
+import zipfile
+
+from TenhouAPI.game_id.manager import GameIdDirectory
+
+
+def hour_file(hour: int) -> bytes:
+    """ Return html of game ids of hour """
+    return "".join(
+        f'{hour:02d}:{idx % 60:02d} | 17 | 四鳳東喰赤－ | '
+        f'<a href="http://tenhou.net/0/?log=20251004{hour:02d}gm-{key}-0000-{idx:08x}">牌譜</a> | '
+        f'A(+50.0) B(+10.0) C(-20.0) D(-40.0)<br>\n'
+        for idx, key in enumerate(("00a9", "00b9", "00e9") * 50)
+    ).encode("utf-8")
+
+
+if __name__ == '__main__':
+    work_dir = tempfile.mkdtemp()
+    try:
+        archive_path = os.path.join(work_dir, "scraw2025.zip")
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            for hour in range(24):
+                archive.writestr(
+                    f"2025/scc20251004{hour:02d}.html.gz", gzip.compress(hour_file(hour))
+                )
+                continue
+            archive.writestr("2025/readme.txt", b"not game ids")
+            ...
+
+        directory = GameIdDirectory(os.path.join(work_dir, "game_ids"))
+        results = directory.extract_game_ids_from_archive(archive_path, workers=2)
+
+        assert list(results) == [f"scc20251004{hour:02d}.html" for hour in range(24)]
+        assert directory.listdir() == []
+
+        # same as extracting from html file
+        html_path = directory.generate_save_file_path("scc2025100405.html")
+        with open(html_path, "wb") as f:
+            f.write(hour_file(5))
+        assert results["scc2025100405.html"] == directory.extract_game_ids_from_file("scc2025100405.html")
+        assert len(results["scc2025100405.html"]) == 100
+    finally:
+        shutil.rmtree(work_dir)
+
+    print("archive tests passed")
@@ -0,0 +1,86 @@
+""" Tenhou.game_id download tests
+Download and unzip game id list from local stand-in server.
+"""
+
+
+import gzip
+import os
+import shutil
+import tempfile
+import threading
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from TenhouAPI.config import TenhouUrlConfig
+from TenhouAPI.game_id.manager import GameIdDirectory
+from TenhouAPI.util.retry import RetryPolicy
+
+
+LINES = "".join(
+    f'00:{idx:02d} | 17 | 四鳳東喰赤－ | '
+    f'<a href="http://tenhou.net/0/?log=2025100400gm-{key}-0000-{idx:08x}">牌譜</a> | '
+    f'A(+50.0) B(+10.0) C(-20.0) D(-40.0)<br>\n'
+    for idx, key in enumerate(("00a9", "00b9", "00e9") * 100)
+)
+
+
+class IdListHandler(BaseHTTPRequestHandler):
+    """ Return gzip of id list """
+
+    requests = 0
+
+    def do_GET(self):
+        IdListHandler.requests += 1
+        if "2025100423" in self.path:
+            self.send_error(404)
+            return
+        body = gzip.compress(LINES.encode("utf-8"))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return
+
+    def log_message(self, *args):
+        return
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IdListHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url_config = TenhouUrlConfig(
+        ids_directory=f"http://127.0.0.1:{server.server_address[1]}/sc/raw/dat/"
+    )
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        directory = GameIdDirectory(save_dir, url_config)
+
+        file_name = directory.download_and_install(2025, 10, 4, 0, sleep_time=0)
+        assert file_name == "scc2025100400.html"
+        assert os.listdir(save_dir) == [file_name]
+
+        ids = directory.extract_game_ids_from_file(file_name)
+        assert len(ids) == 200 and ids[0] == "log=2025100400gm-00a9-0000-00000000"
+
+        # existing hour is downloaded again, and overwritten
+        with open(os.path.join(save_dir, file_name), "w", encoding="utf-8") as f:
+            f.write("partial")
+        assert directory.download_and_install(2025, 10, 4, 0, sleep_time=0) == file_name
+        assert IdListHandler.requests == 2
+        assert directory.extract_game_ids_from_file(file_name) == ids
+
+        # range of hours, existing hour is skipped
+        report = directory.download_range(
+            date(2025, 10, 4), datetime(2025, 10, 5, 0),
+            workers=8, rate=1000, burst=8, retry=RetryPolicy(attempts=2, base_delay=0.01),
+        )
+        assert report.succeeded == {f"scc20251004{hour:02d}.html" for hour in range(1, 23)}
+        assert list(report.failed) == [datetime(2025, 10, 4, 23)]
+        assert IdListHandler.requests == 2 + 23
+        assert len(directory.listdir()) == 23
+    finally:
+        server.shutdown()
+        shutil.rmtree(save_dir)
+
+    print("download tests passed")
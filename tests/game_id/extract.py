@@ -0,0 +1,99 @@
+""" Tenhou.game_id extract tests
+"""
+
+
+import gzip
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.config.game_id import GameIdConfig
+from TenhouAPI.game_id.extract import (
+    extract_game_ids_from_file,
+    extract_game_ids_from_bytes,
+    extract_game_ids_from_chunks,
+    iter_game_id_records,
+    iter_game_id_records_from_file,
+)
+
+
+HOUR_FILE = (
+    '00:03 | 17 | 四鳳東喰赤－ | <a href="http://tenhou.net/0/?log=2025100400gm-00a9-0000-0000000a">牌譜</a> | '
+    'A(+50.0) B B(+10.0) C(-20.0) D(-40.0)<br>\r\n'
+    '00:05 | 23 | 三鳳南喰赤－ | <a href="http://tenhou.net/0/?log=2025100400gm-00b9-0000-0000000b">牌譜</a> | '
+    'E(+60.0,+2枚) F(-10.0,0枚) G(-50.0,-2枚)<br>\r\n'
+    '00:12 | 41 | 四鳳南喰赤－ | <a href="http://tenhou.net/0/?log=2025100400gm-00e9-0000-0000000c">牌譜</a> | '
+    'H(+65.0) I(+5.0) J(-25.0) K(-45.0)<br>\r\n'
+).encode("utf-8")
+
+# line whose layout differs from records
+CHANGED_LINE = (
+    '00:20 | 30 | 四鳳南喰赤－ | 1 | <a href="http://tenhou.net/0/?log=2025100400gm-00a9-0000-0000000d">牌譜</a> | '
+    'L M N O<br>\r\n'
+).encode("utf-8")
+
+
+if __name__ == "__main__":
+
+    # records
+    records = list(iter_game_id_records(HOUR_FILE))
+    assert [record.game_id for record in records] == [
+        "log=2025100400gm-00a9-0000-0000000a", "log=2025100400gm-00e9-0000-0000000c"
+    ]
+    assert records[0].lobby_type == "00a9" and records[0].rule == "四鳳東喰赤－"
+    assert records[0].timestamp == datetime(2025, 10, 4, 0, 3) and records[0].duration == 17
+    assert records[0].players == ("A", "B B", "C", "D")
+    assert records[0].scores == (50.0, 10.0, -20.0, -40.0)
+
+    records = list(iter_game_id_records(HOUR_FILE, ("00b9",)))
+    assert records[0].players == ("E", "F", "G") and records[0].scores == (60.0, -10.0, -50.0)
+
+    # white key compiled into pattern
+    assert extract_game_ids_from_bytes(HOUR_FILE) == [
+        record.game_id for record in iter_game_id_records(HOUR_FILE)
+    ]
+    config = GameIdConfig(game_id_format=r"log=\d{10}gm-\w{4}-\w{4}-\w{8}")
+    assert extract_game_ids_from_bytes(HOUR_FILE, config, ("00b9",)) == [
+        "log=2025100400gm-00b9-0000-0000000b"
+    ]
+
+    # chunks split inside lines
+    chunks = [HOUR_FILE[start:start + 7] for start in range(0, len(HOUR_FILE), 7)]
+    assert extract_game_ids_from_chunks(chunks) == extract_game_ids_from_bytes(HOUR_FILE)
+    assert extract_game_ids_from_chunks(chunks, config, ("00b9",)) == [
+        "log=2025100400gm-00b9-0000-0000000b"
+    ]
+
+    # lines of changed layout are not records, but game ids are extracted same as file
+    changed = HOUR_FILE + CHANGED_LINE
+    assert len(list(iter_game_id_records(changed))) == 2
+    chunks = [changed[start:start + 5] for start in range(0, len(changed), 5)]
+    assert extract_game_ids_from_chunks(chunks) == extract_game_ids_from_bytes(changed) == [
+        "log=2025100400gm-00a9-0000-0000000a",
+        "log=2025100400gm-00e9-0000-0000000c",
+        "log=2025100400gm-00a9-0000-0000000d",
+    ]
+
+    # html and gz files
+    work_dir = tempfile.mkdtemp()
+    try:
+        html_path = os.path.join(work_dir, "scc2025100400.html")
+        with open(html_path, "wb") as f:
+            f.write(HOUR_FILE)
+        with open(html_path + ".gz", "wb") as f:
+            f.write(gzip.compress(HOUR_FILE))
+
+        ids = extract_game_ids_from_file(html_path)
+        assert [record.game_id for record in iter_game_id_records_from_file(html_path)] == ids
+        assert [record.game_id for record in iter_game_id_records_from_file(html_path + ".gz")] == ids
+
+        with open(html_path, "ab") as f:
+            f.write(CHANGED_LINE)
+        assert extract_game_ids_from_file(html_path) == extract_game_ids_from_chunks(
+            [HOUR_FILE, CHANGED_LINE]
+        )
+    finally:
+        shutil.rmtree(work_dir)
+
+    print("extract tests passed")
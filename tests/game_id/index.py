@@ -0,0 +1,71 @@
+""" Tenhou.game_id index tests
+"""
+
+
+import gzip
+import os
+import shutil
+import tempfile
+from datetime import date, datetime
+
+from TenhouAPI.config.manager import WhiteKeyConfig
+from TenhouAPI.game_id.manager import GameIdDirectory
+
+
+def hour_file(day: int, hour: int) -> bytes:
+    """ Return html of hour. Last game of hour is repeated in next hour file """
+    lines = [
+        f'{hour:02d}:{idx * 10:02d} | 17 | 四鳳東喰赤－ | '
+        f'<a href="http://tenhou.net/0/?log=202506{day:02d}{hour:02d}gm-{key}-0000-{idx:08x}">牌譜</a> | '
+        f'P{idx}(+50.0) Q(+10.0) R(-20.0) S(-40.0)<br>\n'
+        for idx, key in enumerate(("00a9", "00b9", "00e9"))
+    ]
+    return "".join(lines).encode("utf-8")
+
+
+if __name__ == '__main__':
+    work_dir = tempfile.mkdtemp()
+    try:
+        directory = GameIdDirectory(work_dir)
+        for day in (1, 2):
+            for hour in range(3):
+                path = directory.generate_save_file_path(f"scc202506{day:02d}{hour:02d}.html")
+                with open(path, "wb") as f:
+                    f.write(hour_file(day, hour))
+                continue
+            continue
+        with open(directory.generate_save_file_path("scc2025070100.html.gz"), "wb") as f:
+            f.write(gzip.compress(hour_file(1, 0).replace(b"202506", b"202507")))
+
+        assert directory.update_index() == 21
+        assert directory.update_index() == 0
+
+        index = directory.index
+        assert len(index) == 21 and len(index.files()) == 7
+
+        # time range
+        june = index.query(date(2025, 6, 1), date(2025, 7, 1))
+        assert len(june) == 18 and june[0] == "log=2025060100gm-00a9-0000-00000000"
+        assert index.count(datetime(2025, 6, 2, 1), datetime(2025, 6, 2, 2)) == 3
+
+        # ruleset
+        assert index.count(white_key=WhiteKeyConfig.player_num_4) == 14
+        assert index.count(date(2025, 6, 1), date(2025, 7, 1), WhiteKeyConfig.player_num_3) == 6
+
+        # player
+        assert index.count(player="Q") == 21
+        assert index.query(player="P2", white_key=("00e9",), limit=2) == [
+            "log=2025060100gm-00e9-0000-00000002", "log=2025060101gm-00e9-0000-00000002"
+        ]
+        assert index.players(june[0]) == [("P0", 50.0), ("Q", 10.0), ("R", -20.0), ("S", -40.0)]
+
+        # incremental update and deduplication
+        path = directory.generate_save_file_path("scc2025060203.html")
+        with open(path, "wb") as f:
+            f.write(hour_file(2, 3) + hour_file(2, 2))
+        assert directory.update_index() == 3 and len(index) == 24
+        assert directory.listdir().count("scc2025060203.html") == 1
+    finally:
+        shutil.rmtree(work_dir)
+
+    print("index tests passed")
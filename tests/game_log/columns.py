@@ -0,0 +1,71 @@
+""" Tenhou.game_log.columns tests
+"""
+
+
+import os
+import pickle
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_log.parse import (
+    GameLogParser, FileParser, CompiledFileParser, CompactFileParser
+)
+from TenhouAPI.testing import write_game_logs
+
+
+DTYPES = {
+    "kind": "int8", "actor": "int8", "tile": "int16", "round": "int32", "seq": "int32",
+}
+
+
+def check_arrays(arrays, parser) -> None:
+    assert {key: str(column.dtype) for key, column in arrays.items()} == DTYPES
+    events = [event for game_log in parser for event in game_log]
+    assert arrays["kind"].tolist() == [event.kind for event in events]
+    assert arrays["actor"].tolist() == [event.actor for event in events]
+    assert arrays["tile"].tolist() == [event.tile for event in events]
+    assert arrays["round"].tolist() == [
+        round_idx for round_idx, game_log in enumerate(parser) for _ in game_log
+    ]
+    assert arrays["seq"].tolist() == list(range(len(events)))
+    return
+
+
+if __name__ == '__main__':
+
+    save_dir = tempfile.mkdtemp()
+    cwd = os.getcwd()
+    try:
+        file_path, = write_game_logs(save_dir, datetime(2025, 10, 4, 0), 1, rounds=5, seed=7)
+        game_log_text = FileParser.read(file_path)
+        expected = GameLogParser.read_arrays(file_path)
+        check_arrays(expected, GameLogParser(file_path))
+        assert set(expected["round"].tolist()) == set(range(5))
+
+        # file path
+        for file_parser in (FileParser, CompiledFileParser, CompactFileParser):
+            parser = GameLogParser(file_path, file_parser)
+            arrays = parser.to_arrays()
+            check_arrays(arrays, parser)
+            assert all((arrays[key] == expected[key]).all() for key in DTYPES)
+            continue
+
+        # text without file, even from other directory
+        os.chdir(save_dir)
+        for game_log_file_path in ("", os.path.basename(file_path) + ".missing"):
+            parser = GameLogParser.from_text(game_log_text, CompiledFileParser, game_log_file_path)
+            arrays = parser.to_arrays()
+            check_arrays(arrays, parser)
+            assert all((arrays[key] == expected[key]).all() for key in DTYPES)
+            continue
+
+        # parser sent from worker process
+        parser = pickle.loads(pickle.dumps(GameLogParser.from_text(game_log_text, CompactFileParser)))
+        arrays = parser.to_arrays()
+        assert all((arrays[key] == expected[key]).all() for key in DTYPES)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(save_dir)
+
+    print("columns tests passed")
@@ -0,0 +1,103 @@
+""" Tenhou.game_log bulk download tests
+Download game logs concurrently from local stand-in server.
+"""
+
+
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+
+from TenhouAPI.config import TenhouUrlConfig
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.util.retry import RetryPolicy
+from TenhouAPI.util.journal import DONE, FAILED
+
+
+LATENCY = 0.05
+
+
+class GameLogHandler(BaseHTTPRequestHandler):
+    """ Return game id as game log after latency. "flaky" ids fail twice with 503 """
+
+    flaky_requests = {}
+
+    def do_GET(self):
+        game_id = self.path.split("?", 1)[-1]
+        sleep(LATENCY)
+        if game_id.startswith("missing"):
+            self.send_error(404)
+            return
+        if game_id.startswith("flaky"):
+            count = GameLogHandler.flaky_requests.get(game_id, 0)
+            GameLogHandler.flaky_requests[game_id] = count + 1
+            if count < 2:
+                self.send_error(503)
+                return
+        body = f'<mjloggm ver="2.3"><GO type="169" lobby="0"/><!--{game_id}--></mjloggm>'.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        return
+
+    def log_message(self, *args):
+        return
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GameLogHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url_config = TenhouUrlConfig(
+        game_log_file=f"http://127.0.0.1:{server.server_address[1]}/0/log/?"
+    )
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        directory = GameLogDirectory(save_dir, url_config)
+        game_ids = [f"2025100400gm-00a9-0000-{idx:08x}" for idx in range(20)]
+
+        # concurrency fills rate budget
+        report = directory.download_and_install_many(game_ids, workers=8, rate=100, burst=8)
+        assert report.downloaded == 20 and not report.failed
+        assert report.elapsed < 20 * LATENCY
+        assert sorted(directory.listdir()) == sorted(game_ids)
+        assert directory.journal.keys(DONE) == set(game_ids)
+        with open(os.path.join(save_dir, game_ids[0]), "rb") as f:
+            assert game_ids[0].encode() in f.read()
+
+        # existing files are skipped and failures are reported
+        report = directory.download_and_install_many(game_ids + ["missing-0"], workers=4)
+        assert len(report.skipped) == 20 and list(report.failed) == ["missing-0"]
+        assert directory.journal.entry("missing-0")["state"] == FAILED
+        assert directory.journal.entry("missing-0")["attempts"] == 1
+
+        # failure of saving is recorded
+        report = directory.download_and_install_many(iter(["no-directory/0"]))
+        assert list(report.failed) == ["no-directory/0"]
+        assert directory.journal.entry("no-directory/0")["state"] == FAILED
+
+        # temporary errors are retried with backoff
+        retry = RetryPolicy(attempts=3, base_delay=0.01)
+        report = directory.download_and_install_many(["flaky-0"], retry=retry)
+        assert report.downloaded == 1
+        assert directory.journal.entry("flaky-0")["attempts"] == 3
+
+        # resume downloads ids that are not done
+        directory.journal.add(["resumed-0"])
+        report = directory.resume_downloads(retry=RetryPolicy(attempts=1))
+        assert report.installed == [directory.generate_save_file_path("resumed-0")]
+        assert sorted(report.failed) == ["missing-0", "no-directory/0"]
+
+        # rate limit bounds requests per second
+        more_ids = [f"2025100401gm-00a9-0000-{idx:08x}" for idx in range(10)]
+        report = directory.download_and_install_many(more_ids, workers=8, rate=20, use_journal=False)
+        assert report.downloaded == 10 and report.elapsed >= 9 / 20
+        assert report.requests_per_second <= 20 * 1.1
+    finally:
+        server.shutdown()
+        shutil.rmtree(save_dir)
+
+    print("download tests passed")
@@ -0,0 +1,40 @@
+""" Tenhou.game_log.event tests
+"""
+from TenhouAPI.config import DisplayGameLogTag, GameLogEventKind, MeldType
+from TenhouAPI.game_log.parse import CompiledFileParser, CompactFileParser
+
+
+GAME_LOG = (
+    '<mjloggm ver="2.3"><GO type="169" lobby="0"/><TAIKYOKU oya="0"/>'
+    '<INIT seed="0,0,0,2,4,51" ten="250,250,250,250" oya="0" '
+    'hai0="1,2,3" hai1="4,5,6" hai2="7,8,9" hai3="10,11,12"/>'
+    '<T60/><D60/><U12/><E12/><N who="2" m="13164" /><DORA hai="53" />'
+    '<REACH who="0" step="1"/><AGARI ba="0,0" hai="1,2,3" machi="14" '
+    'who="0" fromWho="1" sc="250,-77,250,77,250,0,250,0" /></mjloggm>'
+)
+
+
+if __name__ == '__main__':
+    tags = CompiledFileParser.parse(GAME_LOG)
+    events = CompactFileParser.parse(GAME_LOG)
+
+    assert [tag.info for tag in tags] == [event.info for event in events]
+
+    draw = events[2]
+    assert draw == DisplayGameLogTag.P0_DRAW
+    assert (draw.kind, draw.actor, draw.tile) == (GameLogEventKind.P0_DRAW, 0, 60)
+
+    naki, dora = events[6], events[7]
+    assert (naki.kind, naki.actor, naki.tile) == (GameLogEventKind.NAKI, 2, -1)
+    assert (dora.kind, dora.tile) == (GameLogEventKind.OPEN_DORA, 53)
+
+    # meld
+    meld = naki.meld
+    assert meld is tags[6].meld and meld.type == MeldType.CHI
+    assert meld.tiles == (17, 23, 26) and meld.called_tile == 17
+    assert draw.meld is None
+
+    agari = events[-1]
+    assert (agari.actor, agari.tile) == (0, 14)
+    print(events)
+    ...
@@ -0,0 +1,45 @@
+""" Tenhou.game_log.parse file parser equivalence tests
+"""
+
+
+from datetime import datetime
+
+from TenhouAPI.config import GameLogEventKind
+from TenhouAPI.game_log.event import EVENT_KIND_TAGS
+from TenhouAPI.game_log.parse import FileParser, CompiledFileParser
+from TenhouAPI.testing import generate_game_log
+from TenhouAPI.testing.corpus import generate_hour_records
+
+
+if __name__ == '__main__':
+
+    seen = set()
+    for game_id, _, _ in generate_hour_records(datetime(2025, 10, 4, 0), 40, seed=11):
+        game_log_text = generate_game_log(game_id, rounds=8, seed=11)
+        tags = FileParser.parse(game_log_text)
+        compiled = CompiledFileParser.parse(game_log_text)
+        lazy = tuple(CompiledFileParser.iter_tags(game_log_text))
+
+        # same tags, attributes and compact values
+        assert len(tags) == len(compiled) == len(lazy)
+        for tag, compiled_tag, lazy_tag in zip(tags, compiled, lazy):
+            assert tag.tag == compiled_tag.tag == lazy_tag.tag
+            assert tag.attrs == compiled_tag.attrs == lazy_tag.attrs
+            assert (tag.kind, tag.actor, tag.tile) == (
+                compiled_tag.kind, compiled_tag.actor, compiled_tag.tile
+            )
+            seen.add(tag.tag)
+            continue
+        continue
+
+    # every tag kind, named tags with attributes and self-closing id tags
+    assert seen == set(EVENT_KIND_TAGS), set(EVENT_KIND_TAGS) - seen
+    game_log_text = generate_game_log("2025100400gm-00a9-0000-00000000", rounds=1, seed=11)
+    assert "<T" in game_log_text and "/>" in game_log_text
+    tags = CompiledFileParser.parse(game_log_text)
+    draw = next(tag for tag in tags if tag.kind == GameLogEventKind.P0_DRAW)
+    assert draw.attrs.keys() == {"id"}
+    init = next(tag for tag in tags if tag.kind == GameLogEventKind.INIT)
+    assert init.attrs.keys() == {"seed", "ten", "oya", "hai0", "hai1", "hai2", "hai3"}
+
+    print("file parser tests passed")
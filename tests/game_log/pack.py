@@ -0,0 +1,111 @@
+""" Pack store of game logs tests
+"""
+
+
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+
+from TenhouAPI.game_log import GameLogDirectory, GameLogParser
+from TenhouAPI.game_log.parse import FileParser, CompactFileParser
+from TenhouAPI.util.cache import LRUCache
+from TenhouAPI.util.pack import PackStore
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) < 2:
+        print("usage: python pack.py <game_logs_dir>")
+        sys.exit(1)
+    source_dir = sys.argv[1]
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        # segments
+        pack_dir = os.path.join(save_dir, "store")
+        with PackStore(pack_dir, segment_size=64) as pack:
+            locations = [pack.put(f"key{i}", bytes([i]) * 40) for i in range(5)]
+            assert [location[0] for location in locations] == [0, 1, 2, 3, 4]
+            assert pack.get("key3") == bytes([3]) * 40
+            pack.put("key3", b"replaced")
+            assert pack.get("key3") == b"replaced" and len(pack) == 5
+            assert "key4" in pack and "key5" not in pack
+        with PackStore(pack_dir, segment_size=64) as pack:
+            assert pack.keys() == [f"key{i}" for i in range(5)]
+            assert pack.get("key0") == bytes(40) and pack.get("key3") == b"replaced"
+
+        # segments are synced before index is committed
+        synced = []
+        fsync = os.fsync
+        os.fsync = lambda fd: synced.append(fd) or fsync(fd)
+        try:
+            with PackStore(os.path.join(save_dir, "synced"), segment_size=64) as pack:
+                pack.put_many((f"key{i}", bytes(40)) for i in range(3))
+                assert len(pack) == 3 and len(synced) >= 3
+        finally:
+            os.fsync = fsync
+
+        # empty bytes as first write of segment
+        with PackStore(os.path.join(save_dir, "empty")) as pack:
+            pack.put("empty", b"")
+            assert pack.get("empty") == b""
+
+        # migrate directory of files
+        game_log_dir = os.path.join(save_dir, "game_logs")
+        shutil.copytree(source_dir, game_log_dir)
+        file_names = GameLogDirectory(game_log_dir).listdir()
+        expected = {
+            file_name: GameLogParser(os.path.join(source_dir, file_name)).game_logs
+            for file_name in file_names[:8]
+        }
+
+        directory = GameLogDirectory(game_log_dir, cache=LRUCache(max_entries=4), pack=True)
+        assert directory.migrate_to_pack() == len(file_names)
+        assert os.listdir(game_log_dir) == [".pack"]
+        assert directory.listdir() == sorted(file_names)
+
+        # parse from pack
+        for file_name, game_logs in expected.items():
+            assert directory.exists(file_name)
+            assert directory.parse(file_name).game_logs == game_logs
+            assert directory.parse(file_name) is directory.parse(file_name)
+            assert tuple(directory.iter_rounds(file_name)) == game_logs
+            continue
+        parsers = list(directory.parse_many(list(expected), workers=2, chunk_size=3))
+        assert [
+            tuple(tuple(map(str, game_log)) for game_log in parser.game_logs) for parser in parsers
+        ] == [
+            tuple(tuple(map(str, game_log)) for game_log in GameLogParser(
+                os.path.join(source_dir, file_name), CompactFileParser
+            ).game_logs)
+            for file_name in expected
+        ]
+        parsers = directory.parse_many(list(expected), workers=2, ordered=False, chunk_size=1)
+        assert sorted(parser.game_log_file_path for parser in parsers) == sorted(expected)
+        with contextlib.closing(directory.parse_many(list(expected), workers=2, chunk_size=1)) as parsers:
+            assert next(parsers).game_log_file_path == list(expected)[0]
+        arrays = directory.to_arrays(list(expected))
+        assert len(arrays["kind"]) > 0
+
+        # new game logs are appended to pack, and files are still read
+        with open(os.path.join(source_dir, file_names[0]), "rb") as f:
+            bytes_data = f.read()
+        assert directory.save_game_log(bytes_data, "new") == "new"
+        assert directory.stored_size("new") == len(bytes_data)
+        shutil.copy(os.path.join(source_dir, file_names[1]), os.path.join(game_log_dir, "file"))
+        assert directory.read_text("file") == FileParser.read(os.path.join(source_dir, file_names[1]))
+        assert not directory.exists("file")
+        directory.refresh()
+        assert "new" in directory.listdir() and "file" in directory.listdir()
+        assert directory.stored_size("missing") is None
+        directory.close()
+
+        # reopened with statement
+        with GameLogDirectory(game_log_dir, pack=True) as directory:
+            assert directory.read_text("new") == bytes_data.decode("utf-8")
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("pack tests passed")
@@ -0,0 +1,63 @@
+""" Tenhou.game_log.manager parse_many tests
+Parse synthetic game logs over process pool.
+"""
+
+
+import contextlib
+import multiprocessing
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_log import GameLogDirectory
+from TenhouAPI.game_log.parse import CompactFileParser
+from TenhouAPI.testing import write_game_logs
+
+
+def infos(parser) -> tuple:
+    return parser.game_log_file_path, tuple(
+        tuple(event.info for event in game_log) for game_log in parser.game_logs
+    )
+
+
+if __name__ == '__main__':
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        file_paths = write_game_logs(save_dir, datetime(2025, 10, 4, 0), 11, rounds=3, seed=2)
+        directory = GameLogDirectory(save_dir)
+        file_names = [os.path.basename(file_path) for file_path in file_paths]
+        expected = [infos(directory.parse(file_name, CompactFileParser)) for file_name in file_names]
+
+        # in order, same as serial parse
+        parsers = directory.parse_many(file_names, workers=2, chunk_size=3)
+        assert [infos(parser) for parser in parsers] == expected
+        assert not multiprocessing.active_children()
+
+        # as completed, same set
+        parsers = directory.parse_many(file_names, workers=2, ordered=False, chunk_size=2)
+        assert sorted(infos(parser) for parser in parsers) == sorted(expected)
+        assert not multiprocessing.active_children()
+
+        # error of worker is raised, and pool is shut down
+        for ordered in (True, False):
+            parsers = directory.parse_many(
+                file_names[:4] + ["missing"] + file_names[4:], workers=2, ordered=ordered, chunk_size=1
+            )
+            try:
+                list(parsers)
+                raise AssertionError("error of worker must be raised")
+            except FileNotFoundError:
+                pass
+            assert not multiprocessing.active_children()
+            continue
+
+        # stopped early by closing
+        with contextlib.closing(directory.parse_many(file_names, workers=2, chunk_size=1)) as parsers:
+            assert infos(next(parsers)) == expected[0]
+        assert not multiprocessing.active_children()
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("parse_many tests passed")
@@ -0,0 +1,77 @@
+""" Tenhou.game_log.replay tests
+"""
+from TenhouAPI.config import MeldType
+from TenhouAPI.game_log.parse import GameLogParser, CompiledFileParser, CompactFileParser
+from TenhouAPI.game_log.replay import ReplayEngine
+
+import os
+import tempfile
+
+
+GAME_LOG = (
+    '<mjloggm ver="2.3"><GO type="169" lobby="0"/>'
+    '<INIT seed="0,0,0,1,2,52" ten="250,250,250,250" oya="0" '
+    'hai0="0,1,2,4,5,6,8,9,10,12,13,14,16" '
+    'hai1="3,37,40,44,48,53,56,60,64,68,72,76,80" '
+    'hai2="84,85,86,88,89,90,92,93,94,96,97,98,100" '
+    'hai3="104,105,106,108,109,110,112,113,114,116,117,118,120"/>'
+    '<T124/><D124/><U101/><E3/><N who="0" m="1097" /><D16/>'
+    '<V121/><F121/><DORA hai="125" />'
+    '<REACH who="3" step="1"/><W122/><G122/>'
+    '<REACH who="3" ten="250,250,250,240" step="2"/>'
+    '<AGARI ba="0,1" hai="104,105,106" machi="122" ten="30,8000,0" '
+    'who="1" fromWho="3" sc="250,0,250,90,250,0,240,-80" />'
+    '</mjloggm>'
+)
+
+DRAW_LOG = GAME_LOG.replace(
+    '<AGARI ba="0,1" hai="104,105,106" machi="122" ten="30,8000,0" '
+    'who="1" fromWho="3" sc="250,0,250,90,250,0,240,-80" />',
+    '<RYUUKYOKU ba="0,1" sc="250,-15,250,-15,250,-15,240,45" hai3="104,105,106" />',
+)
+
+
+if __name__ == '__main__':
+    with tempfile.NamedTemporaryFile("w", suffix=".mjlog", delete=False) as f:
+        f.write(GAME_LOG)
+        ...
+
+    try:
+        for file_parser in (CompiledFileParser, CompactFileParser):
+            engine = ReplayEngine()
+            steps = [
+                (event.tag, state.snapshot())
+                for event, state in engine.replay(GameLogParser(f.name, file_parser))
+            ]
+
+            # after pon
+            _, state = steps[5]
+            player = state.players[0]
+            assert player.hand[0] == 1 and sum(player.hand) == 11
+            assert player.melds[0].type == MeldType.PON
+            assert state.players[1].river_tiles == (3,)
+
+            # end of round
+            state = engine.state
+            assert state.dora_indicator_tiles == (52, 125)
+            assert state.players[3].reach and state.kyotaku == 0
+            assert state.scores == (25000, 34000, 25000, 16000)
+            assert sum(state.players[0].hand) == 10
+            continue
+    finally:
+        os.remove(f.name)
+
+    # riichi stick carries over exhaustive draw
+    with tempfile.NamedTemporaryFile("w", suffix=".mjlog", delete=False) as f_draw:
+        f_draw.write(DRAW_LOG)
+        ...
+    try:
+        engine = ReplayEngine()
+        for _ in engine.replay(GameLogParser(f_draw.name, CompiledFileParser)): ...
+        assert engine.state.kyotaku == 1
+        assert engine.state.scores == (23500, 23500, 23500, 28500)
+    finally:
+        os.remove(f_draw.name)
+
+    print(engine.state.players[0])
+    ...
@@ -0,0 +1,61 @@
+""" Tenhou.game_log.parse round iteration tests
+"""
+
+
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_log.parse import (
+    GameLogParser, FileParser, CompiledFileParser, CompactFileParser, GAME_END_KEY
+)
+from TenhouAPI.testing import write_game_logs
+
+
+class ScanText(str):
+    """ Game log text that counts scans, and refuses whole split """
+
+    finds = 0
+
+    def split(self, *args, **kwargs):
+        raise AssertionError("game log text is split at once")
+
+    def find(self, *args, **kwargs) -> int:
+        ScanText.finds += 1
+        return super().find(*args, **kwargs)
+
+    ...
+
+
+if __name__ == '__main__':
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        file_paths = write_game_logs(save_dir, datetime(2025, 10, 4, 0), 3, rounds=6, seed=5)
+
+        # rounds are same as parsed rounds
+        for file_path in file_paths:
+            for file_parser in (FileParser, CompiledFileParser, CompactFileParser):
+                expected = GameLogParser(file_path, file_parser).game_logs
+                rounds = list(GameLogParser.iter_rounds(file_path, file_parser))
+                assert len(rounds) == len(expected) == 6
+                assert [[tag.info for tag in game_log] for game_log in rounds] == [
+                    [tag.info for tag in game_log] for game_log in expected
+                ]
+                assert all(game_log[-1] in GAME_END_KEY for game_log in rounds)
+                continue
+            continue
+
+        # default parser scans only until the end of yielded round
+        assert GameLogParser._default_file_parse is FileParser
+        text = ScanText(FileParser.read(file_paths[0]))
+        rounds = GameLogParser.split_rounds(FileParser.iter_tags(text))
+        first = next(rounds)
+        scanned = ScanText.finds
+        assert [tag.info for tag in first] == [tag.info for tag in GameLogParser(file_paths[0])[0]]
+        assert scanned < text.count("><") // 2
+        assert len(list(rounds)) == 5 and ScanText.finds > scanned
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("rounds tests passed")
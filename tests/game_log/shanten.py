@@ -0,0 +1,69 @@
+""" Tenhou.game_log.shanten tests
+"""
+from TenhouAPI.game_log.shanten import (
+    tiles_to_counts, shanten, ukeire, shanten_batch, ukeire_batch
+)
+from TenhouAPI import game_log
+import TenhouAPI.game_log.shanten as shanten_module
+
+
+def hand(text: str):
+    """ Convert hand text such as "123m456p11z" into 34-count hand. """
+    counts = [0] * 34
+    digits = []
+    for char in text:
+        if char.isdigit():
+            digits.append(int(char))
+            continue
+        offset = "mpsz".index(char) * 9
+        for digit in digits:
+            counts[offset + digit - 1] += 1
+            continue
+        digits = []
+        continue
+    return counts
+
+
+if __name__ == '__main__':
+    # package attribute is the submodule, not the function
+    assert game_log.shanten is shanten_module
+    assert shanten_module.shanten is shanten and shanten_module.ukeire is ukeire
+
+    # complete hands
+    assert shanten(hand("123m456m789m123p55p")) == -1
+    assert shanten(hand("1122m3344p5566s77z")) == -1
+    assert shanten(hand("19m19p19s12345677z")) == -1
+
+    # tenpai
+    assert shanten(hand("123m456m789m123p5p")) == 0
+    assert shanten(hand("1122m3344p5566s7z")) == 0
+    assert shanten(hand("19m19p19s1234567z")) == 0
+    assert ukeire(hand("123m456m789m123p5p")) == (3, (13,))
+    assert ukeire(hand("19m19p19s1234567z"))[0] == 39
+
+    # called melds are counted from missing tiles
+    assert shanten(hand("123m5p")) == 0
+    assert shanten(hand("13m")) == 0
+
+    # tile ids
+    assert tiles_to_counts((0, 1, 2, 135)) == hand("111m7z")
+
+    # batch
+    hands = [hand("123m456m789m123p5p"), hand("1122m3344p5566s7z"), hand("147m258p369s1234z")]
+    assert shanten_batch(hands) == [0, 0, 6]
+    assert ukeire_batch(hands)[:2] == [3, 3]
+
+    try:
+        import numpy
+        result = shanten_batch(numpy.array(hands, dtype=numpy.int8))
+        assert result.dtype == numpy.int8 and result.tolist() == [0, 0, 6]
+    except ImportError:
+        pass
+
+    try:
+        ukeire(hand("123m456m789m123p55p"))
+        raise AssertionError("ukeire must reject 3n+2 hand")
+    except ValueError:
+        pass
+
+    print("shanten tests passed")
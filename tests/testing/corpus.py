@@ -0,0 +1,44 @@
+""" Synthetic corpus tests
+"""
+
+
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_id.extract import iter_game_id_records_from_file
+from TenhouAPI.game_log.parse import GameLogParser, CompiledFileParser
+from TenhouAPI.testing import write_game_logs, write_hour_files
+
+
+if __name__ == '__main__':
+
+    start = datetime(2025, 10, 4, 23)
+    save_dir = tempfile.mkdtemp()
+    try:
+        # hour files over day boundary
+        file_paths = write_hour_files(save_dir + "/ids", start, 3, games_per_hour=50, zipped=True)
+        assert [os.path.basename(path) for path in file_paths] == [
+            "scc2025100423.html.gz", "scc2025100500.html.gz", "scc2025100501.html.gz"
+        ]
+        records = list(iter_game_id_records_from_file(file_paths[0], None))
+        assert len(records) == 50 and records[0].timestamp.hour == 23
+        assert all(len(record.players) == (3 if record.lobby_type == "00b9" else 4) for record in records)
+
+        # game logs parse into rounds, and are same for same seed
+        file_paths = write_game_logs(save_dir + "/logs", start, 120, rounds=6, seed=3)
+        assert len(file_paths) == 120 == len(set(file_paths))
+        for file_path in file_paths[:10]:
+            parser = GameLogParser(file_path, CompiledFileParser)
+            assert len(parser.game_logs) == 6 and parser.game_tag is not None
+            continue
+        with open(file_paths[0], "rb") as f:
+            first = f.read()
+        write_game_logs(save_dir + "/again", start, 1, rounds=6, seed=3)
+        with open(os.path.join(save_dir, "again", os.path.basename(file_paths[0])), "rb") as f:
+            assert f.read() == first
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("corpus tests passed")
@@ -0,0 +1,73 @@
+""" Tenhou stand-in server tests
+Download game ids and game logs through real code paths from local stand-in.
+"""
+
+
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_id.download import download_game_id_list
+from TenhouAPI.game_id.extract import extract_game_ids_from_bytes
+from TenhouAPI.game_id.manager import GameIdDirectory
+from TenhouAPI.game_log.download import download_game_log
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.testing import TenhouStandIn, generate_hour_file, generate_game_log
+from TenhouAPI.util.download import ConnectionPool
+from TenhouAPI.util.retry import RetryPolicy, HTTPStatusError
+from TenhouAPI.util.zip import Gzip
+
+
+if __name__ == '__main__':
+
+    # corpus is same for same seed
+    hour = datetime(2025, 10, 4, 0)
+    assert generate_hour_file(hour, 10, seed=1) == generate_hour_file(hour, 10, seed=1)
+    assert generate_hour_file(hour, 10, seed=1) != generate_hour_file(hour, 10, seed=2)
+
+    with TenhouStandIn(games_per_hour=30, seed=1) as stand_in, ConnectionPool() as pool:
+        url_config = stand_in.url_config()
+
+        # hour file and game log at tenhou urls
+        zipped = download_game_id_list(2025, 10, 4, 0, 0, url_config, pool)
+        game_ids = extract_game_ids_from_bytes(
+            b"".join(Gzip.iter_unzip([zipped])), white_key=("00a9", "00e9", "00b9")
+        )
+        assert len(game_ids) == 30
+        game_log = download_game_log(game_ids[0], 0, url_config, pool)
+        assert game_log.decode("utf-8") == generate_game_log(game_ids[0].replace("log=", ""), seed=1)
+
+        # unknown paths
+        try:
+            download_game_log("", 0, url_config, pool)
+            assert False
+        except HTTPStatusError as error:
+            assert error.status == 404
+
+    # failures are retried by directories
+    save_dir = tempfile.mkdtemp()
+    try:
+        with TenhouStandIn(latency=0.002, error_rate=0.2, throttle_rate=0.2, seed=2) as stand_in:
+            url_config = stand_in.url_config()
+            retry = RetryPolicy(attempts=10, base_delay=0.001, max_delay=0.01, seed=0)
+
+            id_directory = GameIdDirectory(save_dir + "/ids", url_config)
+            id_report = id_directory.download_range(
+                datetime(2025, 10, 4, 0), datetime(2025, 10, 4, 6), rate=1000, retry=retry
+            )
+            assert id_report.downloaded == 6 and not id_report.failed
+
+            game_ids = id_directory.extract_game_ids_from_file(sorted(id_report.installed)[0])
+            log_directory = GameLogDirectory(save_dir + "/logs", url_config)
+            report = log_directory.download_and_install_many(
+                game_ids[:20], workers=4, rate=1000, burst=4, retry=retry
+            )
+            assert report.downloaded == len(game_ids[:20]) and not report.failed
+
+            counts = stand_in.counts
+            assert counts["throttled"] > 0 and counts["errors"] > 0
+            assert counts["ok"] == 6 + len(game_ids[:20])
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("stand-in server tests passed")
@@ -0,0 +1,61 @@
+""" Cache utilities tests
+"""
+
+
+import os
+import shutil
+import tempfile
+
+from TenhouAPI.util.cache import LRUCache
+from TenhouAPI.game_log.manager import GameLogDirectory, estimate_game_log_bytes
+from TenhouAPI.game_log.parse import CompactFileParser
+
+
+GAME_LOG = (
+    '<mjloggm ver="2.3"><GO type="169" lobby="0"/>'
+    '<INIT seed="0,0,0,2,4,51" ten="250,250,250,250" oya="0" hai0="1,2,3"/>'
+    '<T60/><D60/><AGARI ba="0,0" machi="14" who="0" fromWho="1" /></mjloggm>'
+)
+
+
+if __name__ == "__main__":
+
+    # bounds
+    cache = LRUCache(max_entries=2)
+    for key in "abc":
+        cache.get_or_load(key, 0, lambda: key)
+        continue
+    assert "a" not in cache and len(cache) == 2 and cache.evictions == 1
+    assert cache.get_or_load("c", 0, lambda: None) == "c" and cache.hits == 1
+    assert cache.get_or_load("c", 1, lambda: "new") == "new" and cache.misses == 4
+
+    cache = LRUCache(max_entries=None, max_bytes=10, size_of=len)
+    cache.get_or_load("a", 0, lambda: "x" * 6)
+    cache.get_or_load("b", 0, lambda: "x" * 6)
+    assert "a" not in cache and cache.bytes == 6
+
+    # game log directory
+    save_dir = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(save_dir, "log"), "w") as f:
+            f.write(GAME_LOG)
+            ...
+
+        cache = LRUCache(max_bytes=1 << 20, size_of=estimate_game_log_bytes)
+        directory = GameLogDirectory(save_dir, cache=cache)
+
+        first = directory.parse("log", CompactFileParser)
+        assert directory.parse("log", CompactFileParser) is first
+        assert cache.hits == 1 and cache.misses == 1
+
+        # invalidate by change on disk
+        with open(os.path.join(save_dir, "log"), "w") as f:
+            f.write(GAME_LOG.replace("<T60/><D60/>", ""))
+            ...
+        changed = directory.parse("log", CompactFileParser)
+        assert changed is not first and len(changed[0]) == 2
+        print(cache)
+    finally:
+        shutil.rmtree(save_dir)
+
+    ...
@@ -0,0 +1,45 @@
+""" Directory manager tests
+"""
+
+
+import os
+import shutil
+import tempfile
+
+from TenhouAPI.util.directory_manager import DirectoryManager
+
+
+class Directory(DirectoryManager):
+    """ Test directory class """
+
+    ...
+
+
+if __name__ == "__main__":
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        for file_name in ("a", "b", ".hidden"):
+            open(os.path.join(save_dir, file_name), "w").close()
+            continue
+
+        directory = Directory(save_dir)
+        assert sorted(directory.listdir()) == ["a", "b"]
+        assert directory.exists("a") and not directory.exists(".hidden")
+
+        # saved files are recorded without scan
+        open(directory.generate_save_file_path("c"), "w").close()
+        directory.add_file("c")
+        os.remove(directory.generate_save_file_path("a"))
+        directory.discard_file("a")
+        assert sorted(directory.listdir()) == ["b", "c"]
+
+        # external changes appear after refresh
+        open(os.path.join(save_dir, "d"), "w").close()
+        assert not directory.exists("d")
+        directory.refresh()
+        assert directory.exists("d") and sorted(directory.listdir()) == ["b", "c", "d"]
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("directory manager tests passed")
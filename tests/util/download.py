@@ -0,0 +1,110 @@
+""" Download utilities tests
+Download from local keep-alive server through connection pool.
+"""
+
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from urllib.error import HTTPError
+
+from TenhouAPI.util.download import ConnectionPool, download, download_stream
+from TenhouAPI.util.retry import RetryPolicy
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """ Return path, and drop connection silently on /drop """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = self.__class__
+        with cls.lock:
+            cls.active += 1
+            cls.max_active = max(cls.max_active, cls.active)
+        sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/moved")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/missing":
+            self.send_error(404)
+            return
+
+        body = self.path.encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+        # close without "Connection: close" header
+        if self.path.startswith("/drop"): self.close_connection = True
+        return
+
+    def log_message(self, *args):
+        return
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    root = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        # keep-alive
+        with ConnectionPool() as pool:
+            for idx in range(20):
+                assert download(f"{root}/log/?{idx}", pool=pool) == f"/log/?{idx}".encode()
+                continue
+            assert pool.connects == 1
+
+        # reconnect after connection is closed by server
+        with ConnectionPool() as pool:
+            for idx in range(5):
+                assert pool.get(f"{root}/drop/{idx}") == f"/drop/{idx}".encode()
+                sleep(0.01)
+                continue
+            assert pool.reconnects >= 1
+
+        # redirect and error status
+        with ConnectionPool() as pool:
+            assert pool.get(f"{root}/redirect") == b"/moved"
+            try:
+                pool.get(f"{root}/missing")
+                raise AssertionError("404 must raise")
+            except RuntimeError as error:
+                assert error.args == (404,)
+            assert pool.get(f"{root}/after-error") == b"/after-error"
+
+        # urllib without pool
+        assert download(f"{root}/redirect") == b"/moved"
+        assert download_stream(f"{root}/stream", b"".join) == b"/stream"
+        try:
+            download(f"{root}/missing", retry=RetryPolicy(attempts=3, base_delay=10))
+            raise AssertionError("404 must raise")
+        except HTTPError as error:
+            assert error.code == 404
+
+        # per-host limit
+        KeepAliveHandler.max_active = 0
+        with ConnectionPool(max_per_host=2) as pool:
+            threads = [
+                threading.Thread(target=pool.get, args=(f"{root}/{idx}",))
+                for idx in range(10)
+            ]
+            for thread in threads: thread.start()
+            for thread in threads: thread.join()
+            assert KeepAliveHandler.max_active <= 2 and pool.connects <= 2
+    finally:
+        server.shutdown()
+
+    print("download tests passed")
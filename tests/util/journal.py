@@ -0,0 +1,61 @@
+""" Journal and retry utilities tests
+"""
+
+
+import os
+import shutil
+import tempfile
+
+from TenhouAPI.util.journal import DownloadJournal, PENDING, IN_FLIGHT, DONE, FAILED
+from TenhouAPI.util.retry import RetryPolicy, HTTPStatusError
+
+
+if __name__ == "__main__":
+
+    save_dir = tempfile.mkdtemp()
+    path = os.path.join(save_dir, ".journal.sqlite3")
+    try:
+        # states
+        with DownloadJournal(path) as journal:
+            journal.add(["a", "b", "c", "d"])
+            journal.start("a")
+            journal.done("a", 120)
+            journal.start("b")
+            journal.start("b")
+            journal.start("c")
+            journal.fail("c", HTTPStatusError(404))
+            assert journal.entry("a") == {"state": DONE, "size": 120, "attempts": 1, "error": None}
+            assert journal.state("b") == IN_FLIGHT and journal.entry("b")["attempts"] == 2
+            assert journal.counts() == {PENDING: 1, IN_FLIGHT: 1, DONE: 1, FAILED: 1}
+
+        # in-flight keys of crashed run are pending again
+        with DownloadJournal(path) as journal:
+            assert journal.keys(PENDING) == {"b", "d"}
+            assert journal.keys(DONE, FAILED) == {"a", "c"}
+            journal.add(["a"])
+            assert journal.state("a") == DONE
+            assert journal.states(["a", "b", "e"]) == {"a": DONE, "b": PENDING}
+    finally:
+        shutil.rmtree(save_dir)
+
+    # backoff
+    policy = RetryPolicy(attempts=4, base_delay=0.5, max_delay=1.5, jitter=False)
+    assert [policy.delay(retry) for retry in range(4)] == [0.5, 1.0, 1.5, 1.5]
+    policy = RetryPolicy(base_delay=1.0, seed=0)
+    assert all(0 <= policy.delay(3) <= 8 for _ in range(100))
+
+    # retryable errors
+    assert policy.should_retry(HTTPStatusError(503)) and policy.should_retry(ConnectionResetError())
+    assert not policy.should_retry(HTTPStatusError(404)) and not policy.should_retry(ValueError())
+
+    calls = []
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3: raise HTTPStatusError(429)
+        return "ok"
+    retries = []
+    policy = RetryPolicy(attempts=3, base_delay=0.001)
+    assert policy.call(flaky, lambda error, retry, delay: retries.append(retry)) == "ok"
+    assert retries == [0, 1]
+
+    print("journal tests passed")
@@ -0,0 +1,85 @@
+""" Metrics utilities tests
+Collect metrics of downloads, unzip, writes and parse from local stand-in.
+"""
+
+
+import logging
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+from TenhouAPI.game_id.manager import GameIdDirectory
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.testing import TenhouStandIn
+from TenhouAPI.util import metrics
+from TenhouAPI.util.metrics import InMemorySink, NullSink, MetricsSink
+
+
+class ListHandler(logging.Handler):
+    """ Keep log messages """
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+    ...
+
+
+if __name__ == '__main__':
+
+    # default sink ignores metrics
+    assert isinstance(metrics.get_sink(), NullSink)
+    assert not metrics.measures_time()
+    with metrics.timer("nothing"):
+        metrics.increment("nothing")
+
+    # base sink observes timers
+    class LastSink(MetricsSink):
+        def observe(self, name, value): self.last = (name, value)
+    sink = LastSink()
+    with sink.timer("block"): pass
+    assert sink.last[0] == "block" and sink.last[1] >= 0
+
+    handler = ListHandler()
+    metrics.logger.addHandler(handler)
+    metrics.logger.setLevel(logging.DEBUG)
+
+    sink = InMemorySink()
+    previous = metrics.set_sink(sink)
+    assert metrics.measures_time()
+    save_dir = tempfile.mkdtemp()
+    try:
+        with TenhouStandIn(games_per_hour=20) as stand_in:
+            url_config = stand_in.url_config()
+            id_directory = GameIdDirectory(os.path.join(save_dir, "ids"), url_config)
+            id_directory.download_range(datetime(2025, 10, 4, 0), datetime(2025, 10, 4, 2), rate=1000)
+            game_ids = id_directory.extract_game_ids_from_file("scc2025100400.html")
+            log_directory = GameLogDirectory(os.path.join(save_dir, "logs"), url_config)
+            report = log_directory.download_and_install_many(game_ids[:5], rate=1000)
+            log_directory.parse(game_ids[0])
+            served = stand_in.counts["bytes"]
+    finally:
+        metrics.set_sink(previous)
+        metrics.logger.removeHandler(handler)
+        shutil.rmtree(save_dir)
+
+    counters = sink.counters
+    assert counters[metrics.REQUESTS] == 2 + len(game_ids[:5])
+    assert counters[metrics.BYTES_DOWNLOADED] == served
+    assert counters[metrics.BYTES_WRITTEN] > report.bytes
+    summary = sink.summary()
+    assert summary[metrics.REQUEST_LATENCY]["count"] == counters[metrics.REQUESTS]
+    assert summary[metrics.DECOMPRESS_TIME]["count"] == 2
+    assert summary[metrics.WRITE_TIME]["count"] == 2 + len(game_ids[:5])
+    assert summary[metrics.PARSE_TIME]["count"] == 1
+    assert summary[metrics.EXTRACT_TIME]["count"] == 1
+
+    # messages go to logger instead of stdout
+    assert any(message.startswith("Downloading: ") for message in handler.messages)
+    assert any(message.startswith("DownloadReport(") for message in handler.messages)
+
+    print("metrics tests passed")
@@ -0,0 +1,73 @@
+""" Profiling utilities tests
+Profile download, install and parse stages against local stand-in.
+"""
+
+
+import json
+import os
+import shutil
+import tempfile
+
+from TenhouAPI.game_id.manager import GameIdDirectory
+from TenhouAPI.game_log.manager import GameLogDirectory
+from TenhouAPI.testing import TenhouStandIn
+from TenhouAPI.util import metrics
+from TenhouAPI.util.metrics import InMemorySink, NullSink
+from TenhouAPI.util.profiling import Profiler
+
+
+if __name__ == '__main__':
+
+    save_dir = tempfile.mkdtemp()
+    sink = InMemorySink()
+    metrics.set_sink(sink)
+    try:
+        with TenhouStandIn(latency=0.01, games_per_hour=10) as stand_in:
+            url_config = stand_in.url_config()
+            id_directory = GameIdDirectory(os.path.join(save_dir, "ids"), url_config)
+            log_directory = GameLogDirectory(os.path.join(save_dir, "logs"), url_config)
+
+            with Profiler() as profiler:
+                file_name = id_directory.download_and_install(2025, 10, 4, 0, sleep_time=0.02)
+                game_ids = id_directory.extract_game_ids_from_file(file_name)
+                for game_id in game_ids[:3]:
+                    log_directory.download_and_install(game_id, sleep_time=0.02)
+                    log_directory.parse(game_id)
+                    continue
+            assert metrics.get_sink() is sink
+    finally:
+        metrics.set_sink(None)
+        shutil.rmtree(save_dir)
+
+    stats = profiler.stats()
+    stages = {(stage["stage"], stage["call_site"]): stage for stage in stats["stages"]}
+    id_site = "TenhouAPI.game_id.download:download_and_unzip_game_id_list"
+    log_site = "TenhouAPI.game_log.download:download_game_log"
+    assert stages[(metrics.REQUEST_LATENCY, id_site)]["calls"] == 1
+    assert stages[(metrics.REQUEST_LATENCY, log_site)]["calls"] == 3
+    assert stages[(metrics.SLEEP_TIME, log_site)]["wall"] >= 0.06
+    assert stages[(metrics.SLEEP_TIME, log_site)]["cpu"] < 0.03
+    assert (metrics.DECOMPRESS_TIME, id_site) in stages
+    assert stages[(metrics.WRITE_TIME, "TenhouAPI.game_log.download:save_game_log")]["calls"] == 3
+    assert stages[(metrics.PARSE_TIME, "TenhouAPI.game_log.parse:FileParser.__init__")]["calls"] == 3
+    assert (metrics.EXTRACT_TIME, "TenhouAPI.game_id.extract:extract_game_ids_from_file") in stages
+    assert stats["elapsed"] >= 0.08 and stats["counters"][metrics.REQUESTS] == 4
+
+    # metrics are passed to sink attached before
+    assert sink.counters[metrics.REQUESTS] == 4
+    assert len(sink.histograms[metrics.REQUEST_LATENCY]) == 4
+
+    # outputs
+    summary = profiler.summary()
+    assert "download.sleep" in summary and log_site in summary
+    dump_dir = tempfile.mkdtemp()
+    try:
+        profiler.dump(os.path.join(dump_dir, "profile.json"))
+        with open(os.path.join(dump_dir, "profile.json"), encoding="utf-8") as f:
+            assert json.load(f) == json.loads(json.dumps(stats))
+    finally:
+        shutil.rmtree(dump_dir)
+    assert isinstance(metrics.get_sink(), NullSink)
+
+    print(summary)
+    print("profiling tests passed")
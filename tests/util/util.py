@@ -2,15 +2,22 @@
 """
 
 
-from TenhouAPI.util.config import ConfigBase
+import pickle
+
+from TenhouAPI.util.config import ConfigBase, derived
 
 
 class Config(ConfigBase):
     """ Test config class """
 
+    __slots__ = ()
+
     test1: str = "test1"
     test2 = 2
 
+    @derived
+    def test3(self) -> str: return self.test1 * self.test2
+
     ...
 
 
@@ -20,5 +27,25 @@ if __name__ == "__main__":
 
     print(eval(repr(conf)))
 
-    ...
+    # class attributes stay defaults
+    assert Config.test1 == "test1" and conf.test3 == "test1test1"
+    assert not hasattr(conf, "__dict__")
+
+    # frozen
+    try:
+        conf.test1 = "test"
+        raise AssertionError("config is not frozen")
+    except AttributeError: ...
 
+    # overwrite and replace
+    other = Config(test2=3)
+    assert other.test3 == "test1test1test1" and conf.replace(test2=3) == other
+    assert conf == eval(repr(conf)) and hash(conf) == hash(Config())
+
+    # pickle
+    restored = pickle.loads(pickle.dumps(other))
+    assert restored == other and restored.test3 == other.test3
+
+    print("config tests passed")
+
+    ...
@@ -0,0 +1,82 @@
+""" Zip utilities tests
+"""
+
+
+import gzip
+import os
+import shutil
+import tempfile
+
+from TenhouAPI.util.directory_manager import TEMP_FILE_MODE
+from TenhouAPI.util.zip import Gzip, ZipBase
+
+
+class LegacyGzip(ZipBase):
+    """ Zip tool written before decompressor """
+
+    EXTENSION = ".gz"
+
+    @staticmethod
+    def add_extension(file_path: str, extension: str = EXTENSION) -> str:
+        return file_path + extension
+
+    @staticmethod
+    def remove_extension(file_path: str, extension: str = EXTENSION) -> str:
+        return file_path[:-len(extension)]
+
+    ...
+
+
+if __name__ == "__main__":
+
+    data = os.urandom(256) * 1000 + b"tail" * 50000
+    zipped = gzip.compress(data[:100000]) + gzip.compress(data[100000:])
+
+    save_dir = tempfile.mkdtemp()
+    try:
+        # chunks of concatenated members
+        chunks = [zipped[start:start + 1000] for start in range(0, len(zipped), 1000)]
+        assert b"".join(Gzip.iter_unzip(chunks)) == data
+
+        # bytes to file
+        result_path = os.path.join(save_dir, "scc2025100400.html")
+        assert Gzip.unzip_bytes(zipped, result_path) == len(data)
+        with open(result_path, "rb") as f:
+            assert f.read() == data
+        assert os.stat(result_path).st_mode & 0o777 == TEMP_FILE_MODE
+
+        # zipped file to file
+        zip_path = os.path.join(save_dir, "scc2025100401.html.gz")
+        with open(zip_path, "wb") as f:
+            f.write(zipped)
+        Gzip.unzip(zip_path, Gzip.remove_extension(zip_path))
+        with open(Gzip.remove_extension(zip_path), "rb") as f:
+            assert f.read() == data
+
+        # zip tool without decompressor
+        legacy_path = os.path.join(save_dir, "scc2025100402.html")
+        LegacyGzip.unzip(zip_path, legacy_path)
+        with open(legacy_path, "rb") as f:
+            assert f.read() == data
+        try:
+            list(LegacyGzip.iter_unzip([zipped]))
+            raise AssertionError("iter_unzip without decompressor must raise")
+        except NotImplementedError:
+            pass
+        assert isinstance(LegacyGzip(), ZipBase)
+        assert not LegacyGzip.STREAMING and Gzip.STREAMING
+
+        # truncated data leaves no file
+        try:
+            Gzip.unzip_bytes(zipped[:-10], os.path.join(save_dir, "broken.html"))
+            raise AssertionError("truncated data must raise")
+        except EOFError:
+            pass
+        assert sorted(os.listdir(save_dir)) == [
+            "scc2025100400.html", "scc2025100401.html", "scc2025100401.html.gz",
+            "scc2025100402.html",
+        ]
+    finally:
+        shutil.rmtree(save_dir)
+
+    print("zip tests passed")